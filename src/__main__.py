@@ -0,0 +1,33 @@
+import signal
+from argparse import ArgumentParser
+from ._daemon import IngestionDaemon
+from .settings import DAEMON
+
+# Definición de los argumentos de la línea de comandos
+parser = ArgumentParser(
+    description= 'Actualización continua de registros de asistencia desde los dispositivos.',
+)
+parser.add_argument('--jitter', type= float, default= DAEMON.JITTER, help= 'Fracción de variación al azar de cada espera.')
+parser.add_argument('--max-backoff', type= int, default= DAEMON.MAX_BACKOFF, help= 'Segundos máximos de espera tras fallas.')
+parser.add_argument('--once', action= 'store_true', help= 'Consulta una sola vez todos los dispositivos y termina.')
+parser.add_argument('--archive', action= 'store_true', help= 'Mueve los registros de años cerrados a sus archivos históricos y termina.')
+args = parser.parse_args()
+
+# Creación del proceso de actualización
+daemon = IngestionDaemon(
+    jitter= args.jitter,
+    max_backoff= args.max_backoff,
+)
+
+# Si se solicitó, sólo se archivan los años cerrados
+if args.archive:
+    daemon.archive()
+else:
+    # El proceso se detiene de forma ordenada al recibir la señal de terminación
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+
+    try:
+        # Ejecución continua de actualizaciones
+        daemon.run(1 if args.once else None)
+    except KeyboardInterrupt:
+        daemon.stop()
@@ -0,0 +1,288 @@
+import time
+from argparse import ArgumentParser
+from bisect import bisect_left
+from datetime import (
+    datetime,
+    timedelta,
+)
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import pandas as pd
+from .constants import (
+    COLUMN,
+    COMMON_ARGS,
+)
+from .contracts import _CoreRegistryProcessing
+from .modules import _Update
+from .pipes import PipeMethods
+from .services._attendance import _Attendance
+from .services._database import _Database
+from .settings import (
+    DATABASE,
+    SCHEDULER,
+)
+from .sql import (
+    execute_query,
+    get_value,
+    using_database,
+)
+from .templates.queries import QUERY
+from .tools import DeviceSimulator
+from .typing.misc import RecordsLastDates
+
+class _TimedDatabase(_Database):
+
+    def __init__(
+        self,
+    ) -> None:
+
+        # Inicialización de tiempos de escritura y momentos de confirmación
+        self.write_seconds = 0.0
+        self.commits: list[float] = []
+
+        super().__init__()
+
+    def save_records(
+        self,
+        records: pd.DataFrame,
+        last_dates: RecordsLastDates,
+    ) -> None:
+
+        # Se mide el tiempo de escritura en la base de datos
+        start = time.perf_counter()
+        super().save_records(records, last_dates)
+        end = time.perf_counter()
+
+        # Se acumula el tiempo y se registra el momento de confirmación
+        self.write_seconds += end - start
+        self.commits.append(end)
+
+class _BenchmarkServices:
+
+    def __init__(
+        self,
+        simulator: DeviceSimulator,
+    ) -> None:
+
+        # Servicios usados por el módulo de actualización
+        self.database = _TimedDatabase()
+        self.attendance = _Attendance(self.database.load_devices(), registry= simulator)
+
+class _BenchmarkHost(_CoreRegistryProcessing):
+
+    def __init__(
+        self,
+        simulator: DeviceSimulator,
+    ) -> None:
+
+        # Inicialización de servicios con el simulador de dispositivos
+        self._services = _BenchmarkServices(simulator)
+        # Inicialización de métodos tipo pipes usados al guardar registros
+        self._pipe_methods = PipeMethods(self)
+        # Inicialización de módulo de actualización de datos
+        self._update = _Update(self)
+
+def run_ingestion_benchmark(
+    device_counts: list[int] = [1, 2, 4, 8],
+    employees: int = 200,
+    days: int = 7,
+    latency: float = 0.2,
+    failure_rate: float = 0.0,
+    duplicate_rate: float = 0.05,
+    rate_limit: float = 0.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    ### Medición de actualización de registros
+    Ejecuta el módulo de actualización real contra dispositivos simulados, una vez
+    por cada cantidad de dispositivos y sobre una base de datos temporal, y mide el
+    desempeño de la descarga y el guardado de registros.
+
+    Columnas del resultado:
+    - `devices`: Cantidad de dispositivos.
+    - `rows`: Registros guardados.
+    - `seconds`: Duración de la actualización.
+    - `rows_per_second`: Registros guardados por segundo.
+    - `db_write_seconds`: Tiempo de escritura en la base de datos.
+    - `max_lag_seconds`: Tiempo máximo entre la entrega de registros por un
+    dispositivo y su confirmación en la base de datos.
+
+    :param device_counts list[int]: Cantidades de dispositivos a medir.
+    :param employees int: Cantidad de empleados repartidos entre los dispositivos.
+    :param days int: Días sin actualizar al iniciar cada medición.
+    :param latency float: Segundos promedio de respuesta de cada consulta.
+    :param failure_rate float: Probabilidad de que una consulta falle.
+    :param duplicate_rate float: Fracción de registros que se vuelven a entregar.
+    :param rate_limit float: Segundos mínimos entre peticiones a cada dispositivo.
+    :param seed int: Semilla de los valores aleatorios.
+    """
+
+    # Inicialización de resultados
+    results: list[dict[str, float]] = []
+
+    with TemporaryDirectory() as temporary_dir:
+        # Iteración por cada cantidad de dispositivos
+        for device_count in device_counts:
+            # Creación del simulador de dispositivos
+            simulator = DeviceSimulator(
+                devices= device_count,
+                employees= employees,
+                latency= latency,
+                failure_rate= failure_rate,
+                duplicate_rate= duplicate_rate,
+                seed= seed,
+            )
+            # Medición sobre una base de datos nueva
+            results.append(
+                _run_scenario(
+                    Path(temporary_dir).joinpath(f'benchmark_{device_count}.db'),
+                    simulator,
+                    days,
+                    rate_limit,
+                )
+            )
+
+    return pd.DataFrame(results)
+
+def _run_scenario(
+    db_file_path: Path,
+    simulator: DeviceSimulator,
+    days: int,
+    rate_limit: float,
+) -> dict[str, float]:
+
+    # La base de datos temporal se usa sólo durante la medición y después se restaura la anterior
+    with using_database( str(db_file_path) ):
+        # Creación de la base de datos temporal con el esquema vigente
+        _create_schema(simulator.devices, datetime.now() - timedelta(days= days), rate_limit)
+
+        # Creación de la instancia con los servicios conectados al simulador
+        host = _BenchmarkHost(simulator)
+
+        # Ejecución de la actualización
+        start = time.perf_counter()
+        host._update.update_records()
+        seconds = time.perf_counter() - start
+
+        # Obtención de los registros guardados
+        rows = get_value(
+            QUERY.COUNT_ROWS
+            .format(**{COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.ASSISTANCE_RECORDS})
+        )
+
+    # Tiempo de cada entrega de registros hasta la siguiente confirmación en la base de datos
+    commits = sorted(host._services.database.commits)
+    lags = [
+        commits[commit_i] - delivery
+        for delivery in simulator.deliveries
+        if ( commit_i := bisect_left(commits, delivery) ) < len(commits)
+    ]
+
+    return {
+        'devices': len(simulator.devices),
+        'rows': rows,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds,
+        'db_write_seconds': host._services.database.write_seconds,
+        'max_lag_seconds': max(lags, default= 0.0),
+    }
+
+def _create_schema(
+    devices: list[str],
+    last_date: datetime,
+    rate_limit: float,
+) -> None:
+
+    # Creación de las tablas de registros y de última hora de actualización, previas a las migraciones
+    execute_query(
+        QUERY.CREATE_RECORDS_TABLE
+        .format(**{COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.ASSISTANCE_RECORDS})
+    )
+    execute_query(
+        QUERY.CREATE_LAST_UPDATE_DATES_TABLE
+        .format(**{COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.LAST_UPDATE_DATES})
+    )
+
+    # Se aplican las migraciones para obtener el mismo esquema e índices que en producción
+    _Database()
+
+    # Se descartan los dispositivos registrados por las migraciones, ya que el simulador no los atiende
+    execute_query(
+        QUERY.DELETE_FILTERED
+        .format(
+            **{
+                COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.DEVICES,
+                COMMON_ARGS.CONDITIONS: 'TRUE',
+            }
+        )
+    )
+
+    # Registro de los dispositivos simulados
+    device_columns = [COLUMN.DEVICE, COLUMN.SERIAL_NUMBER, COLUMN.POLL_INTERVAL, COLUMN.RATE_LIMIT]
+    execute_query(
+        QUERY.INSERT_IGNORING_EXISTING
+        .format(
+            **{
+                COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.DEVICES,
+                COMMON_ARGS.COLUMNS: ', '.join(device_columns),
+                COMMON_ARGS.VALUES: ', '.join( f':{column}' for column in device_columns ),
+            }
+        ),
+        [
+            {
+                COLUMN.DEVICE: device_name,
+                COLUMN.SERIAL_NUMBER: device_name,
+                COLUMN.POLL_INTERVAL: SCHEDULER.DEFAULT_POLL_INTERVAL,
+                COLUMN.RATE_LIMIT: rate_limit,
+            }
+            for device_name in devices
+        ],
+    )
+
+    # Última hora de actualización inicial de cada dispositivo
+    execute_query(
+        QUERY.INSERT_IGNORING_EXISTING
+        .format(
+            **{
+                COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.LAST_UPDATE_DATES,
+                COMMON_ARGS.COLUMNS: 'name, date',
+                COMMON_ARGS.VALUES: f':{COMMON_ARGS.DEVICE_NAME}, :{COMMON_ARGS.DATE}',
+            }
+        ),
+        [
+            {
+                COMMON_ARGS.DEVICE_NAME: device_name,
+                COMMON_ARGS.DATE: str(last_date),
+            }
+            for device_name in devices
+        ],
+    )
+
+if __name__ == '__main__':
+
+    # Definición de los argumentos de la línea de comandos
+    parser = ArgumentParser(
+        description= 'Medición de la actualización de registros contra dispositivos simulados.',
+    )
+    parser.add_argument('--devices', type= int, nargs= '+', default= [1, 2, 4, 8], help= 'Cantidades de dispositivos a medir.')
+    parser.add_argument('--employees', type= int, default= 200, help= 'Cantidad de empleados.')
+    parser.add_argument('--days', type= int, default= 7, help= 'Días sin actualizar.')
+    parser.add_argument('--latency', type= float, default= 0.2, help= 'Segundos promedio de respuesta.')
+    parser.add_argument('--failure-rate', type= float, default= 0.0, help= 'Probabilidad de falla por consulta.')
+    parser.add_argument('--duplicate-rate', type= float, default= 0.05, help= 'Fracción de registros entregados de nuevo.')
+    parser.add_argument('--rate-limit', type= float, default= 0.0, help= 'Segundos mínimos entre peticiones a cada dispositivo.')
+    args = parser.parse_args()
+
+    # Ejecución e impresión de resultados
+    print(
+        run_ingestion_benchmark(
+            device_counts= args.devices,
+            employees= args.employees,
+            days= args.days,
+            latency= args.latency,
+            failure_rate= args.failure_rate,
+            duplicate_rate= args.duplicate_rate,
+            rate_limit= args.rate_limit,
+        )
+        .to_string(index= False)
+    )
@@ -0,0 +1,153 @@
+import random
+from datetime import datetime
+from threading import Event
+from .constants import COMMON_ARGS
+from .contracts import _CoreRegistryProcessing
+from .modules import _Update
+from .pipes import PipeMethods
+from .resources import PollingScheduler
+from .services import Services
+from .settings import DAEMON
+from .templates.messages import MESSAGE
+
+class IngestionDaemon(_CoreRegistryProcessing):
+
+    def __init__(
+        self,
+        jitter: float = DAEMON.JITTER,
+        max_backoff: int = DAEMON.MAX_BACKOFF,
+    ) -> None:
+
+        # Se guardan los parámetros de espera
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+
+        # Evento para detener el proceso entre actualizaciones
+        self._stop_event = Event()
+
+        # Inicialización de servicios
+        self._services = Services()
+        # Inicialización de métodos tipo pipes usados al guardar registros
+        self._pipe_methods = PipeMethods(self)
+        # Inicialización de módulo de actualización de datos
+        self._update = _Update(self)
+        # Programación de consultas de los dispositivos registrados según sus horarios
+        self._scheduler = PollingScheduler(
+            self._services.database.load_devices(),
+            self._services.database.load_schedules(),
+        )
+
+    def run(
+        self,
+        iterations: int | None = None,
+    ) -> None:
+        """
+        ### Ejecución continua
+        Este método actualiza los registros de los dispositivos cuya consulta está
+        pendiente según la programación adaptativa hasta que el proceso se detiene.
+        Cada espera varía al azar según la fracción de variación configurada y, tras
+        actualizaciones fallidas consecutivas, se duplica hasta la espera máxima.
+        Una actualización en la que ningún dispositivo pendiente respondió también
+        se considera fallida.
+
+        :param iterations int | None: Cantidad de actualizaciones a realizar, sin
+        contar las iteraciones sin dispositivos pendientes. Si es `None` el proceso
+        continúa hasta detenerse.
+        """
+
+        # Inicialización de contadores
+        completed = 0
+        failures = 0
+
+        # Se actualiza hasta que el proceso se detenga
+        while not self._stop_event.is_set():
+            # Obtención de los dispositivos cuya consulta está pendiente
+            due_devices = self._scheduler.get_due_devices( datetime.now() )
+
+            try:
+                # Actualización de registros con el mismo flujo de la clase principal
+                fetched_rows = self._update.update_records(due_devices) if due_devices else {}
+                # Se programa la siguiente consulta según los registros obtenidos de cada dispositivo
+                self._scheduler.record_polls(due_devices, fetched_rows, datetime.now())
+
+                # Si ningún dispositivo pendiente respondió, la actualización se considera fallida
+                if due_devices and not fetched_rows:
+                    failures += 1
+                    print(
+                        MESSAGE.NO_DEVICE_RESPONDED
+                        .format(**{COMMON_ARGS.SECONDS: round( self._get_delay(failures, False) )})
+                    )
+                # En caso contrario se reinicia el contador de fallas
+                else:
+                    failures = 0
+            # Si la actualización falló se reintenta con una espera mayor
+            except Exception as e:
+                failures += 1
+                # Los dispositivos se reprograman como consultas fallidas
+                self._scheduler.record_polls(due_devices, {}, datetime.now())
+                print(
+                    MESSAGE.UPDATE_FAILED
+                    .format(
+                        **{
+                            COMMON_ARGS.SECONDS: round( self._get_delay(failures, False) ),
+                            COMMON_ARGS.ERROR: repr(e),
+                        }
+                    )
+                )
+
+            # Sólo se cuentan las iteraciones en las que se consultó algún dispositivo
+            if due_devices:
+                completed += 1
+            # Si se alcanzó la cantidad de actualizaciones solicitada se termina
+            if iterations is not None and completed >= iterations:
+                return
+
+            # Espera hasta la siguiente actualización o hasta que el proceso se detenga
+            self._stop_event.wait( self._get_delay(failures) )
+
+    def archive(
+        self,
+    ) -> None:
+        """
+        ### Archivado de años cerrados
+        Este método mueve los registros de los años cerrados a sus archivos
+        históricos y recupera el espacio liberado en la base de datos principal. Es
+        un paso de mantenimiento explícito, ya que no se ejecuta al iniciar los
+        servicios.
+        """
+
+        # Se mueven los registros de años cerrados a sus archivos históricos
+        self._services.database.archive_closed_years()
+        # Se recupera el espacio liberado en la base de datos principal
+        self._services.database.compact()
+
+    def stop(
+        self,
+    ) -> None:
+        """
+        ### Detener ejecución
+        Este método detiene la ejecución continua al terminar la actualización en
+        curso o interrumpe la espera entre actualizaciones.
+        """
+
+        # Se activa el evento de detención
+        self._stop_event.set()
+
+    def _get_delay(
+        self,
+        failures: int,
+        with_jitter: bool = True,
+    ) -> float:
+
+        # Espera hasta la siguiente consulta programada
+        delay = self._scheduler.get_seconds_until_next_poll( datetime.now() )
+
+        # La espera se duplica con cada falla consecutiva sin exceder la espera máxima
+        if failures:
+            delay = max( delay, min(delay * 2 ** failures, self.max_backoff) )
+
+        # Se varía la espera al azar para no consultar los dispositivos siempre al mismo tiempo
+        if with_jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+
+        return delay
@@ -1,3 +1,8 @@
+from datetime import (
+    datetime,
+    timedelta,
+)
+from threading import Thread
 import pandas as pd
 from IPython.display import display
 from .constants import COLUMN
@@ -22,13 +27,26 @@ from .services import Services
 from .templates.messages import MESSAGE
 from .typing import ColumnAssignation
 from .typing.aliases import UserID
-from .typing.literals import NumericWeekday
+from .typing.literals import (
+    NumericWeekday,
+    SyncMode,
+)
 
 class RegistryProcessing(_CoreRegistryProcessing):
 
     def __init__(
         self,
+        sync: SyncMode = 'now',
     ) -> None:
+        """
+        ### Procesamiento de registros
+        Crea la instancia principal y carga los datos para procesamiento.
+
+        :param sync SyncMode: Modo de actualización de registros desde los
+        dispositivos: `'now'` actualiza antes de cargar los datos, `'skip'` no
+        actualiza y `'background'` actualiza en segundo plano mientras se cargan
+        los datos existentes.
+        """
 
         # Inicialización de submódulos de funciones
         self._pipes = _Pipes(self)
@@ -55,14 +73,13 @@ class RegistryProcessing(_CoreRegistryProcessing):
         # Inicialización de funciones de validación de datos
         self._validations = _Validations(self)
 
-        # Se cargan los datos iniciales
-        self._data.load()
-        # Revisión de integridad de los datos
-        self._to_verify = self._validations.check_integrity()
-        # Obtención de registros base para reporte
-        self._records_for_report = self._validations.records_for_report()
-        # Revisión de días con apertura tardía
-        self._check_late_open()
+        # Actualización de registros desde los dispositivos según el modo provisto
+        self._sync_thread: Thread | None = None
+        self._sync_error: Exception | None = None
+        self._sync(sync)
+
+        # Se cargan los datos iniciales y se realizan sus revisiones
+        self._load()
 
     def report(
         self,
@@ -86,6 +103,70 @@ class RegistryProcessing(_CoreRegistryProcessing):
         # Uso del servicio de conexión con Google Sheets para actualización
         self._services.google_sheets.update(self)
 
+    @property
+    def staleness(
+        self,
+    ) -> dict[str, timedelta]:
+        """
+        ### Antigüedad de los registros
+        Tiempo transcurrido desde la última actualización de cada dispositivo
+        incluida en los datos cargados. Las actualizaciones guardadas después de
+        la carga, como las de una actualización en segundo plano, no se reflejan
+        hasta que los datos se cargan de nuevo con `reload`.
+        """
+
+        # Obtención de la fecha y hora actual
+        now = datetime.now()
+
+        return {
+            device_name: now - last_date
+            for ( device_name, last_date ) in self._data.last_dates_loaded.items()
+        }
+
+    @property
+    def syncing(
+        self,
+    ) -> bool:
+        """
+        ### Actualización en curso
+        Indica si la actualización de registros en segundo plano sigue en curso.
+        """
+
+        return self._sync_thread is not None and self._sync_thread.is_alive()
+
+    def wait_for_sync(
+        self,
+        timeout: float | None = None,
+    ) -> None:
+        """
+        ### Espera de actualización
+        Este método espera a que termine la actualización de registros en segundo
+        plano. Si ésta falló se lanza el error ocurrido.
+
+        :param timeout float | None: Segundos máximos de espera.
+        """
+
+        # Si existe actualización en segundo plano se espera a ésta
+        if self._sync_thread is not None:
+            self._sync_thread.join(timeout)
+
+        # Si la actualización falló se lanza el error
+        if self._sync_error is not None:
+            raise self._sync_error
+
+    def reload(
+        self,
+    ) -> None:
+        """
+        ### Recarga de datos
+        Este método vuelve a cargar los datos y a realizar sus revisiones, por
+        ejemplo para incluir los registros guardados por una actualización en
+        segundo plano después de `wait_for_sync`.
+        """
+
+        # Se cargan los datos y se realizan sus revisiones
+        self._load()
+
     @property
     def to_verify(
         self,
@@ -134,6 +215,47 @@ class RegistryProcessing(_CoreRegistryProcessing):
 
         return self._report
 
+    def _load(
+        self,
+    ) -> None:
+
+        # Se cargan los datos
+        self._data.load()
+        # Revisión de integridad de los datos
+        self._to_verify = self._validations.check_integrity()
+        # Obtención de registros base para reporte
+        self._records_for_report = self._validations.records_for_report()
+        # Revisión de días con apertura tardía
+        self._check_late_open()
+
+    def _sync(
+        self,
+        sync: SyncMode,
+    ) -> None:
+
+        # Actualización antes de continuar con la carga de datos
+        if sync == 'now':
+            self._update.update_records()
+
+        # Actualización en segundo plano sobre los datos ya existentes
+        elif sync == 'background':
+            self._sync_thread = Thread(
+                target= self._update_in_background,
+                daemon= True,
+            )
+            self._sync_thread.start()
+
+    def _update_in_background(
+        self,
+    ) -> None:
+
+        try:
+            # Actualización de registros
+            self._update.update_records()
+        # El error se conserva para lanzarse al esperar la actualización
+        except Exception as e:
+            self._sync_error = e
+
     def _get_user_rest_days(
         self,
         user_id: UserID,
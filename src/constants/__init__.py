@@ -13,7 +13,6 @@ from ._main import (
     TIME_DELTA_ON_ZERO,
     VALIDATION,
     WAREHOUSE_NAME,
-    WAREHOUSES,
     WEEKDAY,
 )
 from ._pipeline import PIPE
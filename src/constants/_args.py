@@ -3,8 +3,22 @@ class COMMON_ARGS:
     """`Literal` Año."""
     MONTH = 'month'
     """`Literal` Mes."""
+    DATABASE_NAME = 'database_name'
+    """`Literal` Nombre de la base de datos."""
+    FILE_NAME = 'file_name'
+    """`Literal` Nombre de archivo sin extensión."""
+    SHEET_NAME = 'sheet_name'
+    """`Literal` Nombre de hoja de Excel."""
+    KEY = 'key'
+    """`Literal` Llave de contenido de un archivo."""
     TABLE_NAME = 'table_name'
     """`Literal` Nombre de la tabla en la base de datos."""
+    SOURCE_TABLE_NAME = 'source_table_name'
+    """`Literal` Nombre de la tabla de origen en la base de datos."""
+    SCHEMA = 'schema'
+    """`Literal` Alias de una base de datos adjunta."""
+    SELECTS = 'selects'
+    """`Literal` Consultas SELECT unidas."""
     REGISTRY_TIME = 'registry_time'
     """`Literal` Columna de fecha y hora de registro."""
     START_DATE = 'start_date'
@@ -15,6 +29,24 @@ class COMMON_ARGS:
     """`Literal` Fecha."""
     DEVICE_NAME = 'device_name'
     """`Literal` Nombre del dispositivo de asistencia."""
+    DEVICES = 'devices'
+    """`Literal` Nombres de dispositivos de asistencia."""
+    EXCLUDED_USERS = 'excluded_users'
+    """`Literal` IDs de usuario a descartar."""
+    INDEX_NAME = 'index_name'
+    """`Literal` Nombre del índice en la base de datos."""
+    COLUMNS = 'columns'
+    """`Literal` Columnas separadas por coma."""
+    VERSION = 'version'
+    """`Literal` Versión del esquema de la base de datos."""
+    VALUES = 'values'
+    """`Literal` Parámetros de valores separados por coma."""
+    CONDITIONS = 'conditions'
+    """`Literal` Condiciones de una cláusula WHERE."""
+    SECONDS = 'seconds'
+    """`Literal` Cantidad de segundos."""
+    ERROR = 'error'
+    """`Literal` Error ocurrido."""
     N = 'n'
     """`Literal` Secuencia."""
     VALIDATIONS_ATTRIBUTE = 'validations'
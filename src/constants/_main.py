@@ -12,6 +12,8 @@ class ENV_VARIABLE:
     """`Literal` Día en curso."""
     SELECTED_DATABASE = 'DATABASE'
     """`Literal` Base de datos a utilizar."""
+    IN_MEMORY_DATABASE = 'IN_MEMORY_DATABASE'
+    """`Literal` Lectura de la base de datos desde una copia en memoria (`1`)."""
     VISUALIZATIONS_SPREADSHEET = 'VISUALIZATIONS_SPREADSHEET'
     """
     `Literal` Archivo de Hojas de Cálculo donde se subirán las actualizaciones de
@@ -48,12 +50,20 @@ class COLUMN:
     """
     DEVICE = 'device'
     """
-    `category[str]` Dispositivo de registro.
+    `category[str]` Dispositivo de registro, según la tabla de dispositivos.
 
-    Valores disponibles:
+    Valores iniciales:
     - `'csl'`: Dispositivo de Cabo San Lucas.
     - `'sjc'`: Dispositivo de San José Del Cabo.
     """
+    SERIAL_NUMBER = 'serial_number'
+    """`str` Número de serie del dispositivo."""
+    POLL_INTERVAL = 'poll_interval'
+    """`uint32` Segundos base entre consultas al dispositivo."""
+    RATE_LIMIT = 'rate_limit'
+    """`float64` Segundos mínimos entre peticiones a la API del dispositivo."""
+    ACTIVE = 'active'
+    """`bool` El dispositivo se consulta en las actualizaciones."""
     PAY_FREQUENCY = 'pay_frequency'
     """`category[str]` Frecuencia de pago del empleado."""
     WAREHOUSE = 'warehouse'
@@ -287,14 +297,6 @@ class WAREHOUSE_NAME:
     SJC = 'SJC'
     """`Literal` Nombre de sucursal de San José Del Cabo."""
 
-WAREHOUSES = [
-    'csl',
-    'sjc',
-]
-"""
-`list[Literal]` Lista de nombres abreviados de almacenes.
-"""
-
 TIME_DELTA_ON_ZERO = timedelta()
 """
 `timedelta(00:00:00)` Valor de delta de tiempo en ceros.
@@ -4,17 +4,8 @@ class PIPE:
             GET_WAREHOUSE_NAME = 'get_warehouse_name'
             """
             ### Obtención de nombre de almacén
-            Este pipe procesa los datos retornados por la API de Odoo y extrae y renombra
-            el valor de almacén designado de los usuarios activos encontrados, desde un
-            valor de tipo *many2one*.
-
-            :param records DataFrame: Datos entrantes.
-            """
-            GET_JOB_NAME = 'get_job_name'
-            """
-            ### Obtención de nombre de puesto de trabajo
-            Este pipe procesa los datos retornados por la API de Odoo y extrae el nombre
-            del puesto de trabajo, desde un valor de tipo *many2one*.
+            Este pipe procesa los datos retornados por la API de Odoo y renombra el
+            almacén designado de los usuarios activos encontrados, desde su ID.
 
             :param records DataFrame: Datos entrantes.
             """
@@ -57,6 +48,22 @@ class PIPE:
         Esta función asigna los tipos de datos establecidos para las columnas de un
         DataFrame y ordena los tipos de registro en caso de existir la columna de éstos.
 
+        :param records DataFrame: Datos entrantes.
+        """
+        APPLY_RECORDS_FILTER = 'apply_records_filter'
+        """
+        ### Aplicación del filtro de registros
+        Este pipe aplica el filtro de registros usado en la carga de datos sobre las
+        columnas de ID de usuario, dispositivo y fecha que existan en el DataFrame.
+
+        :param records DataFrame: Datos entrantes.
+        """
+        APPLY_USERS_FILTER = 'apply_users_filter'
+        """
+        ### Aplicación del filtro de usuarios
+        Este pipe aplica los criterios de usuarios y dispositivos del filtro de registros
+        usado en la carga de datos, sin la ventana de fechas.
+
         :param records DataFrame: Datos entrantes.
         """
         GET_USER_NAMES = 'get_user_names'
@@ -1,10 +1,14 @@
+from datetime import datetime
 import pandas as pd
+from ..resources import _Interface_RecordsFilter
 
 class _Interface_Data:
     """
     `[Submódulo]` Acceso a objetos de datos en formato DataFrame.
     """
 
+    records_filter: _Interface_RecordsFilter
+    last_dates_loaded: dict[str, datetime]
     users: pd.DataFrame
     records: pd.DataFrame
     corrections: pd.DataFrame
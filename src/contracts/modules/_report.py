@@ -10,7 +10,8 @@ class _Interface_Report:
     ) -> None:
         """
         ### Generar reporte
-        Este método realiza la generación del reporte en Excel.
+        Este método realiza la generación del reporte en Excel. Cada hoja se
+        calcula justo antes de escribirse.
         """
         ...
 
@@ -2,4 +2,22 @@ class _Interface_Update:
     """
     `[Submódulo]` Módulo de actualización de datos.
     """
-    ...
+
+    def update_records(
+        self,
+        devices: list[str] | None = None,
+    ) -> dict[str, int]:
+        """
+        ### Actualización de registros
+        Este método descarga desde los dispositivos los registros posteriores a la
+        última fecha de actualización de cada uno y los guarda en la base de datos
+        junto con sus nuevas fechas de actualización.
+
+        Retorna la cantidad de registros obtenidos de cada dispositivo consultado
+        con éxito; los dispositivos que fallaron, excedieron el tiempo límite o no
+        tienen fecha de actualización registrada se omiten.
+
+        :param devices list[str] | None: Dispositivos a consultar. Si es `None` se
+        consultan todos los dispositivos registrados.
+        """
+        ...
@@ -1,3 +1,6 @@
 from ._data_to_save import _Contract_DataToSave
 from ._date_schema import _Interface_DateSchema
 from ._google_sheets_reports import _Contract_ReportsToUpload
+from ._records_filter import _Interface_RecordsFilter
+from ._query_cache import _Interface_QueryCache
+from ._polling_scheduler import _Interface_PollingScheduler
@@ -0,0 +1,74 @@
+from datetime import (
+    datetime,
+    timedelta,
+)
+
+class _Interface_PollingScheduler():
+
+    devices: list[str]
+    """Nombres de los dispositivos programados."""
+
+    def get_due_devices(
+        self,
+        now: datetime,
+    ) -> list[str]:
+        """
+        ### Dispositivos pendientes
+        Este método obtiene los dispositivos cuya siguiente consulta ya debe
+        realizarse.
+
+        :param now datetime: Fecha y hora actual.
+        """
+        ...
+
+    def record_polls(
+        self,
+        polled_devices: list[str],
+        fetched_rows: dict[str, int],
+        now: datetime,
+    ) -> None:
+        """
+        ### Registro de consultas
+        Este método programa la siguiente consulta de cada dispositivo consultado.
+        Los dispositivos se consultan con mayor frecuencia alrededor de los inicios y
+        fines de jornada, durante el horario de comida y mientras entreguen
+        registros nuevos; cada consulta consecutiva sin registros nuevos duplica su
+        espera hasta el múltiplo máximo, sin pasar del inicio del siguiente periodo
+        de mayor actividad. Los dispositivos que fallaron se reintentan tras su
+        intervalo base.
+
+        :param polled_devices list[str]: Dispositivos consultados.
+        :param fetched_rows dict[str, int]: Registros obtenidos por cada dispositivo
+        consultado con éxito.
+        :param now datetime: Fecha y hora de término de la consulta.
+        """
+        ...
+
+    def get_interval(
+        self,
+        device: str,
+        now: datetime,
+    ) -> timedelta:
+        """
+        ### Intervalo de consulta
+        Este método obtiene la espera hasta la siguiente consulta del dispositivo a
+        partir de su intervalo base, del periodo del día y de su actividad reciente.
+
+        :param device str: Nombre del dispositivo.
+        :param now datetime: Fecha y hora actual.
+        """
+        ...
+
+    def get_seconds_until_next_poll(
+        self,
+        now: datetime,
+    ) -> float:
+        """
+        ### Espera hasta la siguiente consulta
+        Este método obtiene los segundos restantes hasta la consulta más próxima de
+        cualquier dispositivo. Si no hay dispositivos activos se retorna el
+        intervalo de consulta por defecto.
+
+        :param now datetime: Fecha y hora actual.
+        """
+        ...
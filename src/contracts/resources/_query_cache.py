@@ -0,0 +1,54 @@
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+)
+import pandas as pd
+
+class _Interface_QueryCache():
+
+    max_bytes: int
+    """Memoria máxima en bytes ocupada por los resultados almacenados."""
+
+    used_bytes: int
+    """Memoria en bytes ocupada actualmente por los resultados almacenados."""
+
+    @staticmethod
+    def build_key(
+        query: str,
+        *args: Any,
+    ) -> Hashable:
+        """
+        ### Construcción de llave
+        Este método construye la llave de un resultado a partir del query normalizado
+        y de los argumentos de la consulta.
+
+        :param query str: Query a ejecutar.
+        :param args Any: Parámetros y opciones de lectura de la consulta.
+        """
+        ...
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        load_fn: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        ### Obtención de resultado
+        Este método retorna una copia del resultado almacenado para la llave provista
+        si la base de datos no ha cambiado desde su lectura. En caso contrario ejecuta
+        la función de carga y almacena su resultado.
+
+        :param key Hashable: Llave del resultado.
+        :param load_fn Callable: Función de carga del resultado.
+        """
+        ...
+
+    def clear(
+        self,
+    ) -> None:
+        """
+        ### Limpieza
+        Este método descarta todos los resultados almacenados.
+        """
+        ...
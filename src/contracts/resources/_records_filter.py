@@ -0,0 +1,50 @@
+from datetime import date
+from typing import Any
+import pandas as pd
+from ...typing.literals import Devices
+
+class _Interface_RecordsFilter():
+
+    excluded_users: tuple[int, ...]
+    """IDs de usuario a descartar."""
+
+    devices: tuple[Devices, ...] | None
+    """Dispositivos a conservar. Si es `None` se conservan todos."""
+
+    start_date: date | None
+    """Fecha inicial (inclusiva) de la ventana de fechas."""
+
+    end_date: date | None
+    """Fecha final (inclusiva) de la ventana de fechas."""
+
+    def within(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> '_Interface_RecordsFilter':
+        """
+        ### Filtro en ventana de fechas
+        Este método retorna un filtro nuevo con los mismos criterios y la ventana de
+        fechas provista.
+
+        :param start_date date: Fecha inicial (inclusiva).
+        :param end_date date: Fecha final (inclusiva).
+        """
+        ...
+
+    def where_clause(
+        self,
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        ### Cláusula WHERE
+        Este método construye las condiciones del filtro en SQL y los parámetros
+        asociados a éstas. Los parámetros con listas de valores deben declararse
+        como expandibles al compilar la sentencia.
+        """
+        ...
+
+    def __call__(
+        self,
+        data: pd.DataFrame,
+    ) -> pd.DataFrame:
+        ...
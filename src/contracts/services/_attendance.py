@@ -4,9 +4,23 @@ from ..resources import _Contract_DataToSave
 
 class _Contract_Attendance:
 
+    devices: list[str]
+    """Nombres de los dispositivos a consultar."""
+
     def get_warehouse_records_from_api(
         self,
         warehouse_name: str,
         last_date_saved: datetime,
+        end_date: datetime | None = None,
     ) -> DataTypeOrNone[_Contract_DataToSave]:
+        """
+        ### Obtención de registros de un almacén
+        Este método descarga desde la API los registros del dispositivo del almacén
+        entre la última fecha guardada y la fecha final provista, o la fecha y hora
+        actual si ésta no se provee, y los procesa para guardarse.
+
+        :param warehouse_name str: Nombre del almacén.
+        :param last_date_saved datetime: Fecha y hora inicial de la descarga.
+        :param end_date datetime | None: Fecha y hora final de la descarga.
+        """
         ...
@@ -1,20 +1,101 @@
-from datetime import (
-    date,
-    datetime,
+from datetime import datetime
+from typing import (
+    Any,
+    Iterator,
+    Literal,
 )
-from typing import Literal
 import pandas as pd
+from pandas._typing import AstypeArg
+from ..resources import _Interface_RecordsFilter
 from ...typing.callables import ConnFunction
 from ...typing.generics import _T
 from ...typing.misc import RecordsLastDates
 
 class _Contract_Database:
 
+    def migrate(
+        self,
+    ) -> None:
+        """
+        ### Migración de esquema
+        Este método aplica las versiones de esquema pendientes de la base de datos
+        y verifica que existan los índices esperados.
+        """
+        ...
+
+    def verify_indexes(
+        self,
+    ) -> None:
+        """
+        ### Verificación de índices
+        Este método crea los índices esperados que no existan en la base de datos.
+        """
+        ...
+
+    def archive_closed_years(
+        self,
+    ) -> None:
+        """
+        ### Archivado de años cerrados
+        Este método mueve los registros de asistencia de cada año cerrado, aquellos
+        anteriores al año de la última sincronización más antigua de los
+        dispositivos, a un archivo de SQLite propio de ese año. La base de datos
+        principal conserva únicamente el año en curso.
+
+        Las lecturas cuyo rango de fechas alcanza algún año archivado adjuntan los
+        archivos necesarios y leen los registros desde una vista que los une con la
+        base de datos principal.
+
+        Los registros de cada año se copian y se eliminan de la base de datos
+        principal en una misma transacción. El archivado no se ejecuta al iniciar
+        el servicio, por lo que debe solicitarse explícitamente. El espacio
+        liberado se recupera con `compact`.
+        """
+        ...
+
+    def compact(
+        self,
+    ) -> None:
+        """
+        ### Compactación de la base de datos
+        Este método recupera el espacio libre de la base de datos principal, como el
+        que queda después de archivar años cerrados. Reescribe el archivo completo,
+        por lo que no se ejecuta al iniciar y debe solicitarse explícitamente.
+        """
+        ...
+
     def load_assistance_records(
         self,
-        start_date: date,
-        end_date: date,
+        records_filter: _Interface_RecordsFilter,
     ) -> pd.DataFrame:
+        """
+        ### Carga de registros de asistencia
+        Este método carga desde la base de datos únicamente los registros que cumplen
+        con el filtro provisto, traduciendo éste en condiciones SQL. Los registros se
+        retornan con sus tipos de dato finales y tipos de registro ordenados.
+
+        Los meses cerrados, aquellos anteriores al mes de la última sincronización
+        más antigua de los dispositivos, se leen desde archivos Parquet en caché y
+        únicamente el periodo abierto se lee desde la base de datos.
+
+        :param records_filter RecordsFilter: Filtro de registros.
+        """
+        ...
+
+    def iter_assistance_records(
+        self,
+        records_filter: _Interface_RecordsFilter,
+        chunksize: int,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        ### Carga de registros de asistencia por bloques
+        Este método lee los registros que cumplen con el filtro provisto en bloques
+        de a lo más `chunksize` filas, cada uno con los mismos tipos de dato que en la
+        carga completa.
+
+        :param records_filter RecordsFilter: Filtro de registros.
+        :param chunksize int: Cantidad máxima de filas por bloque.
+        """
         ...
 
     def load_holidays(
@@ -32,10 +113,36 @@ class _Contract_Database:
     ) -> pd.DataFrame:
         ...
 
+    def load_devices(
+        self,
+    ) -> pd.DataFrame:
+        """
+        ### Carga de dispositivos
+        Este método carga los dispositivos activos de la tabla de dispositivos con
+        su número de serie, su intervalo base entre consultas y el tiempo mínimo
+        entre peticiones a su API. Para agregar una sucursal basta con insertar su
+        dispositivo en la tabla.
+        """
+        ...
+
     def load_data_from_query(
         self,
         query: str,
+        params: dict[str, Any] | None = None,
+        dtype: dict[str, AstypeArg] | None = None,
+        parse_dates: dict[str, Any] | None = None,
     ) -> pd.DataFrame:
+        """
+        ### Carga de datos desde query
+        Este método ejecuta el query provisto y retorna su resultado. Los resultados
+        se almacenan en una caché compartida, por lo que consultas idénticas no
+        vuelven a la base de datos mientras ésta no cambie.
+
+        :param query str: Query a ejecutar.
+        :param params dict: Parámetros del query.
+        :param dtype dict: Tipos de dato a asignar.
+        :param parse_dates dict: Columnas a interpretar como fecha.
+        """
         ...
 
     def save_in_database(
@@ -46,16 +153,30 @@ class _Contract_Database:
     ) -> None:
         ...
 
-    def get_records_last_date_saved(
+    def get_records_last_dates_saved(
         self,
-        warehouse_name: str,
-    ) -> datetime:
+    ) -> dict[str, datetime]:
+        """
+        ### Últimas fechas de actualización
+        Este método obtiene en una sola consulta la última fecha y hora de registro
+        guardada de cada dispositivo activo.
+        """
         ...
 
-    def update_last_update_dates(
+    def save_records(
         self,
-        max_dates: RecordsLastDates,
+        records: pd.DataFrame,
+        last_dates: RecordsLastDates,
     ) -> None:
+        """
+        ### Guardado de registros de asistencia
+        Este método inserta los registros provistos, descartando aquellos cuya ID ya
+        existe en la tabla, y actualiza las últimas fechas de actualización de los
+        dispositivos dentro de una misma transacción.
+
+        :param records DataFrame: Registros a insertar.
+        :param last_dates RecordsLastDates: Últimas fechas por dispositivo.
+        """
         ...
 
     def _execute_on_connection(
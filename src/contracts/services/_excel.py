@@ -1,8 +1,7 @@
+from datetime import date
+from typing import Iterable
 import pandas as pd
 
-class _Interface_DateSchemas:
-    ...
-
 class _Contract_Excel:
 
     def load_users_data(
@@ -12,8 +11,19 @@ class _Contract_Excel:
 
     def load_corrections_books(
         self,
-        schemas: _Interface_DateSchemas,
+        start_date: date,
+        end_date: date,
     ) -> pd.DataFrame:
+        """
+        ### Cargar correcciones de un rango de fechas
+        Este método carga los libros de correcciones de cada mes entre las fechas
+        provistas y retorna sus datos concatenados en orden de mes. Los libros sin
+        caché vigente se leen al mismo tiempo y los libros no encontrados se omiten
+        indicándolo. Si no se encuentra ningún libro del rango se lanza un error.
+
+        :param start_date date: Fecha inicial del rango.
+        :param end_date date: Fecha final del rango.
+        """
         ...
 
     def load_corrections_book(
@@ -24,6 +34,29 @@ class _Contract_Excel:
         """
         ### Cargar correcciones desde Excel
         Este método carga los datos de un Excel en base a los parámetros
-        proporcionados.
+        proporcionados. El libro sólo se lee si cambió desde su última lectura;
+        en caso contrario sus datos se obtienen de la caché local del equipo en
+        formato Parquet, identificada por el nombre, la fecha de modificación y el
+        tamaño del libro.
+        Si la caché está dañada el libro se vuelve a leer.
+        """
+        ...
+
+    def export_sheets(
+        self,
+        file_name: str,
+        sheets: Iterable[tuple[str, pd.DataFrame]],
+    ) -> None:
+        """
+        ### Exportar hojas a Excel
+        Este método escribe las hojas provistas en un libro de Excel en modo de
+        sólo escritura, por lo que cada hoja se escribe conforme se obtiene de las
+        hojas provistas y sus filas no se conservan en memoria. Las hojas que
+        exceden el máximo de filas se dividen en partes numeradas, los encabezados
+        conservan el formato de Pandas y los valores nulos se escriben como celdas
+        vacías.
+
+        :param file_name str: Nombre del archivo.
+        :param sheets Iterable[tuple[str, DataFrame]]: Nombre y datos de cada hoja.
         """
         ...
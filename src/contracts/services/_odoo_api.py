@@ -5,4 +5,11 @@ class _Contract_OdooAPI:
     def get_users(
         self,
     ) -> pd.DataFrame:
+        """
+        ### Obtención de empleados
+        Este método obtiene los empleados activos desde una copia local que se
+        actualiza únicamente con los empleados modificados en Odoo desde la última
+        sincronización. Si Odoo no responde dentro del tiempo límite de red se usa
+        la copia local sin actualizar; la primera carga obtiene todos los empleados.
+        """
         ...
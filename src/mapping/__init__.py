@@ -1,7 +1,11 @@
 from ._main import (
     ASSIGNED_DTYPES,
+    ASSISTANCE_RECORDS_COLUMNS,
+    ASSISTANCE_RECORDS_DTYPES,
     ATTENDANCE_JUSTIFICATIONS_REASSIGNATION_NAMES,
     COLUMN_LABELS,
+    CORRECTIONS_BOOK_DTYPES,
+    DATABASE_INDEXES,
     DAY_PERMISSIONS,
     LUNCH_REGISTRY_TYPES,
     ORDERED_REGISTRY_TYPE,
@@ -6,7 +6,7 @@ from ..constants import (
     VALIDATION,
     WAREHOUSE_NAME,
 )
-from ..settings import INPUT, DATA
+from ..settings import INPUT, DATA, DATABASE
 
 ASSIGNED_DTYPES: dict[str, AstypeArg] = {
     COLUMN.ID: 'string[python]',
@@ -55,6 +55,41 @@ ASSIGNED_DTYPES: dict[str, AstypeArg] = {
 `dict[str, AstypeArg]` Tipos de dato asignados a las columnas de DataFrames.
 """
 
+ASSISTANCE_RECORDS_COLUMNS = [
+    COLUMN.ID,
+    COLUMN.USER_ID,
+    COLUMN.NAME,
+    COLUMN.REGISTRY_TIME,
+    COLUMN.REGISTRY_TYPE,
+    COLUMN.DEVICE,
+]
+"""
+`list[Literal]` Columnas de la tabla de registros de asistencia.
+"""
+
+ASSISTANCE_RECORDS_DTYPES: dict[str, AstypeArg] = {
+    column: ASSIGNED_DTYPES[column]
+    for column in ASSISTANCE_RECORDS_COLUMNS
+    if column != COLUMN.REGISTRY_TIME
+}
+"""
+`dict[str, AstypeArg]` Tipos de datos asignados al leer la tabla de registros de
+asistencia. La columna de fecha y hora de registro se interpreta como fecha.
+"""
+
+CORRECTIONS_BOOK_DTYPES: dict[str, AstypeArg] = {
+    COLUMN.USER_ID: 'Int64',
+    COLUMN.NAME: 'string[python]',
+    COLUMN.DATE: 'datetime64[ns]',
+    COLUMN.TIME: 'string[python]',
+    COLUMN.REGISTRY_TYPE: 'string[python]',
+    COLUMN.DEVICE: 'string[python]',
+}
+"""
+`dict[str, AstypeArg]` Tipos de datos de las columnas de los libros de correcciones
+al guardarse en caché. Las demás columnas de texto se guardan como cadenas.
+"""
+
 ORDERED_REGISTRY_TYPE = [
     REGISTRY_TYPE.NULL,
     REGISTRY_TYPE.UNDEFINED,
@@ -138,6 +173,25 @@ WAREHOUSE_RENAME = {
 Mapa de reasignación de nombres de almacenes provenientes de Odoo.
 """
 
+DATABASE_INDEXES: dict[str, tuple[str, list[str]]] = {
+    DATABASE.INDEX.RECORDS_REGISTRY_TIME: (
+        DATABASE.TABLE.ASSISTANCE_RECORDS,
+        [COLUMN.REGISTRY_TIME],
+    ),
+    DATABASE.INDEX.RECORDS_USER_REGISTRY_TIME: (
+        DATABASE.TABLE.ASSISTANCE_RECORDS,
+        [COLUMN.USER_ID, COLUMN.REGISTRY_TIME],
+    ),
+    DATABASE.INDEX.LAST_UPDATE_DATES_NAME: (
+        DATABASE.TABLE.LAST_UPDATE_DATES,
+        ['name'],
+    ),
+}
+"""
+`dict[str, tuple[str, list[str]]]` Índices esperados en la base de datos por
+nombre, con su tabla y columnas indexadas.
+"""
+
 USERS_DATA_REASSIGNATION_NAMES = {
     INPUT.FORM.USERS_DATA.COLUMN.USER_ID: COLUMN.USER_ID,
     INPUT.FORM.USERS_DATA.COLUMN.HIRE_DATE: COLUMN.HIRE_DATE,
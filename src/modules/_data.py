@@ -4,7 +4,11 @@ from ..contracts import (
     _Interface_Data,
 )
 from ..core import pipeline_hub
-from ..rules import PIPELINE
+from ..rules import (
+    GLOBAL_FILTERS,
+    PIPELINE,
+)
+from ..settings import DATABASE
 
 class _Data(_Interface_Data):
 
@@ -20,6 +24,16 @@ class _Data(_Interface_Data):
         self,
     ) -> None:
 
+        # Filtro de registros aplicado en la carga de los datos
+        self.records_filter = GLOBAL_FILTERS.within(
+            self._main._schemas.min_date(),
+            self._main._services.date.today,
+        )
+
+        # Se conservan las últimas fechas de actualización de los dispositivos previas a la
+        # lectura de los registros, ya que éstos abarcan al menos hasta dichas fechas
+        self.last_dates_loaded = self._main._services.database.get_records_last_dates_saved()
+
         # Carga de datos
         self.users = self._load_users()
         self.records = self._load_records()
@@ -48,13 +62,26 @@ class _Data(_Interface_Data):
         self,
     ) -> pd.DataFrame:
 
-        # Obtención de los datos desde la tabla de la base de datos
-        records = self._main._services.database.load_assistance_records(
-            self._main._schemas.min_date(),
-            self._main._services.date.today,
-        )
-        # Procesamiento por medio de pipe
-        processed_data = pipeline_hub.run_pipe_flow(records, PIPELINE.GET_RECORDS)
+        # Si se especificó un tamaño de bloque...
+        if DATABASE.RECORDS_CHUNK_SIZE:
+            # Lectura de los datos por bloques desde la tabla de la base de datos
+            chunks = self._main._services.database.iter_assistance_records(
+                self.records_filter,
+                DATABASE.RECORDS_CHUNK_SIZE,
+            )
+            # Procesamiento de cada bloque por medio de pipe y unificación de tipos de dato
+            processed_data = pipeline_hub.run_pipe_flow_in_chunks(
+                chunks,
+                PIPELINE.GET_RECORDS,
+                PIPELINE.CONCAT_RECORDS_CHUNKS,
+            )
+
+        # Si no se especificó un tamaño de bloque...
+        else:
+            # Obtención de los datos desde la tabla de la base de datos
+            records = self._main._services.database.load_assistance_records(self.records_filter)
+            # Procesamiento por medio de pipe
+            processed_data = pipeline_hub.run_pipe_flow(records, PIPELINE.GET_RECORDS)
 
         return processed_data
 
@@ -120,22 +147,14 @@ class _Data(_Interface_Data):
     ) -> pd.DataFrame:
         """
         ### Cargar archivos de correcciones
-        Este método se encarga de evaluar si se requiere cargar uno o dos libros de
-        datos de diferentes meses en base a los datos de los esquemas y carga los
-        libros en DataFrames que retorna concatenados.
+        Este método carga los libros de correcciones de cada mes comprendido por
+        los esquemas de fechas y los retorna concatenados.
         """
 
-        # Si el mes de inicio es distinto al mes de fin...
-        if self._main._schemas.cross_months:
-            # Obtención de correcciones desde más de un libro de Excel
-            corrections = self._main._services.excel.load_corrections_books(self._main._schemas)
-
-        # Si el mes de inicio es igual al mes de fin...
-        else:
-            # Carga del archivo
-            corrections = self._main._services.excel.load_corrections_book(
-                self._main._services.date.current_year,
-                self._main._services.date.current_month,
-            )
+        # Obtención de correcciones de todos los meses de los esquemas
+        corrections = self._main._services.excel.load_corrections_books(
+            self._main._schemas.min_date(),
+            self._main._schemas.max_date(),
+        )
 
         return corrections
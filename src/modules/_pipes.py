@@ -10,6 +10,7 @@ from ..contracts import (
     _Interface_Pipes,
 )
 from ..mapping import (
+    ASSIGNED_DTYPES,
     LUNCH_REGISTRY_TYPES,
     ORDERED_REGISTRY_TYPE,
     PERMISSION_TYPE_REASSIGNATION_NAMES,
@@ -390,6 +391,6 @@ class _Pipes(_Interface_Pipes):
                     COLUMN.USER_AND_DATE_INDEX: user_id_column_str + '|' + date_column_str
                 }
             )
-            # Asignación de tipos de datos
-            .pipe(self._main._processing.assign_dtypes)
+            # Asignación de tipo de dato únicamente a la columna creada
+            .astype({COLUMN.USER_AND_DATE_INDEX: ASSIGNED_DTYPES[COLUMN.USER_AND_DATE_INDEX]})
         )
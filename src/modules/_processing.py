@@ -1,12 +1,15 @@
 from datetime import timedelta
 import pandas as pd
-from ..constants import COLUMN
+from ..constants import (
+    COLUMN,
+    PIPE,
+)
 from ..contracts import (
     _CoreRegistryProcessing,
     _Interface_Processing,
 )
+from ..core import pipeline_hub
 from ..mapping import (
-    ASSIGNED_DTYPES,
     DAY_PERMISSIONS,
     ORDERED_REGISTRY_TYPE,
     TIME_PERMISSIONS,
@@ -34,74 +37,8 @@ class _Processing(_Interface_Processing):
         data: pd.DataFrame,
     ) -> pd.DataFrame:
 
-        # Generación del mapa de tipos de datos
-        existing_dtypes = {
-            column: dtype
-            for ( column, dtype )
-            in ASSIGNED_DTYPES.items()
-            if column in data.columns
-        }
-
-        # Función para ordenar tipos de registro si es que la columna existe
-        def reorder_registry_types(df: pd.DataFrame) -> pd.DataFrame:
-            # Si existe columna de tipos de registro en el DataFrame...
-            if COLUMN.REGISTRY_TYPE in df.columns:
-                return (
-                    df
-                    # Asignación de ordenamiento de valores de tipo de registro
-                    .pipe(self.assign_ordered_registry_type)
-                )
-            # Si no existe columna de tipos de registro en el DataFrame...
-            else:
-                return df
-
-        # Función para ordenar días numéricos de la semana
-        def reorder_weekdays(df: pd.DataFrame) -> pd.DataFrame:
-            # Si existe columna de tipos de registro en el DataFrame...
-            if COLUMN.WEEKDAY in df.columns:
-
-                # Creación de función para obtener los días de la semana existentes en los valores
-                def existing_weekdays(s: pd.Series) -> list[int]:
-                    # Obtención de los valores únicos de días de la semana
-                    unique_days = s.unique()
-                    # Generación de las categorías ordenadas en base a los datos existentes
-                    filtered_days = [wd for wd in range(7) if wd in unique_days]
-
-                    return filtered_days
-
-                # Función para ordernar los valores categóricos
-                reorder_categoric_values: dict[str, DataFramePipe] = {
-                    COLUMN.WEEKDAY: (
-                        lambda df: (
-                            df[COLUMN.WEEKDAY]
-                            .astype('category')
-                            # Ordenamiento de categorías
-                            .cat.reorder_categories(
-                                existing_weekdays(df[COLUMN.WEEKDAY]),
-                                ordered= True,
-                            )
-                        )
-                    )
-                }
-
-                return (
-                    df
-                    .assign(**reorder_categoric_values)
-                )
-
-            # Si no existe columna de tipos de registro en el DataFrame...
-            else:
-                return df
-
-        return (
-            data
-            # Reasignación de tipos de dato
-            .astype(existing_dtypes)
-            # Reordenamiento de tipos de registro si es que existen
-            .pipe(reorder_registry_types)
-            # Reordenamiento de días numéricos de la semana si es que existen
-            .pipe(reorder_weekdays)
-        )
+        # Ejecución del pipe de asignación de tipos de datos
+        return pipeline_hub.run_pipe_flow(data, [PIPE.PROCESSING.ASSIGN_DTYPES])
 
     def assign_ordered_registry_type(
         self,
@@ -48,33 +48,28 @@ class _Report(_Interface_Report):
         # Construcción del nombre del archivo de Excel
         file_name = f'{string_date}_{REPORT.SUMMARY.NAME}.xlsx'
 
-        # Reportes a exportar
-        reports_to_export: dict[str, pd.DataFrame] = {
+        # Funciones de cálculo de los reportes a exportar
+        reports_to_export: dict[str, Callable[[], pd.DataFrame]] = {
             # Usuarios
-            REPORT.SUMMARY.SHEET.USERS: self._main._data.users,
+            REPORT.SUMMARY.SHEET.USERS: lambda: self._main._data.users,
             # Datos completos verificados
-            REPORT.SUMMARY.SHEET.COMPLETE: self.complete_general_summary(),
+            REPORT.SUMMARY.SHEET.COMPLETE: self.complete_general_summary,
             # Historial de incidencias
-            REPORT.SUMMARY.SHEET.MONTHLY_JUSTIFICATIONS: self._main._data.justifications,
+            REPORT.SUMMARY.SHEET.MONTHLY_JUSTIFICATIONS: lambda: self._main._data.justifications,
             # Resumen de acumulados
-            REPORT.SUMMARY.SHEET.CUMMULATED_SUMMARY: self.lunch_summary(),
+            REPORT.SUMMARY.SHEET.CUMMULATED_SUMMARY: self.lunch_summary,
             # Incidencias
-            REPORT.SUMMARY.SHEET.JUSTIFICATIONS: self.justfications_summmary(),
+            REPORT.SUMMARY.SHEET.JUSTIFICATIONS: self.justfications_summmary,
         }
 
-        # Inicio de generación del archivo
-        with pd.ExcelWriter(file_name, engine='openpyxl') as writer:
-            # Iteración por cada reporte a exportar
-            for ( sheet_name, report ) in reports_to_export.items():
-                # Exportación de reporte
-                (
-                    report
-                    .to_excel(
-                        writer,
-                        sheet_name= sheet_name,
-                        index= False,
-                    )
-                )
+        # Cada reporte se calcula justo antes de escribirse y se libera después de escribirse
+        sheets = (
+            ( sheet_name, report_fn() )
+            for ( sheet_name, report_fn ) in reports_to_export.items()
+        )
+
+        # Generación del archivo
+        self._main._services.excel.export_sheets(file_name, sheets)
 
     def complete_general_summary(
         self,
@@ -1,15 +1,25 @@
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from datetime import datetime
+import time
 import pandas as pd
 from ..constants import (
     COLUMN,
-    WAREHOUSES,
+    COMMON_ARGS,
 )
 from ..contracts import (
     _CoreRegistryProcessing,
     _Interface_Update,
 )
 from ..core import pipeline_hub
+from ..resources import DataToSave
 from ..rules import PIPELINE
-from ..settings import DATABASE
+from ..settings import UPDATE
+from ..templates.messages import MESSAGE
+from ..typing import DataTypeOrNone
 from ..typing.misc import RecordsLastDates
 
 class _Update(_Interface_Update):
@@ -22,37 +32,133 @@ class _Update(_Interface_Update):
         # Asignación de instancia principal
         self._main = main
 
-        # Actualización de registros
-        self._update_records()
+    def update_records(
+        self,
+        devices: list[str] | None = None,
+    ) -> dict[str, int]:
+
+        # Inicialización de cantidad de registros obtenidos por dispositivo consultado
+        fetched_rows: dict[str, int] = {}
+
+        # Obtención de las últimas fechas de actualización de todos los almacenes
+        last_dates_saved = self._main._services.database.get_records_last_dates_saved()
+        # Fecha y hora final de la actualización
+        end_date = datetime.now()
+
+        # Inicialización de los almacenes a consultar en una sola descarga
+        warehouses_to_update: dict[str, datetime] = {}
+        # Inicialización de los almacenes a descargar por ventanas
+        warehouses_to_backfill: dict[str, datetime] = {}
+
+        # Iteración por cada almacén solicitado o por todos los registrados
+        for warehouse_i in devices or self._main._services.attendance.devices:
+            # Obtención del valor de última fecha de actualización
+            last_date_saved = last_dates_saved.get(warehouse_i)
+
+            # Los almacenes sin fecha de actualización, como los inactivos, se omiten
+            if last_date_saved is None:
+                print(
+                    MESSAGE.DEVICE_WITHOUT_LAST_UPDATE_DATE
+                    .format(**{COMMON_ARGS.DEVICE_NAME: warehouse_i})
+                )
+            # Los almacenes con periodos largos sin actualizar se descargan y guardan por ventanas
+            elif end_date - last_date_saved > UPDATE.BACKFILL_THRESHOLD:
+                warehouses_to_backfill[warehouse_i] = last_date_saved
+            # Los demás almacenes se consultan en una sola descarga
+            else:
+                warehouses_to_update[warehouse_i] = last_date_saved
+
+        # Si no hay almacenes por consultar no se crean hilos
+        if not warehouses_to_update and not warehouses_to_backfill:
+            return fetched_rows
+
+        # Todas las consultas se realizan en un mismo conjunto acotado de hilos
+        executor = ThreadPoolExecutor(max_workers= UPDATE.MAX_WORKERS)
+
+        try:
+            # Todos los almacenes de una sola descarga comparten el tiempo límite desde que
+            # se inicia su consulta
+            deadline = time.monotonic() + UPDATE.DEVICE_TIMEOUT
+            # Se inicia la obtención de los datos de cada almacén, antes que las ventanas para
+            # que éstas no los retrasen
+            futures = {
+                warehouse_i: executor.submit(
+                    self._main._services.attendance.get_warehouse_records_from_api,
+                    warehouse_i,
+                    last_date_saved,
+                    end_date,
+                )
+                for ( warehouse_i, last_date_saved ) in warehouses_to_update.items()
+            }
+            # Se inicia la obtención de los datos de cada ventana de los almacenes a descargar
+            # por ventanas
+            windows_futures = {
+                warehouse_i: [
+                    executor.submit(
+                        self._main._services.attendance.get_warehouse_records_from_api,
+                        warehouse_i,
+                        window_start,
+                        window_end,
+                    )
+                    for ( window_start, window_end ) in self._get_backfill_windows(last_date_saved, end_date)
+                ]
+                for ( warehouse_i, last_date_saved ) in warehouses_to_backfill.items()
+            }
+
+            # Se guardan los datos de los almacenes consultados en una sola descarga
+            fetched_rows.update( self._save_warehouses_records(futures, deadline) )
+
+            # Se guardan las ventanas de cada almacén a descargar por ventanas
+            for ( warehouse_i, window_futures ) in windows_futures.items():
+                rows = self._save_backfill_windows(warehouse_i, window_futures)
+                # Sólo se reportan los almacenes cuyo periodo se descargó completo
+                if rows is not None:
+                    fetched_rows[warehouse_i] = rows
+
+        finally:
+            # No se espera a los dispositivos que excedieron el tiempo límite
+            executor.shutdown(wait= False, cancel_futures= True)
+
+        return fetched_rows
 
-    def _update_records(
+    def _save_warehouses_records(
         self,
-    ) -> None:
+        futures: dict[str, Future[DataTypeOrNone[DataToSave]]],
+        deadline: float,
+    ) -> dict[str, int]:
 
         # Inicialización de lista de datos a guardar en la base de datos
         all_data: list[pd.DataFrame] = []
         # Valores de fechas a actualizar
         date_values_to_update: RecordsLastDates = []
+        # Inicialización de cantidad de registros obtenidos por almacén consultado con éxito
+        fetched_rows: dict[str, int] = {}
 
-        # Iteración por cada almacén
-        for warehouse_i in WAREHOUSES:
-            # Obtención del valor de última fecha de actualización
-            last_date_saved = self._main._services.database.get_records_last_date_saved(warehouse_i)
+        # Espera de los datos de todos los almacenes hasta el tiempo límite
+        wait( futures.values(), timeout= max(deadline - time.monotonic(), 0) )
 
-            # Obtención de los datos obtenidos desde la API
-            data_to_save = self._main._services.attendance.get_warehouse_records_from_api(
-                warehouse_i,
-                last_date_saved,
-            )
+        # Iteración por cada almacén en el orden original
+        for ( warehouse_i, future ) in futures.items():
+            # Obtención de los datos del almacén
+            ( succeeded, data_to_save ) = self._get_records(warehouse_i, future)
 
-            # Si existen datos a guardar...
-            if data_to_save:
-                # Se añade el DataFrame de datos
-                all_data.append(data_to_save.data)
-                # Se añade la fecha a actualizar en el registro de almacén
-                date_values_to_update.append(
-                    (data_to_save.warehouse_name, data_to_save.max_found_datetime)
-                )
+            # Si la consulta falló no se reporta el almacén
+            if not succeeded:
+                continue
+
+            # Se registra la cantidad de registros obtenidos
+            fetched_rows[warehouse_i] = len(data_to_save.data) if data_to_save else 0
+
+            # Si no se obtuvieron registros no hay nada que guardar
+            if not data_to_save:
+                continue
+
+            # Se añade el DataFrame de datos
+            all_data.append(data_to_save.data)
+            # Se añade la fecha a actualizar en el registro de almacén
+            date_values_to_update.append(
+                (data_to_save.warehouse_name, data_to_save.max_found_datetime)
+            )
 
         # Si existen datos a guardar en la base de datos...
         if all_data:
@@ -64,30 +170,121 @@ class _Update(_Interface_Update):
                 .sort_values(COLUMN.REGISTRY_TIME)
             )
 
-            # Se guardan los datos en la base de datos
-            self._save_on_database(all_data_to_save)
-            # Actualización de fechas guardadas
-            self._main._services.database.update_last_update_dates(date_values_to_update)
+            # Se guardan los datos y las fechas de actualización en la base de datos
+            self._save_on_database(all_data_to_save, date_values_to_update)
+
+        return fetched_rows
+
+    def _get_backfill_windows(
+        self,
+        last_date_saved: datetime,
+        end_date: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+
+        # División del periodo sin actualizar en ventanas de duración fija
+        windows: list[tuple[datetime, datetime]] = []
+        window_start = last_date_saved
+        while window_start < end_date:
+            window_end = min(window_start + UPDATE.BACKFILL_WINDOW, end_date)
+            windows.append( (window_start, window_end) )
+            window_start = window_end
+
+        return windows
+
+    def _save_backfill_windows(
+        self,
+        warehouse_name: str,
+        futures: list[Future[DataTypeOrNone[DataToSave]]],
+    ) -> int | None:
+
+        # Inicialización de cantidad de registros obtenidos
+        rows = 0
+
+        # El tiempo límite se cuenta desde el inicio del guardado o desde la última ventana recibida
+        deadline = time.monotonic() + UPDATE.DEVICE_TIMEOUT
+
+        # Las ventanas se guardan en orden para que la fecha de actualización sólo avance
+        # sobre periodos completos
+        for ( window_i, future ) in enumerate(futures):
+            # Espera de los datos de la ventana hasta el tiempo límite
+            wait( [future], timeout= max(deadline - time.monotonic(), 0) )
+            # Obtención de los datos de la ventana
+            ( succeeded, data_to_save ) = self._get_records(warehouse_name, future)
+
+            # Si la ventana falló la descarga se reanudará desde la última ventana guardada
+            if not succeeded:
+                # Las ventanas pendientes se cancelan para liberar los hilos
+                for pending_future in futures[window_i + 1:]:
+                    pending_future.cancel()
+                return None
+
+            # El dispositivo respondió, por lo que se reinicia su tiempo límite
+            deadline = time.monotonic() + UPDATE.DEVICE_TIMEOUT
+
+            # Si existen datos se guardan junto con la fecha de actualización del almacén
+            if data_to_save:
+                rows += len(data_to_save.data)
+                self._save_on_database(
+                    data_to_save.data.sort_values(COLUMN.REGISTRY_TIME),
+                    [ (data_to_save.warehouse_name, data_to_save.max_found_datetime) ],
+                )
+
+        return rows
+
+    def _get_records(
+        self,
+        warehouse_name: str,
+        future: Future[DataTypeOrNone[DataToSave]],
+    ) -> tuple[bool, DataTypeOrNone[DataToSave]]:
+
+        # Si el dispositivo no respondió a tiempo se omite sin avanzar su fecha de actualización
+        if not future.done():
+            print(
+                MESSAGE.DEVICE_TIMEOUT
+                .format(
+                    **{
+                        COMMON_ARGS.DEVICE_NAME: warehouse_name,
+                        COMMON_ARGS.SECONDS: UPDATE.DEVICE_TIMEOUT,
+                    }
+                )
+            )
+            return ( False, None )
+
+        try:
+            # Obtención de los datos del almacén
+            data_to_save = future.result()
+        # Si la consulta falló se omite el almacén para no descartar los demás
+        except Exception as e:
+            print(
+                MESSAGE.DEVICE_FAILED
+                .format(
+                    **{
+                        COMMON_ARGS.DEVICE_NAME: warehouse_name,
+                        COMMON_ARGS.ERROR: repr(e),
+                    }
+                )
+            )
+            return ( False, None )
+
+        return ( True, data_to_save )
 
     def _save_on_database(
         self,
         data: pd.DataFrame,
+        last_dates: RecordsLastDates,
     ) -> None:
 
         # Procesamiento de los datos para ser guardados
         data_to_save = pipeline_hub.run_pipe_flow(data, PIPELINE.UPDATE_DATABASE)
 
         # Se guardan los datos en la tabla de la base de datos local
-        self._save_records(data_to_save)
+        self._save_records(data_to_save, last_dates)
 
     def _save_records(
         self,
         records: pd.DataFrame,
+        last_dates: RecordsLastDates,
     ) -> None:
 
-        # Se guardan los registros en la base de datos
-        self._main._services.database.save_in_database(
-            records,
-            DATABASE.TABLE.ASSISTANCE_RECORDS,
-            'append',
-        )
+        # Se guardan los registros nuevos y las fechas de actualización en una misma transacción
+        self._main._services.database.save_records(records, last_dates)
@@ -10,7 +10,6 @@ from ..contracts import (
 )
 from ..core import pipeline_hub
 from ..rules import (
-    GLOBAL_FILTERS,
     PIPELINE,
     VALIDATIONS_PER_DAY_AND_USER_ID,
 )
@@ -142,8 +141,6 @@ class _Validations(_Interface_Validations):
                 .pipe(validations_union)
                 # Se filtra el DataFrame únicamente por los datos especificados
                 .pipe(filter_records)
-                # Filtros globales
-                .pipe(GLOBAL_FILTERS)
             )
 
         return evaluate_pivot_validations
@@ -1,10 +1,11 @@
 import pandas as pd
 import numpy as np
-from datetime import (
-    date,
-    timedelta,
+from datetime import date
+from typing import (
+    Callable,
+    Iterable,
+    Optional,
 )
-from typing import Callable
 from attendance_registry._constants import COLUMN as ATTENDANCE_COLUMN
 from ..constants import (
     COLUMN,
@@ -26,6 +27,7 @@ from ..mapping import (
     USERS_DATA_REASSIGNATION_NAMES,
     WAREHOUSE_RENAME,
 )
+from ..resources import RecordsFilter
 from ..rules import (
     INITIAL_DATE_FOR_HOLIDAYS,
     VALIDATIONS_PER_DAY_AND_USER_ID,
@@ -38,10 +40,8 @@ from ..typing.callables import (
     SeriesApply,
     SeriesFromDataFrame,
 )
-from ..typing.interfaces import (
-    HorizontalSeries,
-    Many2One,
-)
+from ..typing.interfaces import HorizontalSeries
+from ..utils import build_record_ids
 
 class _BasePipeMethods():
     _main: _CoreRegistryProcessing
@@ -80,30 +80,23 @@ class PipeMethods(_Contract_PipeMethods, _BasePipeMethods):
         ) -> pd.DataFrame:
             """
             ### Obtención de nombre de almacén
-            Este pipe procesa los datos retornados por la API de Odoo y extrae y renombra
-            el valor de almacén designado de los usuarios activos encontrados, desde un
-            valor de tipo *many2one*.
+            Este pipe procesa los datos retornados por la API de Odoo y renombra el
+            almacén designado de los usuarios activos encontrados, desde su ID.
 
             :param records DataFrame: Datos entrantes.
             """
 
-            # Función para extraer la ID del registro many2one de Odoo
-            extract_id_fn: SeriesApply[Many2One] = (
-                lambda reference: reference[0]
-            )
-
-            # Función para asignar nombre a la ID de almacén
-            rename_id_fn: SeriesApply[int] = (
-                lambda warehouse_id: WAREHOUSE_RENAME[warehouse_id]
-            )
+            # Categorías de nombres de almacén
+            warehouse_names = pd.CategoricalDtype( WAREHOUSE_RENAME.values() )
 
-            # Función para extraer y renombrar la información de ID de almacén
+            # Función para renombrar la ID de almacén; las IDs vacías o desconocidas quedan
+            # como nulas
             process_warehouse_data: ColumnAssignation = {
                 COLUMN.WAREHOUSE: (
                     lambda df: (
                         df[COLUMN.WAREHOUSE]
-                        .apply(extract_id_fn)
-                        .apply(rename_id_fn)
+                        .map(WAREHOUSE_RENAME)
+                        .astype(warehouse_names)
                     )
                 )
             }
@@ -113,44 +106,6 @@ class PipeMethods(_Contract_PipeMethods, _BasePipeMethods):
                 .assign(**process_warehouse_data)
             )
 
-        @pipeline_hub.register_method(
-            PIPE.DATA.USERS.GET_JOB_NAME,
-            requires= {
-                COLUMN.JOB,
-            },
-        )
-        def get_job_name(
-            self: 'PipeMethods.Data',
-            records: pd.DataFrame,
-        ) -> pd.DataFrame:
-            """
-            ### Obtención de nombre de puesto de trabajo
-            Este pipe procesa los datos retornados por la API de Odoo y extrae el nombre
-            del puesto de trabajo, desde un valor de tipo *many2one*.
-
-            :param records DataFrame: Datos entrantes.
-            """
-
-            # Función para extraer el nombre del registro many2one de Odoo
-            extract_name_fn: SeriesApply[Many2One] = (
-                lambda reference: reference[1]
-            )
-
-            # Función para reasignar el valor procesado a la misma columna
-            reassign_value: ColumnAssignation = {
-                COLUMN.JOB: (
-                    lambda df: (
-                        df[COLUMN.JOB]
-                        .apply(extract_name_fn)
-                    )
-                )
-            }
-
-            return (
-                records
-                .assign(**reassign_value)
-            )
-
         @pipeline_hub.register_method(
             PIPE.DATA.CORRECTIONS.ADD_CORRECTION_TAG,
             creates= {
@@ -260,10 +215,12 @@ class PipeMethods(_Contract_PipeMethods, _BasePipeMethods):
 
         @pipeline_hub.register_method(
             PIPE.PROCESSING.ASSIGN_DTYPES,
+            assigns_dtypes= True,
         )
         def assign_dtypes(
             self: 'PipeMethods.Processing',
             records: pd.DataFrame,
+            columns: Optional[Iterable[str]] = None,
         ) -> pd.DataFrame:
             """
             ### Asignación de tipos de datos
@@ -271,20 +228,42 @@ class PipeMethods(_Contract_PipeMethods, _BasePipeMethods):
             DataFrame y ordena los tipos de registro en caso de existir la columna de éstos.
 
             :param records DataFrame: Datos entrantes.
-            """
-
-            # Generación del mapa de tipos de datos
-            existing_dtypes = {
-                column: dtype
-                for ( column, dtype )
-                in ASSIGNED_DTYPES.items()
-                if column in records.columns
-            }
+            :param columns Iterable[str] | None: Columnas creadas o modificadas desde la
+            última asignación de tipos de dato. Si no se provee, se revisa el tipo de dato
+            de todas las columnas.
+            """
+
+            # Si se proveen las columnas modificadas...
+            if columns is not None:
+                # Generación del mapa de tipos de datos de las columnas modificadas
+                existing_dtypes = {
+                    column: ASSIGNED_DTYPES[column]
+                    for column in columns
+                    if column in ASSIGNED_DTYPES
+                }
+            # Si no se proveen las columnas modificadas...
+            else:
+                # Generación del mapa de tipos de datos de las columnas cuyo tipo de dato cambió
+                existing_dtypes = {
+                    column: dtype
+                    for ( column, dtype )
+                    in ASSIGNED_DTYPES.items()
+                    if (
+                        column in records.columns
+                        and records[column].dtype != dtype
+                    )
+                }
 
             # Función para ordenar tipos de registro si es que la columna existe
             def reorder_registry_types(df: pd.DataFrame) -> pd.DataFrame:
-                # Si existe columna de tipos de registro en el DataFrame...
-                if COLUMN.REGISTRY_TYPE in df.columns:
+                # Si existe columna de tipos de registro sin ordenar en el DataFrame...
+                if (
+                    COLUMN.REGISTRY_TYPE in df.columns
+                    and not (
+                        isinstance(df[COLUMN.REGISTRY_TYPE].dtype, pd.CategoricalDtype)
+                        and df[COLUMN.REGISTRY_TYPE].cat.ordered
+                    )
+                ):
                     return (
                         df
                         # Asignación de ordenamiento de valores de tipo de registro
@@ -342,6 +321,59 @@ class PipeMethods(_Contract_PipeMethods, _BasePipeMethods):
                 .pipe(reorder_weekdays)
             )
 
+        @pipeline_hub.register_method(
+            PIPE.PROCESSING.APPLY_RECORDS_FILTER,
+            requires= {
+                COLUMN.USER_ID,
+            },
+        )
+        def apply_records_filter(
+            self: 'PipeMethods.Processing',
+            records: pd.DataFrame,
+        ) -> pd.DataFrame:
+            """
+            ### Aplicación del filtro de registros
+            Este pipe aplica el filtro de registros usado en la carga de datos sobre las
+            columnas de ID de usuario, dispositivo y fecha que existan en el DataFrame.
+
+            :param records DataFrame: Datos entrantes.
+            """
+
+            return (
+                records
+                # Se aplica el mismo filtro usado en la carga de los registros
+                .pipe(self._pipes_m._main._data.records_filter)
+            )
+
+        @pipeline_hub.register_method(
+            PIPE.PROCESSING.APPLY_USERS_FILTER,
+            requires= {
+                COLUMN.USER_ID,
+            },
+        )
+        def apply_users_filter(
+            self: 'PipeMethods.Processing',
+            records: pd.DataFrame,
+        ) -> pd.DataFrame:
+            """
+            ### Aplicación del filtro de usuarios
+            Este pipe aplica los criterios de usuarios y dispositivos del filtro de registros
+            usado en la carga de datos, sin la ventana de fechas.
+
+            :param records DataFrame: Datos entrantes.
+            """
+
+            # Obtención del filtro usado en la carga de los registros
+            records_filter = self._pipes_m._main._data.records_filter
+
+            # Se construye un filtro con los mismos criterios sin ventana de fechas
+            users_filter = RecordsFilter(
+                excluded_users= records_filter.excluded_users,
+                devices= records_filter.devices,
+            )
+
+            return records.pipe(users_filter)
+
         @pipeline_hub.register_method(
             PIPE.PROCESSING.GET_USER_NAMES,
             requires= {
@@ -415,32 +447,21 @@ class PipeMethods(_Contract_PipeMethods, _BasePipeMethods):
             :param records DataFrame: Registros entrantes.
             """
 
-            # Función para convertir cadena de texto en delta de tiempo
-            def string_to_timedelta(value: str) -> timedelta:
-                # Obtención de los valores
-                [ hour, minute, second ] = value.split(':')
-                # Inicialización del objeto de delta de tiempo
-                value = timedelta(
-                    hours= int(hour),
-                    minutes= int(minute),
-                    seconds= int(second),
-                )
-                return value
-
-            # Asignación de columnas de fecha y tiempo
+            # Asignación de columnas de fecha y tiempo con sus tipos de dato finales
             date_and_time: ColumnAssignation = {
                 COLUMN.DATE: (
                     lambda df: (
                         df[COLUMN.REGISTRY_TIME]
-                        .dt.date
+                        .dt.normalize()
+                        .astype(ASSIGNED_DTYPES[COLUMN.DATE])
                     )
                 ),
                 COLUMN.TIME: (
                     lambda df: (
-                        df[COLUMN.REGISTRY_TIME]
-                        .dt.time
-                        .astype('string')
-                        .apply(string_to_timedelta)
+                        # Diferencia entre la fecha y hora y el inicio del día
+                        ( df[COLUMN.REGISTRY_TIME] - df[COLUMN.REGISTRY_TIME].dt.normalize() )
+                        # Se descartan las fracciones de segundo
+                        .dt.floor('s')
                     )
                 ),
             }
@@ -806,35 +827,16 @@ class PipeMethods(_Contract_PipeMethods, _BasePipeMethods):
             ### Procesamiento antes de guardar en base de datos
             Este pipe reasigna nombres de columnas del DataFrame entrante para
             acondicionarlo para ser guardado en la base de datos y le crea una columna de
-            ID de registro en la base de datos en base a la fecha, hora y el disposivo
-            fuente de los registros.
+            ID de registro en la base de datos en base a la fecha, hora, el usuario y el
+            disposivo fuente de los registros.
 
             :param records DataFrame: Datos entrantes.
             """
 
-            # Conversión de fecha a código
-            to_code: SeriesApply[str] = (
-                lambda value: (
-                    value
-                    .replace('-', '')
-                    .replace(' ', '')
-                    .replace(':', '')
-                )
-            )
-
-            # Asignación de columna de ID
+            # Asignación de columna de ID a partir del dispositivo, el usuario y la fecha y hora de registro
             id_assignation: ColumnAssignation = {
                 COLUMN.ID: (
-                    lambda df: (
-                        (
-                            df[COLUMN.DEVICE]
-                            .astype(str)
-                        ) + (
-                            df[COLUMN.REGISTRY_TIME]
-                            .astype(str)
-                            .apply(to_code)
-                        )
-                    )
+                    lambda df: build_record_ids(df[COLUMN.DEVICE], df[COLUMN.USER_ID], df[COLUMN.REGISTRY_TIME])
                 )
             }
 
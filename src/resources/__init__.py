@@ -3,3 +3,6 @@ from ._date_schema import _DateSchema
 from ._google_sheets_reports import GoogleSheetsReports
 from ._pipe_metadata import PipeMetadata
 from ._pipe_execution_metadata import PipesExecutionMetadata
+from ._polling_scheduler import PollingScheduler
+from ._records_filter import RecordsFilter
+from ._query_cache import QueryCache
@@ -77,6 +77,24 @@ class PipesExecutionMetadata:
         input_metadata: 'PipesExecutionMetadata.DataFrame'
         output_metadata: 'PipesExecutionMetadata.DataFrame'
 
+        @property
+        def touched_columns(
+            self,
+        ) -> set[str]:
+
+            # Obtención de los tipos de dato de entrada
+            input_dtypes = self.input_metadata.dtypes
+
+            # Se usan las columnas creadas o cuyo tipo de dato cambió durante la ejecución del pipe
+            columns = {
+                column
+                for ( column, dtype )
+                in self.output_metadata.dtypes.items()
+                if input_dtypes.get(column) != dtype
+            }
+
+            return columns
+
         def __repr__(
             self,
         ) -> str:
@@ -11,6 +11,7 @@ class PipeMetadata:
         creates: set[str],
         selects: set[str],
         renames: dict[str, str],
+        assigns_dtypes: bool,
     ) -> None:
 
         # Asignación de atributos
@@ -22,6 +23,7 @@ class PipeMetadata:
             creates,
             selects,
             renames,
+            assigns_dtypes,
         )
 
     @dataclass(slots= True)
@@ -32,6 +34,7 @@ class PipeMetadata:
         creates: set[str]
         selects: set[str]
         renames: dict[str, str]
+        assigns_dtypes: bool
 
         @property
         def input_columns(
@@ -0,0 +1,151 @@
+from datetime import (
+    datetime,
+    timedelta,
+)
+import pandas as pd
+from ..constants import COLUMN
+from ..contracts.resources import _Interface_PollingScheduler
+from ..settings import SCHEDULER
+
+class PollingScheduler(_Interface_PollingScheduler):
+
+    def __init__(
+        self,
+        devices: pd.DataFrame,
+        schedules: pd.DataFrame,
+    ) -> None:
+
+        # Nombres de los dispositivos programados
+        self.devices = list(devices[COLUMN.DEVICE])
+        # Intervalo base entre consultas de cada dispositivo
+        self._poll_intervals = {
+            device: timedelta(seconds= int(seconds))
+            for ( device, seconds ) in zip(devices[COLUMN.DEVICE], devices[COLUMN.POLL_INTERVAL])
+        }
+
+        # Inicios y fines de jornada de cada día de la semana
+        self._shift_boundaries: dict[int, list[timedelta]] = {}
+        for ( weekday, start, end ) in (
+            schedules
+            [[COLUMN.WEEKDAY, COLUMN.START_SCHEDULE, COLUMN.END_SCHEDULE]]
+            .itertuples(index= False)
+        ):
+            self._shift_boundaries.setdefault(int(weekday), []).extend( [start, end] )
+
+        # Consultas consecutivas sin registros nuevos de cada dispositivo
+        self._idle_polls = dict.fromkeys(self.devices, 0)
+        # Todos los dispositivos se consultan al iniciar
+        self._next_polls = dict.fromkeys(self.devices, datetime.min)
+
+    def __repr__(
+        self,
+    ) -> str:
+
+        return f'PollingScheduler({len(self.devices)} devices)'
+
+    def get_due_devices(
+        self,
+        now: datetime,
+    ) -> list[str]:
+
+        return [
+            device
+            for ( device, next_poll ) in self._next_polls.items()
+            if next_poll <= now
+        ]
+
+    def record_polls(
+        self,
+        polled_devices: list[str],
+        fetched_rows: dict[str, int],
+        now: datetime,
+    ) -> None:
+
+        # Iteración por cada dispositivo consultado
+        for device in polled_devices:
+            # Los dispositivos que fallaron se reintentan tras su intervalo base
+            if device not in fetched_rows:
+                self._next_polls[device] = now + self._poll_intervals[device]
+                continue
+
+            # Se actualiza el contador de consultas consecutivas sin registros nuevos
+            self._idle_polls[device] = 0 if fetched_rows[device] else self._idle_polls[device] + 1
+            # Se programa la siguiente consulta
+            self._next_polls[device] = now + self.get_interval(device, now)
+
+    def get_interval(
+        self,
+        device: str,
+        now: datetime,
+    ) -> timedelta:
+
+        # Obtención del intervalo base del dispositivo
+        poll_interval = self._poll_intervals[device]
+
+        # Los dispositivos se consultan con mayor frecuencia en periodos de actividad o si entregaron registros
+        if self._is_busy_period(now) or not self._idle_polls[device]:
+            return poll_interval * SCHEDULER.BUSY_FACTOR
+
+        # La espera se duplica con cada consulta sin registros nuevos sin exceder el múltiplo máximo
+        interval = poll_interval * min(2 ** self._idle_polls[device], SCHEDULER.MAX_IDLE_FACTOR)
+
+        # La espera no pasa del inicio del siguiente periodo de mayor actividad
+        next_busy_start = self._get_next_busy_start(now)
+        if next_busy_start is not None:
+            interval = max( min(interval, next_busy_start - now), poll_interval * SCHEDULER.BUSY_FACTOR )
+
+        return interval
+
+    def get_seconds_until_next_poll(
+        self,
+        now: datetime,
+    ) -> float:
+
+        # Si no hay dispositivos programados se espera el intervalo de consulta por defecto
+        if not self._next_polls:
+            return float(SCHEDULER.DEFAULT_POLL_INTERVAL)
+
+        return max( ( min( self._next_polls.values() ) - now ).total_seconds(), 0.0 )
+
+    def _is_busy_period(
+        self,
+        moment: datetime,
+    ) -> bool:
+
+        # Durante el horario de comida los dispositivos tienen mayor actividad
+        ( lunch_start, lunch_end ) = SCHEDULER.LUNCH_HOURS
+        if lunch_start <= moment.time() < lunch_end:
+            return True
+
+        # Tiempo transcurrido desde el inicio del día
+        time_of_day = moment - datetime.combine(moment.date(), datetime.min.time())
+
+        # Alrededor de cada inicio y fin de jornada los dispositivos tienen mayor actividad
+        return any(
+            abs(time_of_day - boundary) <= SCHEDULER.BOUNDARY_MARGIN
+            for boundary in self._shift_boundaries.get(moment.weekday(), [])
+        )
+
+    def _get_next_busy_start(
+        self,
+        now: datetime,
+    ) -> datetime | None:
+
+        # Inicialización de los inicios de periodos de mayor actividad
+        busy_starts: list[datetime] = []
+
+        # Se consideran los periodos del día en curso y del siguiente
+        for day_offset in (0, 1):
+            day_start = datetime.combine(now.date() + timedelta(days= day_offset), datetime.min.time())
+            # Inicio del horario de comida
+            busy_starts.append( datetime.combine(day_start.date(), SCHEDULER.LUNCH_HOURS[0]) )
+            # Inicio del margen de cada inicio y fin de jornada
+            busy_starts.extend(
+                day_start + boundary - SCHEDULER.BOUNDARY_MARGIN
+                for boundary in self._shift_boundaries.get(day_start.weekday(), [])
+            )
+
+        return min(
+            ( busy_start for busy_start in busy_starts if busy_start > now ),
+            default= None,
+        )
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+)
+import pandas as pd
+from ..contracts.resources import _Interface_QueryCache
+
+class QueryCache(_Interface_QueryCache):
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        get_version: Callable[[], int],
+    ) -> None:
+
+        # Se guardan los valores provistos
+        self.max_bytes = max_bytes
+        self._get_version = get_version
+
+        # Inicialización de resultados almacenados, del más antiguo al más reciente en uso
+        self._entries: OrderedDict[Hashable, tuple[pd.DataFrame, int]] = OrderedDict()
+        self.used_bytes = 0
+        # Versión de la base de datos a la que pertenecen los resultados almacenados
+        self._version: int | None = None
+        self._lock = Lock()
+
+    def __repr__(
+        self,
+    ) -> str:
+
+        return f'QueryCache({len(self._entries)} results, {self.used_bytes}/{self.max_bytes} bytes)'
+
+    @staticmethod
+    def build_key(
+        query: str,
+        *args: Any,
+    ) -> Hashable:
+
+        # Normalización de espacios en blanco del query
+        normalized_query = ' '.join( query.split() )
+        # Normalización de los argumentos ordenando los diccionarios por su llave
+        normalized_args = tuple(
+            repr( sorted( arg.items() ) ) if isinstance(arg, dict) else repr(arg)
+            for arg in args
+        )
+
+        return ( normalized_query, normalized_args )
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        load_fn: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+
+        # Obtención de la versión actual de la base de datos
+        version = self._get_version()
+
+        with self._lock:
+            # Si la base de datos cambió se descartan los resultados almacenados
+            if version != self._version:
+                self._clear()
+                self._version = version
+
+            # Si existe el resultado se marca como el más reciente y se retorna una copia
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                ( data, _ ) = self._entries[key]
+                return data.copy()
+
+        # Ejecución de la carga del resultado
+        data = load_fn()
+        # Obtención de la memoria ocupada por el resultado
+        size = int( data.memory_usage(deep= True).sum() )
+
+        with self._lock:
+            # Sólo se almacena el resultado si la base de datos no cambió y cabe en la memoria disponible
+            if version == self._version and size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = ( data.copy(), size )
+                self.used_bytes += size
+
+                # Se descartan los resultados usados hace más tiempo hasta respetar la memoria máxima
+                while self.used_bytes > self.max_bytes:
+                    ( _, ( _, evicted_size ) ) = self._entries.popitem(last= False)
+                    self.used_bytes -= evicted_size
+
+        return data
+
+    def clear(
+        self,
+    ) -> None:
+
+        with self._lock:
+            self._clear()
+
+    def _clear(
+        self,
+    ) -> None:
+
+        # Se descartan todos los resultados
+        self._entries.clear()
+        self.used_bytes = 0
@@ -0,0 +1,124 @@
+from datetime import (
+    date,
+    timedelta,
+)
+from typing import (
+    Any,
+    Iterable,
+)
+import pandas as pd
+from ..constants import (
+    COLUMN,
+    COMMON_ARGS,
+)
+from ..contracts.resources import _Interface_RecordsFilter
+from ..settings import DATABASE
+from ..typing.literals import Devices
+from ..utils import to_epoch
+
+class RecordsFilter(_Interface_RecordsFilter):
+
+    def __init__(
+        self,
+        *,
+        excluded_users: Iterable[int] = (),
+        devices: Iterable[Devices] | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> None:
+
+        # Se guardan los valores provistos
+        self.excluded_users = tuple(excluded_users)
+        self.devices = tuple(devices) if devices is not None else None
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def __repr__(
+        self,
+    ) -> str:
+
+        return (
+            f'RecordsFilter(excluded_users={self.excluded_users}, devices={self.devices}, '
+            f'start_date={self.start_date}, end_date={self.end_date})'
+        )
+
+    def within(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> 'RecordsFilter':
+
+        return RecordsFilter(
+            excluded_users= self.excluded_users,
+            devices= self.devices,
+            start_date= start_date,
+            end_date= end_date,
+        )
+
+    def where_clause(
+        self,
+    ) -> tuple[str, dict[str, Any]]:
+
+        # Inicialización de condiciones y parámetros
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+
+        # Si existen usuarios a descartar se provee su lista como un solo parámetro expandible
+        if self.excluded_users:
+            conditions.append(f'{COLUMN.USER_ID} NOT IN :{COMMON_ARGS.EXCLUDED_USERS}')
+            params[COMMON_ARGS.EXCLUDED_USERS] = list(self.excluded_users)
+
+        # Si se especificaron dispositivos se provee su lista como un solo parámetro expandible
+        if self.devices is not None:
+            conditions.append(f'{COLUMN.DEVICE} IN :{COMMON_ARGS.DEVICES}')
+            params[COMMON_ARGS.DEVICES] = list(self.devices)
+
+        # La columna de fecha y hora se compara sin funciones para que SQLite pueda usar su índice
+        if self.start_date is not None:
+            conditions.append(f'{COLUMN.REGISTRY_TIME} >= :{COMMON_ARGS.START_DATE}')
+            params[COMMON_ARGS.START_DATE] = to_epoch(self.start_date, DATABASE.EPOCH_UNIT)
+
+        # El rango es semiabierto por lo que el límite es el día siguiente a la fecha final
+        if self.end_date is not None:
+            conditions.append(f'{COLUMN.REGISTRY_TIME} < :{COMMON_ARGS.END_DATE}')
+            params[COMMON_ARGS.END_DATE] = to_epoch(self.end_date + timedelta(days= 1), DATABASE.EPOCH_UNIT)
+
+        # Unión de las condiciones
+        clause = ' AND '.join(conditions) if conditions else '1 = 1'
+
+        return ( clause, params )
+
+    def __call__(
+        self,
+        data: pd.DataFrame,
+    ) -> pd.DataFrame:
+
+        # Inicialización de la máscara de filas a conservar
+        mask = pd.Series(True, index= data.index)
+
+        # Se descartan los usuarios excluidos
+        if self.excluded_users and COLUMN.USER_ID in data.columns:
+            mask &= ~( data[COLUMN.USER_ID].isin(self.excluded_users) )
+
+        # Se conservan únicamente los dispositivos especificados
+        if self.devices is not None and COLUMN.DEVICE in data.columns:
+            mask &= data[COLUMN.DEVICE].isin(self.devices)
+
+        # Obtención de la columna de fecha disponible para la ventana de fechas
+        date_column = next(
+            (
+                column
+                for column in (COLUMN.DATE, COLUMN.REGISTRY_TIME)
+                if column in data.columns
+            ),
+            None,
+        )
+
+        # Se aplica la ventana de fechas si es que existe una columna de fecha
+        if date_column is not None:
+            if self.start_date is not None:
+                mask &= data[date_column] >= pd.Timestamp(self.start_date)
+            if self.end_date is not None:
+                mask &= data[date_column] < pd.Timestamp(self.end_date + timedelta(days= 1))
+
+        return data[mask]
@@ -1,22 +1,19 @@
 from datetime import date
 from ..constants import (
-    COLUMN,
     REGISTRY_TYPE,
     VALIDATION,
 )
 from ..domain_data import USERS_TO_DISCARD
-from ..typing import (
-    ColumnAssignation,
-    DataFramePipe,
-)
+from ..resources import RecordsFilter
+from ..typing import ColumnAssignation
 
-GLOBAL_FILTERS: DataFramePipe = lambda df: (
-    df[
-        ~( df[COLUMN.USER_ID].isin(USERS_TO_DISCARD) )
-    ]
-)
+GLOBAL_FILTERS = RecordsFilter(excluded_users= USERS_TO_DISCARD)
 """
-`DataFramePipe` Filtros globales.
+`RecordsFilter` Filtros globales.
+
+Estos filtros se traducen en condiciones SQL al cargar los registros desde la
+base de datos y se aplican a las incidencias al inicio de su procesamiento. A las
+correcciones sólo se les aplican los criterios de usuarios y dispositivos.
 """
 
 VALIDATIONS_PER_DAY_AND_USER_ID: ColumnAssignation = {
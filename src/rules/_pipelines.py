@@ -4,23 +4,25 @@ class PIPELINE:
 
     GET_USERS = [
         PIPE.DATA.USERS.GET_WAREHOUSE_NAME,
-        PIPE.DATA.USERS.GET_JOB_NAME,
         PIPE.PROCESSING.ASSIGN_DTYPES,
     ]
 
     GET_RECORDS = [
         PIPE.PROCESSING.GET_USER_NAMES,
-        PIPE.PROCESSING.ASSIGN_DTYPES,
         PIPE.PROCESSING.RECORDS.ADD_DATE_AND_TIME,
-        PIPE.PROCESSING.ASSIGN_DTYPES, 
         PIPE.COLUMNS_SELECTION.ASSISTANCE_RECORDS,
     ]
 
+    CONCAT_RECORDS_CHUNKS = [
+        PIPE.PROCESSING.ASSIGN_DTYPES,
+    ]
+
     GET_CORRECTIONS = [
         PIPE.PROCESSING.GET_USER_NAMES,
         PIPE.PROCESSING.TIME_FIRST_TO_STRING,
         PIPE.PROCESSING.NULL_BY_JUSTIFICATION,
         PIPE.PROCESSING.ASSIGN_DTYPES,
+        PIPE.PROCESSING.APPLY_USERS_FILTER,
         PIPE.PROCESSING.ASSIGN_ORDERED_REGISTRY_TYPE,
         PIPE.PROCESSING.ADD_REGISTRY_TIME,
         PIPE.PROCESSING.ASSIGN_DTYPES,
@@ -32,6 +34,7 @@ class PIPELINE:
     GET_JUSTIFICATIONS = [
         PIPE.DATA.JUSTIFICATIONS.RENAME_COLUMNS,
         PIPE.PROCESSING.JUSTIFICATIONS.GET_AND_KEEP_BY_USER_ID,
+        PIPE.PROCESSING.APPLY_RECORDS_FILTER,
         PIPE.PROCESSING.JUSTIFICATIONS.FORMAT_PERMISSION_DATE_STRINGS,
         PIPE.PROCESSING.ASSIGN_DTYPES,
         PIPE.COLUMNS_SELECTION.JUSTIFICATIONS,
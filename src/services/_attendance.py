@@ -1,39 +1,57 @@
+import time
 from datetime import datetime
+from threading import Lock
 import pandas as pd
 from attendance_registry import Assistance
 from ..constants import COLUMN
 from ..contracts.services import _Contract_Attendance
-from ..domain_data import DEVICE_SERIAL_NUMBER
 from ..resources import DataToSave
+from ..settings import CONFIG
 from ..typing import (
     ColumnAssignation,
     DataTypeOrNone,
 )
-from ..typing.callables import SeriesApply
 from ..typing.literals import Devices
+from ..utils import (
+    build_record_ids,
+    call_with_timeout,
+)
 
 class _Attendance(_Contract_Attendance):
 
     def __init__(
         self,
+        devices: pd.DataFrame,
+        registry: Assistance[Devices] | None = None,
     ) -> None:
 
-        # Creación de instancia
-        self._registry = Assistance[Devices](
-            {
-                'csl': DEVICE_SERIAL_NUMBER.CSL,
-                'sjc': DEVICE_SERIAL_NUMBER.SJC,
-            },
+        # Números de serie de los dispositivos registrados
+        device_serial_numbers: dict[Devices, str] = dict(
+            zip(devices[COLUMN.DEVICE], devices[COLUMN.SERIAL_NUMBER])
+        )
+
+        # Creación de instancia, o uso de la provista como la de un simulador de dispositivos
+        self._registry = registry or Assistance[Devices](device_serial_numbers)
+        # Dispositivos a consultar
+        self.devices = list(device_serial_numbers)
+
+        # Segundos mínimos entre peticiones a la API de cada dispositivo
+        self._rate_limits: dict[str, float] = dict(
+            zip(devices[COLUMN.DEVICE], devices[COLUMN.RATE_LIMIT])
         )
+        # Momento a partir del cual se permite la siguiente petición a cada dispositivo
+        self._next_request_times = dict.fromkeys(self.devices, 0.0)
+        self._rate_lock = Lock()
 
     def get_warehouse_records_from_api(
         self,
         warehouse_name: str,
         last_date_saved: datetime,
+        end_date: datetime | None = None,
     ) -> DataTypeOrNone[DataToSave]:
 
         # Obtención de los datos desde la API
-        data_i = self._get_from_api(last_date_saved, warehouse_name)
+        data_i = self._get_from_api(last_date_saved, warehouse_name, end_date)
 
         # Si existen datos obtenidos del dispositivo desde la API...
         if len(data_i):
@@ -54,20 +72,43 @@ class _Attendance(_Contract_Attendance):
         self,
         last_date_saved: datetime,
         device: str,
+        end_date: datetime | None = None,
     ) -> pd.DataFrame:
 
         # Definición de fecha y hora de inicio y final
         start_date = last_date_saved
-        last_date = datetime.now()
+        last_date = end_date or datetime.now()
 
         # Definición de rango de fecha y hora para búsqueda
         date_range = (start_date, last_date)
 
-        # Obtención de los datos desde la API
-        data = self._registry.get_daily_attendance(date_range, device)
+        # Espera hasta que se permita una nueva petición al dispositivo
+        self._wait_for_rate_limit(device)
+
+        # Obtención de los datos desde la API; la petición falla si excede el tiempo límite de red
+        data = call_with_timeout(
+            self._registry.get_daily_attendance,
+            CONFIG.NETWORK_TIMEOUT,
+            date_range,
+            device,
+        )
 
         return data
 
+    def _wait_for_rate_limit(
+        self,
+        device: str,
+    ) -> None:
+
+        # Se reserva el siguiente turno de petición del dispositivo
+        with self._rate_lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_times[device])
+            self._next_request_times[device] = request_time + self._rate_limits[device]
+
+        # Espera hasta el turno reservado, sin bloquear a los demás dispositivos
+        time.sleep(request_time - now)
+
     def _get_datetime_from_last_recent_record(
         self,
         data: pd.DataFrame,
@@ -83,29 +124,10 @@ class _Attendance(_Contract_Attendance):
         data: pd.DataFrame,
     ) -> pd.DataFrame:
 
-        # Conversión de fecha a código
-        to_code: SeriesApply[str] = (
-            lambda value: (
-                value
-                .replace('-', '')
-                .replace(' ', '')
-                .replace(':', '')
-            )
-        )
-
-        # Asignación de columna de ID
+        # Asignación de columna de ID a partir del dispositivo, el usuario y la fecha y hora de registro
         id_assignation: ColumnAssignation = {
             COLUMN.ID: (
-                lambda df: (
-                    (
-                        df[COLUMN.DEVICE]
-                        .astype(str)
-                    ) + (
-                        df[COLUMN.REGISTRY_TIME]
-                        .astype(str)
-                        .apply(to_code)
-                    )
-                )
+                lambda df: build_record_ids(df[COLUMN.DEVICE], df[COLUMN.USER_ID], df[COLUMN.REGISTRY_TIME])
             )
         }
 
@@ -1,59 +1,241 @@
+from contextlib import contextmanager
 from datetime import (
     date,
     datetime,
     timedelta,
 )
+from pathlib import Path
 import pandas as pd
-from typing import Literal
+from pandas._typing import AstypeArg
+from typing import (
+    Any,
+    Iterator,
+    Literal,
+)
+from sqlalchemy import (
+    Connection,
+    TextClause,
+)
 from ..constants import (
     COLUMN,
     COMMON_ARGS,
 )
 from ..contracts.services import _Contract_Database
-from ..settings import DATABASE
+from ..mapping import (
+    ASSISTANCE_RECORDS_COLUMNS,
+    ASSISTANCE_RECORDS_DTYPES,
+    DATABASE_INDEXES,
+    ORDERED_REGISTRY_TYPE,
+)
+from ..resources import (
+    QueryCache,
+    RecordsFilter,
+)
+from ..settings import (
+    CONFIG,
+    DATABASE,
+)
+from ..templates.files import (
+    PARQUET_FILE,
+    SQLITE_FILE,
+)
+from ..templates.migrations import MIGRATION
 from ..templates.queries import QUERY
+from ..templates.statements import STATEMENT
 from ..typing.callables import ConnFunction
 from ..typing.generics import _T
 from ..typing.misc import RecordsLastDates
+from ..utils import to_epoch
 from ..sql import (
+    begin,
+    begin_on_replica,
+    begin_read,
+    begin_with_archives,
+    compile_statement,
+    data_version,
+    database_path,
+    enable_memory_replica,
     execute_query,
-    get_value,
-    load_from_database,
-    engine,
+    memory_replica_enabled,
+    vacuum,
 )
 
 class _Database(_Contract_Database):
 
+    _query_cache = QueryCache(
+        max_bytes= DATABASE.QUERY_CACHE_MAX_BYTES,
+        get_version= data_version,
+    )
+    """
+    Caché de resultados de consultas compartida entre instancias, invalidada con
+    cada cambio confirmado en la base de datos.
+    """
+
+    def __init__(
+        self,
+    ) -> None:
+
+        # Se aplican las migraciones pendientes del esquema de la base de datos
+        self.migrate()
+        # Se registra la última hora de actualización de los dispositivos nuevos
+        self._register_new_devices()
+
+        # Si se solicitó, las lecturas de la sesión se realizan desde una copia en memoria
+        if CONFIG.IN_MEMORY_DATABASE and not memory_replica_enabled():
+            enable_memory_replica()
+
+    def migrate(
+        self,
+    ) -> None:
+
+        # Función para aplicar las versiones de esquema pendientes
+        def apply_migrations(conn: Connection) -> bool:
+
+            # Obtención de la versión actual del esquema
+            current_version: int = conn.exec_driver_sql(QUERY.GET_SCHEMA_VERSION).scalar_one()
+
+            # Iteración por cada versión de esquema
+            for ( version, statements ) in enumerate(MIGRATION.STEPS, start= 1):
+                # Si la versión ya fue aplicada se continúa con la siguiente
+                if version <= current_version:
+                    continue
+
+                # Ejecución de las sentencias de la versión
+                for statement in statements:
+                    conn.exec_driver_sql(statement)
+
+                # Se registra la versión aplicada
+                conn.exec_driver_sql(
+                    QUERY.SET_SCHEMA_VERSION
+                    .format(**{COMMON_ARGS.VERSION: version})
+                )
+
+            return current_version < len(MIGRATION.STEPS)
+
+        # Las migraciones se aplican dentro de una misma transacción, también en la copia en
+        # memoria si es que existe
+        migrated = self._execute_and_mirror(apply_migrations)
+
+        # Los archivos de meses cerrados se descartan porque pueden no corresponder al esquema nuevo
+        if migrated:
+            self._clear_cached_months()
+
+        # Verificación de índices esperados
+        self.verify_indexes()
+
+    def verify_indexes(
+        self,
+    ) -> None:
+
+        # Función para crear los índices faltantes
+        def create_missing_indexes(conn: Connection) -> None:
+
+            # Obtención de los índices existentes
+            existing_indexes = set( conn.exec_driver_sql(QUERY.GET_INDEX_NAMES).scalars() )
+            # Obtención de los índices faltantes
+            missing_indexes = {
+                index_name: definition
+                for ( index_name, definition ) in DATABASE_INDEXES.items()
+                if index_name not in existing_indexes
+            }
+
+            # Se crean los índices faltantes
+            for ( index_name, ( table_name, columns ) ) in missing_indexes.items():
+                conn.exec_driver_sql(
+                    QUERY.CREATE_INDEX
+                    .format(
+                        **{
+                            COMMON_ARGS.INDEX_NAME: index_name,
+                            COMMON_ARGS.TABLE_NAME: table_name,
+                            COMMON_ARGS.COLUMNS: ', '.join(columns),
+                        }
+                    )
+                )
+
+            # Si se creó algún índice se actualizan las estadísticas del planificador
+            if missing_indexes:
+                conn.exec_driver_sql(QUERY.OPTIMIZE)
+
+        # Ejecución de la verificación
+        self._execute_and_mirror(create_missing_indexes)
+
+    def archive_closed_years(
+        self,
+    ) -> None:
+
+        # Si el archivado está desactivado no se mueve ningún registro
+        if not DATABASE.ARCHIVE_CLOSED_YEARS:
+            return
+
+        # Los años son cerrados cuando todos los dispositivos fueron sincronizados después de su fin
+        current_year_start = self._get_synced_until().replace(month= 1, day= 1)
+
+        # Obtención de los años cerrados que aún tienen registros en la base de datos principal
+        closed_years: list[int] = [
+            year
+            for ( year, ) in execute_query(
+                QUERY.GET_RECORDS_YEARS
+                .format(**{COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.ASSISTANCE_RECORDS}),
+                {COMMON_ARGS.END_DATE: to_epoch(current_year_start, DATABASE.EPOCH_UNIT)},
+            )
+        ]
+
+        # Se mueven los registros de cada año cerrado a su archivo histórico
+        for year in closed_years:
+            self._archive_year(year)
+
+        # Si no se movió ningún registro no hay nada más que hacer
+        if not closed_years:
+            return
+
+        # La copia en memoria se vuelve a crear para no duplicar los registros movidos
+        if memory_replica_enabled():
+            enable_memory_replica()
+
+    def compact(
+        self,
+    ) -> None:
+
+        # Se recupera el espacio liberado en la base de datos principal
+        vacuum()
+
     def load_assistance_records(
         self,
-        start_date: date,
-        end_date: date,
+        records_filter: RecordsFilter,
     ) -> pd.DataFrame:
 
-        # Construcción del query para leer la tabla
-        query = (
-            QUERY.GET_RECORDS_IN_DATE_RANGE
-            .format(
-                **{
-                    COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.ASSISTANCE_RECORDS,
-                    COMMON_ARGS.REGISTRY_TIME: COLUMN.REGISTRY_TIME,
-                    COMMON_ARGS.START_DATE: start_date,
-                    COMMON_ARGS.END_DATE: end_date,
-                }
-            )
-        )
+        # Obtención de los registros de meses cerrados y del periodo abierto
+        parts = list( self._iter_records_parts(records_filter, None) )
+        # Se descartan las partes vacías conservando al menos una para preservar las columnas
+        parts = [ part for part in parts if len(part) ] or parts[:1]
 
-        # Obtención de los datos desde la tabla de la base de datos
-        data = self.load_data_from_query(query)
+        # Si los registros provienen de una sola fuente se retornan directamente
+        if len(parts) == 1:
+            return parts[0]
+
+        # Unión de los registros y restauración de sus tipos de dato
+        data = (
+            pd.concat(parts, ignore_index= True)
+            .pipe(self._restore_records_dtypes)
+        )
 
         return data
 
+    def iter_assistance_records(
+        self,
+        records_filter: RecordsFilter,
+        chunksize: int,
+    ) -> Iterator[pd.DataFrame]:
+
+        # Los meses cerrados se retornan completos y el periodo abierto por bloques
+        return self._iter_records_parts(records_filter, chunksize)
+
     def load_holidays(
         self,
     ) -> pd.DataFrame:
 
         # Se cargan los datos desde la base de datos
-        holidays = load_from_database(
+        holidays = self._load_table(
             DATABASE.TABLE.HOLIDAYS,
             {
                 COLUMN.HOLIDAY_NAME: 'string[python]',
@@ -68,7 +250,7 @@ class _Database(_Contract_Database):
     ) -> pd.DataFrame:
 
         # Se cargan los datos desde la base de datos
-        schedules = load_from_database(
+        schedules = self._load_table(
             DATABASE.TABLE.SCHEDULES,
             # Conversión de tipos de dato ya que SQLite no soporta INTERVAL
             {
@@ -85,7 +267,7 @@ class _Database(_Contract_Database):
     ) -> pd.DataFrame:
 
         # Se cargan los datos desde la base de datos
-        schedule_offsets = load_from_database(
+        schedule_offsets = self._load_table(
             DATABASE.TABLE.SCHEDULE_OFFSETS,
             # Conversión de tipos de dato ya que SQLite no soporta INTERVAL
             {
@@ -98,17 +280,33 @@ class _Database(_Contract_Database):
 
         return schedule_offsets
 
+    def load_devices(
+        self,
+    ) -> pd.DataFrame:
+
+        # Se cargan los dispositivos activos desde la base de datos
+        devices = self.load_data_from_query(
+            QUERY.GET_ACTIVE_DEVICES
+            .format(**{COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.DEVICES}),
+            dtype= {
+                COLUMN.DEVICE: 'string[python]',
+                COLUMN.SERIAL_NUMBER: 'string[python]',
+                COLUMN.POLL_INTERVAL: 'uint32',
+                COLUMN.RATE_LIMIT: 'float64',
+            },
+        )
+
+        return devices
+
     def load_data_from_query(
         self,
         query: str,
+        params: dict[str, Any] | None = None,
+        dtype: dict[str, AstypeArg] | None = None,
+        parse_dates: dict[str, Any] | None = None,
     ) -> pd.DataFrame:
 
-        # Función para obtención de los datos
-        load_data: ConnFunction[pd.DataFrame] = lambda conn: pd.read_sql_query(query, conn)
-        # Obtención de los datos
-        data = self._execute_on_connection(load_data)
-
-        return data
+        return self._load_data(query, params, dtype, parse_dates, {})
 
     def save_in_database(
         self,
@@ -131,56 +329,666 @@ class _Database(_Contract_Database):
         )
 
         # Se guarda el DataFrame
-        self._execute_on_connection(save_fn)
+        self._execute_and_mirror(save_fn)
 
-    def get_records_last_date_saved(
+    def _load_data(
         self,
-        warehouse_name: str,
-    ) -> datetime:
+        query: str,
+        params: dict[str, Any] | None,
+        dtype: dict[str, AstypeArg] | None,
+        parse_dates: dict[str, Any] | None,
+        archives: dict[str, str],
+    ) -> pd.DataFrame:
 
-            # Obtención de la última fecha de actualización de los datos
-            last_date_saved = (
-                datetime.fromisoformat(
-                    get_value(
-                        DATABASE.TABLE.LAST_UPDATE_DATES,
-                        'date',
-                        f"name = '{warehouse_name}'",
-                    )
+        # Construcción de la llave del resultado en caché
+        key = QueryCache.build_key(query, params, dtype, parse_dates)
+        # Obtención de la sentencia compilada
+        statement = self._compile(query, params)
+
+        # Función para obtención de los datos
+        load_data: ConnFunction[pd.DataFrame] = (
+            lambda conn: (
+                pd.read_sql_query(
+                    statement,
+                    conn,
+                    params= params,
+                    dtype= dtype,
+                    parse_dates= parse_dates,
                 )
-                # Se incrementa 1 segundo para evitar obtener nuevamente el último resultado ya guardado
-                + timedelta(seconds= 1)
             )
+        )
+        # Obtención de los datos desde la caché o desde la base de datos si ésta cambió
+        data = self._query_cache.get_or_load(
+            key,
+            lambda: self._execute_read(load_data, archives),
+        )
+
+        return data
+
+    def get_records_last_dates_saved(
+        self,
+    ) -> dict[str, datetime]:
+
+        # Función para obtener las filas de las últimas fechas de actualización
+        get_rows: ConnFunction[list[Any]] = (
+            lambda conn: conn.execute(STATEMENT.GET_LAST_UPDATE_DATES).fetchall()
+        )
+
+        # Obtención de las últimas fechas de actualización de los dispositivos activos en una sola consulta
+        last_dates_saved = {
+            device_name: datetime.fromisoformat(last_date)
+            for ( device_name, last_date ) in self._execute_read(get_rows, {})
+        }
+
+        return last_dates_saved
+
+    def save_records(
+        self,
+        records: pd.DataFrame,
+        last_dates: RecordsLastDates,
+    ) -> None:
+
+        # Función para guardar los registros y las fechas de actualización
+        def save_fn(conn: Connection) -> None:
+            # Se insertan los registros nuevos
+            self._insert_records(conn, records)
+            # Se actualizan las últimas fechas de actualización de los dispositivos
+            self._update_last_update_dates(conn, last_dates)
+
+        # Registros y fechas se guardan en la misma transacción para no desincronizarse
+        self._execute_and_mirror(save_fn)
+
+        # Se descartan los meses en caché que recibieron registros
+        self._invalidate_cached_months(records)
+
+    def _insert_records(
+        self,
+        conn: Connection,
+        records: pd.DataFrame,
+    ) -> None:
+
+        # Construcción de las filas a insertar
+        rows = (
+            records
+            # Selección de las columnas de la tabla
+            [ASSISTANCE_RECORDS_COLUMNS]
+            # Conversión de fecha y hora a entero desde la época Unix
+            .assign(
+                **{
+                    COLUMN.REGISTRY_TIME: (
+                        lambda df: to_epoch(df[COLUMN.REGISTRY_TIME], DATABASE.EPOCH_UNIT)
+                    )
+                }
+            )
+            .to_dict('records')
+        )
+
+        # Iteración por cada lote de filas
+        for batch_start in range(0, len(rows), DATABASE.INSERT_BATCH_SIZE):
+            # Inserción del lote con la sentencia precompilada
+            conn.execute(
+                STATEMENT.INSERT_RECORDS,
+                rows[batch_start : batch_start + DATABASE.INSERT_BATCH_SIZE],
+            )
+
+    def _update_last_update_dates(
+        self,
+        conn: Connection,
+        last_dates: RecordsLastDates,
+    ) -> None:
+
+        # Si no hay fechas por actualizar no se ejecuta nada
+        if not last_dates:
+            return
+
+        # Construcción de los parámetros por cada par almacén/valor
+        params = [
+            {
+                COMMON_ARGS.DEVICE_NAME: warehouse_i,
+                COMMON_ARGS.DATE: max_found_datetime,
+            }
+            for ( warehouse_i, max_found_datetime ) in last_dates
+        ]
+
+        # Ejecución por lotes de la actualización de todos los dispositivos
+        conn.execute(STATEMENT.UPDATE_LAST_UPDATE_DATE, params)
+
+    def _load_table(
+        self,
+        table_name: str,
+        dtype: dict[str, AstypeArg],
+    ) -> pd.DataFrame:
+
+        # Construcción del query para leer la tabla completa
+        query = (
+            QUERY.GET_TABLE
+            .format(**{COMMON_ARGS.TABLE_NAME: table_name})
+        )
+
+        return self.load_data_from_query(query, dtype= dtype)
+
+    def _iter_records_parts(
+        self,
+        records_filter: RecordsFilter,
+        chunksize: int | None,
+    ) -> Iterator[pd.DataFrame]:
+
+        # Obtención del primer día del periodo que aún puede recibir registros
+        cutoff = self._get_closed_months_cutoff(records_filter)
+
+        # Si no se usa la caché todos los registros se leen desde la base de datos
+        if cutoff is None:
+            yield from self._read_records(records_filter, chunksize)
+            return
+
+        # Obtención de los meses cerrados dentro del rango del filtro
+        closed_months = pd.period_range(
+            start= records_filter.start_date,
+            end= min(
+                cutoff - timedelta(days= 1),
+                records_filter.end_date or cutoff,
+            ),
+            freq= 'M',
+        )
+
+        # Los registros de meses cerrados se leen desde la caché y se filtran en memoria
+        for month in closed_months:
+            yield (
+                self._load_cached_month(month)
+                .pipe(records_filter)
+                .reset_index(drop= True)
+                .pipe(self._restore_records_dtypes)
+            )
+
+        # Si el rango del filtro termina antes del periodo abierto no se lee nada más
+        if records_filter.end_date is not None and records_filter.end_date < cutoff:
+            return
+
+        # El periodo abierto se lee desde la base de datos
+        yield from self._read_records(
+            records_filter.within(
+                max(records_filter.start_date, cutoff),
+                records_filter.end_date,
+            ),
+            chunksize,
+        )
+
+    def _read_records(
+        self,
+        records_filter: RecordsFilter,
+        chunksize: int | None,
+    ) -> Iterator[pd.DataFrame]:
+
+        # Obtención de los archivos históricos que alcanza el rango del filtro
+        archives = self._get_archives(records_filter)
+        # Si se adjuntan archivos históricos la lectura se realiza desde la vista que los une
+        table_name = (
+            DATABASE.VIEW.ASSISTANCE_RECORDS_WITH_ARCHIVES
+            if archives
+            else DATABASE.TABLE.ASSISTANCE_RECORDS
+        )
+
+        # Construcción del query para leer la tabla
+        ( query, params ) = self._build_records_query(records_filter, table_name)
+        # La fecha y hora se decodifica desde enteros sin interpretar texto
+        parse_dates = {COLUMN.REGISTRY_TIME: {'unit': DATABASE.EPOCH_UNIT}}
+
+        # Si la lectura es completa se retorna un solo bloque, usando la caché de consultas
+        if chunksize is None:
+            data = self._load_data(query, params, ASSISTANCE_RECORDS_DTYPES, parse_dates, archives)
+            yield self._order_registry_types(data)
+            return
+
+        # La conexión se mantiene abierta mientras se consumen los bloques
+        with self._connect(archives) as conn:
+            # Lectura de los datos por bloques con sus tipos de dato finales
+            chunks = pd.read_sql_query(
+                self._compile(query, params),
+                conn,
+                params= params,
+                dtype= ASSISTANCE_RECORDS_DTYPES,
+                parse_dates= parse_dates,
+                chunksize= chunksize,
+            )
+
+            # Iteración por cada bloque
+            for chunk in chunks:
+                yield self._order_registry_types(chunk)
+
+    def _get_closed_months_cutoff(
+        self,
+        records_filter: RecordsFilter,
+    ) -> date | None:
+
+        # Si la caché está desactivada o el filtro no tiene fecha inicial no se usa ésta
+        if not DATABASE.CACHE_CLOSED_MONTHS or records_filter.start_date is None:
+            return None
+
+        # Los meses son cerrados cuando todos los dispositivos fueron sincronizados después de su fin
+        return self._get_synced_until().replace(day= 1)
+
+    def _register_new_devices(
+        self,
+    ) -> None:
+
+        # Los dispositivos nuevos se consultan desde el inicio del día en curso
+        first_date = datetime.combine(CONFIG.TODAY, datetime.min.time())
+
+        # Función para registrar la última hora de actualización faltante
+        register_fn: ConnFunction[Any] = (
+            lambda conn: conn.execute(
+                compile_statement(
+                    QUERY.INSERT_MISSING_LAST_UPDATE_DATES
+                    .format(
+                        **{
+                            COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.LAST_UPDATE_DATES,
+                            COMMON_ARGS.SOURCE_TABLE_NAME: DATABASE.TABLE.DEVICES,
+                        }
+                    )
+                ),
+                {COMMON_ARGS.DATE: str(first_date)},
+            )
+        )
 
-            return last_date_saved
+        # Se registran los dispositivos faltantes
+        self._execute_and_mirror(register_fn)
 
-    def update_last_update_dates(
+    def _get_synced_until(
         self,
-        max_dates: RecordsLastDates,
+    ) -> date:
+
+        # Fecha hasta la que todos los dispositivos fueron sincronizados
+        synced_until = min(
+            [
+                CONFIG.TODAY,
+                *( last_date.date() for last_date in self.get_records_last_dates_saved().values() ),
+            ]
+        )
+
+        return synced_until
+
+    def _archive_year(
+        self,
+        year: int,
     ) -> None:
 
-        # Iteración por cada par almacén/valor
-        for ( warehouse_i, max_found_datetime ) in max_dates:
-            # Construcción del query
-            query = (
-                QUERY.UPDATE_LAST_UPDATE_IN_RECORDS
-                .format(**{
-                    COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.LAST_UPDATE_DATES,
-                    COMMON_ARGS.DATE: max_found_datetime,
-                    COMMON_ARGS.DEVICE_NAME: warehouse_i,
-                })
+        # Obtención del alias y la ruta del archivo histórico del año
+        schema = self._get_archive_schema(year)
+        archive_path = self._get_archive_path(year)
+        # Nombre de la tabla de registros dentro del archivo histórico
+        archive_table = f'{schema}.{DATABASE.TABLE.ASSISTANCE_RECORDS}'
+        # Nombre de la tabla de registros en la base de datos principal
+        main_table = f'main.{DATABASE.TABLE.ASSISTANCE_RECORDS}'
+
+        # Obtención de las condiciones para seleccionar los registros del año
+        ( conditions, params ) = (
+            RecordsFilter(
+                start_date= date(year, 1, 1),
+                end_date= date(year, 12, 31),
+            )
+            .where_clause()
+        )
+
+        # Función para mover los registros del año al archivo histórico
+        def move_records(conn: Connection) -> None:
+
+            # Se crea la tabla de registros en el archivo histórico
+            conn.exec_driver_sql(
+                QUERY.CREATE_RECORDS_TABLE
+                .format(**{COMMON_ARGS.TABLE_NAME: archive_table})
+            )
+
+            # Se crean los índices de la tabla de registros en el archivo histórico
+            for ( index_name, ( table_name, columns ) ) in DATABASE_INDEXES.items():
+                if table_name == DATABASE.TABLE.ASSISTANCE_RECORDS:
+                    conn.exec_driver_sql(
+                        QUERY.CREATE_INDEX
+                        .format(
+                            **{
+                                COMMON_ARGS.INDEX_NAME: f'{schema}.{index_name}',
+                                COMMON_ARGS.TABLE_NAME: table_name,
+                                COMMON_ARGS.COLUMNS: ', '.join(columns),
+                            }
+                        )
+                    )
+
+            # Se copian los registros del año al archivo histórico
+            conn.execute(
+                self._compile(
+                    QUERY.INSERT_IGNORING_EXISTING_FROM_TABLE
+                    .format(
+                        **{
+                            COMMON_ARGS.TABLE_NAME: archive_table,
+                            COMMON_ARGS.COLUMNS: ', '.join(ASSISTANCE_RECORDS_COLUMNS),
+                            COMMON_ARGS.SOURCE_TABLE_NAME: main_table,
+                            COMMON_ARGS.CONDITIONS: conditions,
+                        }
+                    ),
+                    params,
+                ),
+                params,
+            )
+
+            # Se eliminan los registros del año de la base de datos principal
+            conn.execute(
+                self._compile(
+                    QUERY.DELETE_FILTERED
+                    .format(
+                        **{
+                            COMMON_ARGS.TABLE_NAME: main_table,
+                            COMMON_ARGS.CONDITIONS: conditions,
+                        }
+                    ),
+                    params,
+                ),
+                params,
+            )
+
+        # La copia y la eliminación se realizan en una misma transacción. Si ésta se
+        # interrumpe entre archivos, repetirla no duplica registros
+        with begin_with_archives({schema: str(archive_path)}) as conn:
+            move_records(conn)
+
+    def _get_archives(
+        self,
+        records_filter: RecordsFilter,
+    ) -> dict[str, str]:
+
+        # Obtención de los años que abarca el rango del filtro
+        start_year = records_filter.start_date.year if records_filter.start_date else None
+        end_year = records_filter.end_date.year if records_filter.end_date else None
+
+        # Obtención de los archivos históricos existentes dentro del rango
+        archives = {
+            self._get_archive_schema(year): str(self._get_archive_path(year))
+            for year in self._get_archived_years()
+            if ( start_year is None or year >= start_year )
+            and ( end_year is None or year <= end_year )
+        }
+
+        return archives
+
+    def _get_archived_years(
+        self,
+    ) -> list[int]:
+
+        # Patrón de búsqueda de los archivos históricos de la base de datos en uso
+        pattern = self._get_archive_path('*')
+
+        # Obtención de los años a partir de los nombres de archivo encontrados
+        years = sorted(
+            int( file_path.stem.rsplit('_', 1)[-1] )
+            for file_path in pattern.parent.glob(pattern.name)
+        )
+
+        return years
+
+    def _get_archive_path(
+        self,
+        year: int | str,
+    ) -> Path:
+
+        # Obtención de la ruta de la base de datos en uso
+        db_path = database_path()
+        # Construcción de la ruta del archivo histórico del año junto a la base de datos
+        file_path = db_path.parent.joinpath(
+            SQLITE_FILE.ARCHIVE.NAME
+            .format(
+                **{
+                    COMMON_ARGS.DATABASE_NAME: db_path.stem,
+                    COMMON_ARGS.YEAR: year,
+                }
+            )
+        )
+
+        return file_path
+
+    def _get_archive_schema(
+        self,
+        year: int,
+    ) -> str:
+
+        return SQLITE_FILE.ARCHIVE.SCHEMA.format(**{COMMON_ARGS.YEAR: year})
+
+    def _load_cached_month(
+        self,
+        month: pd.Period,
+    ) -> pd.DataFrame:
+
+        # Obtención de la ruta del archivo del mes
+        file_path = self._get_cached_month_path(month)
+
+        # Si el archivo existe se leen los registros desde éste
+        if file_path.exists():
+            return (
+                pd.read_parquet(file_path)
+                .pipe(self._restore_records_dtypes)
             )
 
-            # Ejecución del comando
-            execute_query(query, commit= True)
+        # Lectura de todos los registros del mes desde la base de datos
+        [ data ] = self._read_records(
+            RecordsFilter(
+                start_date= month.start_time.date(),
+                end_date= month.end_time.date(),
+            ),
+            None,
+        )
+
+        # Se guarda el archivo del mes a través de un archivo temporal para no dejarlo incompleto
+        file_path.parent.mkdir(parents= True, exist_ok= True)
+        temporary_path = file_path.with_suffix('.tmp')
+        data.to_parquet(temporary_path, index= False)
+        temporary_path.replace(file_path)
+
+        return data
+
+    def _invalidate_cached_months(
+        self,
+        records: pd.DataFrame,
+    ) -> None:
+
+        # Se eliminan los archivos de los meses que recibieron registros
+        for month in records[COLUMN.REGISTRY_TIME].dt.to_period('M').unique():
+            self._get_cached_month_path(month).unlink(missing_ok= True)
+
+    def _clear_cached_months(
+        self,
+    ) -> None:
+
+        # Obtención de la ruta de la base de datos en uso
+        db_path = database_path()
+
+        # Se eliminan los archivos de todos los meses de la carpeta de caché
+        for file_path in db_path.parent.glob(
+            PARQUET_FILE.RECORDS_MONTH.PATTERN
+            .format(**{COMMON_ARGS.DATABASE_NAME: db_path.stem})
+        ):
+            file_path.unlink(missing_ok= True)
+
+    def _get_cached_month_path(
+        self,
+        month: pd.Period,
+    ) -> Path:
+
+        # Obtención de la ruta de la base de datos en uso
+        db_path = database_path()
+        # Construcción de la ruta del archivo del mes junto a la base de datos
+        file_path = db_path.parent.joinpath(
+            PARQUET_FILE.RECORDS_MONTH.NAME
+            .format(
+                **{
+                    COMMON_ARGS.DATABASE_NAME: db_path.stem,
+                    COMMON_ARGS.YEAR: month.year,
+                    COMMON_ARGS.MONTH: month.month,
+                }
+            )
+        )
+
+        return file_path
+
+    def _restore_records_dtypes(
+        self,
+        data: pd.DataFrame,
+    ) -> pd.DataFrame:
+
+        # Se reasignan únicamente los tipos de dato que difieren de los esperados
+        changed_dtypes = {
+            column: dtype
+            for ( column, dtype ) in ASSISTANCE_RECORDS_DTYPES.items()
+            if data[column].dtype != dtype
+        }
+
+        # Reasignación de tipos de dato
+        restored_data = data.astype(changed_dtypes)
+
+        # Se descartan las categorías sin valores como en la lectura desde la base de datos
+        for column in restored_data.select_dtypes('category').columns:
+            restored_data[column] = restored_data[column].cat.remove_unused_categories()
+
+        return self._order_registry_types(restored_data)
+
+    def _build_records_query(
+        self,
+        records_filter: RecordsFilter,
+        table_name: str = DATABASE.TABLE.ASSISTANCE_RECORDS,
+    ) -> tuple[str, dict[str, Any]]:
+
+        # Obtención de las condiciones del filtro y sus parámetros
+        ( conditions, params ) = records_filter.where_clause()
+
+        # Construcción del query para leer la tabla
+        query = (
+            QUERY.GET_FILTERED_RECORDS
+            .format(
+                **{
+                    COMMON_ARGS.TABLE_NAME: table_name,
+                    COMMON_ARGS.CONDITIONS: conditions,
+                }
+            )
+        )
+
+        return ( query, params )
+
+    def _order_registry_types(
+        self,
+        data: pd.DataFrame,
+    ) -> pd.DataFrame:
+
+        # Obtención de los tipos de registro encontrados en el orden lógico de éstos
+        registry_types = [
+            value
+            for value in ORDERED_REGISTRY_TYPE
+            if value in data[COLUMN.REGISTRY_TYPE].cat.categories
+        ]
+
+        # Ordenamiento de categorías de tipo de registro
+        data[COLUMN.REGISTRY_TYPE] = (
+            data[COLUMN.REGISTRY_TYPE]
+            .cat.reorder_categories(registry_types, ordered= True)
+        )
+
+        return data
+
+    def _compile(
+        self,
+        query: str,
+        params: dict[str, Any] | None,
+    ) -> TextClause:
+
+        # Los parámetros con listas de valores se expanden al ejecutar la sentencia
+        expanding = tuple(
+            sorted(
+                name
+                for ( name, value ) in ( params or {} ).items()
+                if isinstance(value, (list, tuple))
+            )
+        )
+
+        return compile_statement(query, expanding)
+
+    @contextmanager
+    def _connect(
+        self,
+        archives: dict[str, str],
+    ) -> Iterator[Connection]:
+
+        # Sin archivos históricos se usa directamente una conexión de lectura
+        if not archives:
+            with begin_read() as conn:
+                yield conn
+            return
+
+        # Nombre de la vista que une los registros de todos los archivos
+        view_name = DATABASE.VIEW.ASSISTANCE_RECORDS_WITH_ARCHIVES
+        # Consultas de registros de cada archivo histórico y de la base de datos principal en
+        # orden cronológico
+        selects = ' UNION ALL '.join(
+            QUERY.SELECT_COLUMNS
+            .format(
+                **{
+                    COMMON_ARGS.COLUMNS: ', '.join(ASSISTANCE_RECORDS_COLUMNS),
+                    COMMON_ARGS.TABLE_NAME: f'{schema}.{DATABASE.TABLE.ASSISTANCE_RECORDS}',
+                }
+            )
+            for schema in [*archives, 'main']
+        )
+
+        # Se adjuntan los archivos históricos a una conexión de lectura
+        with begin_with_archives(archives, read= True) as conn:
+            # Se crea la vista temporal en la conexión
+            conn.exec_driver_sql( QUERY.DROP_TEMP_VIEW.format(**{COMMON_ARGS.TABLE_NAME: view_name}) )
+            conn.exec_driver_sql(
+                QUERY.CREATE_TEMP_UNION_VIEW
+                .format(
+                    **{
+                        COMMON_ARGS.TABLE_NAME: view_name,
+                        COMMON_ARGS.SELECTS: selects,
+                    }
+                )
+            )
+            yield conn
+            # La vista se elimina antes de separar los archivos
+            conn.exec_driver_sql( QUERY.DROP_TEMP_VIEW.format(**{COMMON_ARGS.TABLE_NAME: view_name}) )
 
     def _execute_on_connection(
         self,
         fn: ConnFunction[_T]
     ) -> _T:
 
-        # Se abre la conexión a la base de datos
-        with engine.connect() as conn, conn.begin():
+        # Se toma una conexión del engine compartido
+        with begin() as conn:
             # Ejecución de la función provista
             result = fn(conn)
 
         return result
+
+    def _execute_read(
+        self,
+        fn: ConnFunction[_T],
+        archives: dict[str, str],
+    ) -> _T:
+
+        # Se toma una conexión de lectura, adjuntando los archivos históricos provistos
+        with self._connect(archives) as conn:
+            # Ejecución de la función provista
+            result = fn(conn)
+
+        return result
+
+    def _execute_and_mirror(
+        self,
+        fn: ConnFunction[_T]
+    ) -> _T:
+
+        # Se toma una conexión del engine compartido
+        with begin() as conn:
+            # Ejecución de la función provista en la base de datos en archivo
+            result = fn(conn)
+
+            # La escritura se replica en la copia en memoria antes de confirmarse en el
+            # archivo, para que ninguna lectura posterior al cambio obtenga datos anteriores
+            if memory_replica_enabled():
+                with begin_on_replica() as replica_conn:
+                    fn(replica_conn)
+
+        return result
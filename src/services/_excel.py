@@ -1,10 +1,40 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+)
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import (
+    Alignment,
+    Border,
+    Font,
+    Side,
+)
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from ..constants import COMMON_ARGS
 from ..contracts.services import _Contract_Excel
-from ..contracts.modules import _Interface_DateSchemas
-from ..templates.files import EXCEL_FILE
+from ..settings import (
+    INPUT,
+    REPORT,
+)
+from ..mapping import CORRECTIONS_BOOK_DTYPES
+from ..templates.files import (
+    EXCEL_FILE,
+    PARQUET_FILE,
+)
 from ..templates.messages import MESSAGE
-from ..utils import path_from_dropbox
+from ..templates.names import SHEET
+from ..utils import (
+    path_from_dropbox,
+    path_from_local_cache,
+)
 
 class Excel(_Contract_Excel):
 
@@ -24,34 +54,22 @@ class Excel(_Contract_Excel):
 
     def load_corrections_books(
         self,
-        schemas: _Interface_DateSchemas,
+        start_date: date,
+        end_date: date,
     ) -> pd.DataFrame:
 
-        # Obtención del mes de inicio
-        start_month = schemas.start_month
-        # Obtención del mes de fin
-        end_month = schemas.end_month
-        # Año de inicio
-        start_year = schemas.start_year
-        # Año de fin
-        end_year = schemas.end_year
-        # Parámetros para iterar
-        params = [
-            (start_year, start_month),
-            (end_year, end_month),
-        ]
-
-        # Inicialización de lista de DataFrames
-        corrections_in_required_dates: list[pd.DataFrame] = []
-
-        # Carga de dos meses
-        for ( year, month ) in params:
-            # Se intenta cargar un libro de correcciones
+        # Inicialización de los datos de cada mes y de los libros que requieren leerse
+        books: dict[pd.Period, pd.DataFrame] = {}
+        books_to_read: dict[pd.Period, tuple[Path, Path]] = {}
+
+        # Iteración por cada mes del rango
+        for month in pd.period_range(start_date, end_date, freq= 'M'):
+            # Obtención de la ruta del libro del mes
+            file_path = self._get_corrections_book_path(month.year, month.month)
+
+            # Se intenta obtener la ruta de la caché según el estado actual del libro
             try:
-                # Obtención de los datos desde un archivo de Excel
-                corrections_per_month = self.load_corrections_book(year, month)
-                # Se añade el DataFrame a la lista
-                corrections_in_required_dates.append(corrections_per_month)
+                cache_path = self._get_cached_book_path(file_path)
             # Si no fue encontrado...
             except FileNotFoundError:
                 # Se indica el error y se continúa con el siguiente libro
@@ -59,14 +77,40 @@ class Excel(_Contract_Excel):
                     MESSAGE.CORRECTIONS_FILE_NOT_FOUND
                     .format(
                         **{
-                            COMMON_ARGS.YEAR: year,
-                            COMMON_ARGS.MONTH: month,
+                            COMMON_ARGS.YEAR: month.year,
+                            COMMON_ARGS.MONTH: month.month,
                         }
                     )
                 )
+                continue
+
+            # Si el libro no cambió desde su última lectura se usa la caché
+            data = _read_cached_book(cache_path)
+            if data is not None:
+                books[month] = data
+            # En caso contrario el libro se lee después junto con los demás libros modificados
+            else:
+                books_to_read[month] = ( file_path, cache_path )
+
+        # Lectura de los libros sin caché
+        books.update( self._read_corrections_books(books_to_read) )
+
+        # Si no se encontró ningún libro del rango no hay correcciones que concatenar
+        if not books:
+            raise FileNotFoundError(
+                MESSAGE.CORRECTIONS_FILES_NOT_FOUND
+                .format(
+                    **{
+                        COMMON_ARGS.START_DATE: start_date,
+                        COMMON_ARGS.END_DATE: end_date,
+                    }
+                )
+            )
 
-        # Concatenación de DataFrames
-        corrections = pd.concat(corrections_in_required_dates)
+        # Concatenación de DataFrames en orden de mes y con tipos de dato unificados
+        corrections = _concat_with_unified_dtypes(
+            [ books[month] for month in sorted(books) ]
+        )
 
         return corrections
 
@@ -76,6 +120,99 @@ class Excel(_Contract_Excel):
         month: int,
     ) -> pd.DataFrame:
 
+        # Obtención de la ruta del archivo
+        file_path = self._get_corrections_book_path(year, month)
+
+        # Obtención de la ruta de la caché según el estado actual del libro
+        cache_path = self._get_cached_book_path(file_path)
+
+        # Si el libro no cambió desde su última lectura se usa la caché
+        data = _read_cached_book(cache_path)
+        if data is not None:
+            return data
+
+        # Obtención de los datos desde el archivo de Excel
+        data = _read_corrections_book(file_path, cache_path)
+
+        return data
+
+    def export_sheets(
+        self,
+        file_name: str,
+        sheets: Iterable[tuple[str, pd.DataFrame]],
+    ) -> None:
+
+        # Libro en modo de sólo escritura; las filas no se conservan como objetos en memoria
+        workbook = Workbook(write_only= True)
+
+        # Iteración por cada hoja en el orden provisto
+        for ( sheet_name, data ) in sheets:
+            # Las hojas que exceden el máximo de filas se dividen en partes numeradas
+            for ( part, start ) in enumerate(
+                range(0, max(len(data), 1), REPORT.MAX_ROWS_PER_SHEET),
+                start= 1,
+            ):
+                # Creación de la hoja de la parte
+                worksheet = workbook.create_sheet(
+                    sheet_name
+                    if part == 1
+                    else (
+                        SHEET.PART
+                        .format(
+                            **{
+                                COMMON_ARGS.SHEET_NAME: sheet_name,
+                                COMMON_ARGS.N: part,
+                            }
+                        )
+                    )
+                )
+                # Escritura de los encabezados
+                worksheet.append( _header_cells(worksheet, data.columns) )
+                # Escritura de las filas de la parte
+                for row in _iter_rows( data.iloc[start:start + REPORT.MAX_ROWS_PER_SHEET] ):
+                    worksheet.append(row)
+
+        # Se guarda el libro
+        workbook.save(file_name)
+
+    def _read_corrections_books(
+        self,
+        books_to_read: dict[pd.Period, tuple[Path, Path]],
+    ) -> dict[pd.Period, pd.DataFrame]:
+
+        # Si no hay libros por leer no se crean procesos
+        if not books_to_read:
+            return {}
+
+        # Los libros se leen al mismo tiempo en procesos separados. Éstos ejecutan únicamente
+        # la lectura de Pandas, por lo que no importan el paquete ni sus configuraciones
+        with ProcessPoolExecutor(
+            max_workers= min(INPUT.CORRECTIONS.MAX_WORKERS, len(books_to_read)),
+        ) as executor:
+            # Se inicia la lectura de cada libro
+            futures = {
+                month: executor.submit(pd.read_excel, file_path, keep_default_na= False)
+                for ( month, ( file_path, _ ) ) in books_to_read.items()
+            }
+
+            # Espera de los datos de cada libro con los tipos de dato de los libros
+            books = {
+                month: _assign_book_dtypes( future.result() )
+                for ( month, future ) in futures.items()
+            }
+
+        # Se guarda la caché de cada libro leído
+        for ( month, ( file_path, cache_path ) ) in books_to_read.items():
+            _save_cached_book(books[month], file_path, cache_path)
+
+        return books
+
+    def _get_corrections_book_path(
+        self,
+        year: int,
+        month: int,
+    ) -> Path:
+
         # Generación de nombre de archivo a buscar
         file_name = (
             EXCEL_FILE.CORRECTIONS.NAME
@@ -86,13 +223,181 @@ class Excel(_Contract_Excel):
                 }
             )
         )
-        # Obtención de la ruta del archivo
-        file_path = path_from_dropbox(f'{file_name}.xlsx')
 
-        # Obtención de los datos desde un archivo de Excel
-        data = pd.read_excel(
+        return Path( path_from_dropbox(f'{file_name}.xlsx') )
+
+    def _get_cached_book_path(
+        self,
+        file_path: Path,
+    ) -> Path:
+
+        # Obtención de la fecha de modificación y el tamaño del libro; falla si éste no existe
+        file_stat = file_path.stat()
+        # Llave del contenido a partir del nombre, la fecha de modificación y el tamaño del libro
+        key = (
+            hashlib.sha1(
+                f'{file_path.name}:{file_stat.st_mtime_ns}:{file_stat.st_size}'
+                .encode()
+            )
+            .hexdigest()
+        )
+
+        # Construcción de la ruta de la caché en la carpeta de caché local del equipo
+        cache_path = Path(
+            path_from_local_cache(
+                PARQUET_FILE.CORRECTIONS.NAME
+                .format(
+                    **{
+                        COMMON_ARGS.FILE_NAME: file_path.stem,
+                        COMMON_ARGS.KEY: key,
+                    }
+                )
+            )
+        )
+
+        return cache_path
+
+def _read_cached_book(
+    cache_path: Path,
+) -> pd.DataFrame | None:
+
+    # Si no existe la caché el libro debe leerse
+    if not cache_path.exists():
+        return None
+
+    try:
+        # Obtención de los datos desde la caché con los tipos de dato de los libros
+        return (
+            pd.read_parquet(cache_path)
+            .pipe(_assign_book_dtypes)
+        )
+    # Una caché dañada o incompleta se ignora y el libro se vuelve a leer
+    except Exception:
+        return None
+
+def _read_corrections_book(
+    file_path: Path,
+    cache_path: Path,
+) -> pd.DataFrame:
+
+    # Obtención de los datos desde un archivo de Excel con los tipos de dato de los libros
+    data = (
+        pd.read_excel(
             file_path,
             keep_default_na= False,
         )
+        .pipe(_assign_book_dtypes)
+    )
 
-        return data
+    # Se guarda la caché del libro
+    _save_cached_book(data, file_path, cache_path)
+
+    return data
+
+def _save_cached_book(
+    data: pd.DataFrame,
+    file_path: Path,
+    cache_path: Path,
+) -> None:
+
+    # Se eliminan las cachés de versiones anteriores del libro
+    cache_path.parent.mkdir(parents= True, exist_ok= True)
+    for stale_path in cache_path.parent.glob(
+        Path(
+            PARQUET_FILE.CORRECTIONS.NAME
+            .format(
+                **{
+                    COMMON_ARGS.FILE_NAME: file_path.stem,
+                    COMMON_ARGS.KEY: '*',
+                }
+            )
+        )
+        .name
+    ):
+        stale_path.unlink(missing_ok= True)
+
+    # Se guarda la caché a través de un archivo temporal único para no dejarla incompleta
+    temporary_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    data.to_parquet(temporary_path, index= False)
+    temporary_path.replace(cache_path)
+
+def _header_cells(
+    worksheet: WriteOnlyWorksheet,
+    columns: pd.Index,
+) -> list[WriteOnlyCell]:
+
+    # Borde delgado de las celdas de encabezado
+    side = Side(style= 'thin')
+
+    # Los encabezados se escriben con el mismo formato que usa Pandas al exportar a Excel
+    cells: list[WriteOnlyCell] = []
+    for column in columns:
+        cell = WriteOnlyCell(worksheet, value= str(column))
+        cell.font = Font(bold= True)
+        cell.border = Border(left= side, right= side, top= side, bottom= side)
+        cell.alignment = Alignment(horizontal= 'center', vertical= 'top')
+        cells.append(cell)
+
+    return cells
+
+def _assign_book_dtypes(
+    data: pd.DataFrame,
+) -> pd.DataFrame:
+
+    # Tipos de dato de cada columna; las columnas de texto no descritas se guardan como cadenas
+    dtypes: dict[str, Any] = {
+        column: CORRECTIONS_BOOK_DTYPES.get(
+            column,
+            'string[python]' if data[column].dtype == object else data[column].dtype,
+        )
+        for column in data.columns
+    }
+
+    # Se asigna el tipo de dato de cada columna sin modificar los datos provistos
+    data = data.copy()
+    for ( column, dtype ) in dtypes.items():
+        if data[column].dtype == dtype:
+            continue
+        # Los valores que no son números o fechas válidas, como las celdas vacías, se interpretan
+        # como nulos
+        if dtype == 'Int64':
+            data[column] = pd.to_numeric(data[column], errors= 'coerce').astype(dtype)
+        elif str(dtype).startswith('datetime64'):
+            data[column] = pd.to_datetime(data[column], errors= 'coerce').astype(dtype)
+        else:
+            data[column] = data[column].astype(dtype)
+
+    return data
+
+def _iter_rows(
+    data: pd.DataFrame,
+) -> Iterator[tuple[Any, ...]]:
+
+    # Las filas se convierten por bloques para no duplicar la hoja completa en memoria
+    for start in range(0, len(data), REPORT.WRITE_CHUNK_SIZE):
+        chunk = data.iloc[start:start + REPORT.WRITE_CHUNK_SIZE]
+        # Los valores nulos (NaN, NaT y NA) se escriben como celdas vacías
+        values = chunk.astype(object).where(chunk.notna(), None)
+
+        yield from values.itertuples(index= False, name= None)
+
+def _concat_with_unified_dtypes(
+    books: list[pd.DataFrame],
+) -> pd.DataFrame:
+
+    # Obtención de los tipos de dato de cada columna en todos los libros
+    column_dtypes: dict[str, set[str]] = {}
+    for book in books:
+        for ( column, dtype ) in book.dtypes.items():
+            column_dtypes.setdefault(column, set()).add( str(dtype) )
+
+    # Las columnas con tipos distintos entre libros se concatenan como objetos
+    mixed_columns = [ column for ( column, dtypes ) in column_dtypes.items() if len(dtypes) > 1 ]
+
+    return pd.concat(
+        [
+            book.astype( { column: object for column in mixed_columns if column in book } )
+            for book in books
+        ],
+        ignore_index= True,
+    )
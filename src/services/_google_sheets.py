@@ -3,8 +3,12 @@ from ccc_utils import spreadsheet
 from ..contracts import _CoreRegistryProcessing
 from ..contracts.services import _Contract_GoogleSheets
 from ..resources import GoogleSheetsReports
-from ..settings import OUTPUT
+from ..settings import (
+    CONFIG,
+    OUTPUT,
+)
 from ..templates.files import SPREADSHEET
+from ..utils import call_with_timeout
 
 class _GoogleSheets(_Contract_GoogleSheets):
 
@@ -21,8 +25,14 @@ class _GoogleSheets(_Contract_GoogleSheets):
 
         # Actualización
         for ( sheet_name, report ) in sheets_and_reports.items():
-            # Se actualiza la hoja con el reporte
-            spreadsheet.write(report, OUTPUT.FILE.VISUALIZATIONS.NAME, sheet_name)
+            # Se actualiza la hoja con el reporte; la escritura falla si excede el tiempo límite de red
+            call_with_timeout(
+                spreadsheet.write,
+                CONFIG.NETWORK_TIMEOUT,
+                report,
+                OUTPUT.FILE.VISUALIZATIONS.NAME,
+                sheet_name,
+            )
 
     def load_justifications(
         self,
@@ -33,7 +43,9 @@ class _GoogleSheets(_Contract_GoogleSheets):
             pd.concat(
                 [
                     (
-                        spreadsheet.load(
+                        call_with_timeout(
+                            spreadsheet.load,
+                            CONFIG.NETWORK_TIMEOUT,
                             SPREADSHEET.JUSTIFICATIONS.NAME,
                             sheet_name,
                         )
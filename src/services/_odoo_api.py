@@ -1,7 +1,23 @@
+from pathlib import Path
+from typing import Any
 from odoo_api_manager import OdooAPIManager
 import pandas as pd
-from ..constants import COLUMN
+from ..constants import (
+    COLUMN,
+    COMMON_ARGS,
+)
 from ..contracts.services import _Contract_OdooAPI
+from ..settings import (
+    CONFIG,
+    ODOO,
+)
+from ..sql import database_path
+from ..templates.files import PARQUET_FILE
+from ..templates.messages import MESSAGE
+from ..utils import (
+    call_with_timeout,
+    split_many2one,
+)
 
 class OdooAPI(_Contract_OdooAPI):
 
@@ -16,20 +32,27 @@ class OdooAPI(_Contract_OdooAPI):
         self,
     ) -> pd.DataFrame:
 
-        return (
-            # Obtención de la lista de empleados desde Odoo
-            self._api_manager.search_read(
-                # Modelo de empleados
-                'hr.employee',
-                # Campos
-                fields= [
-                    'name',
-                    'x_pay_frequency',
-                    'x_warehouse_id',
-                    'job_id',
-                    'x_hire_date',
-                ],
+        # Obtención de la copia local de empleados
+        snapshot = self._load_employees_snapshot()
+
+        try:
+            # Se actualiza la copia local con los cambios en Odoo
+            employees = self._sync_employees(snapshot)
+        except Exception as e:
+            # Sin copia local no hay empleados que usar
+            if snapshot is None:
+                raise
+            # Si Odoo excedió el tiempo límite o no respondió se usa la copia local
+            print(
+                MESSAGE.EMPLOYEES_SYNC_FAILED
+                .format(**{COMMON_ARGS.ERROR: repr(e)})
             )
+            employees = snapshot
+
+        return (
+            employees
+            # Se conservan únicamente los empleados activos
+            .loc[lambda df: df['active'].astype(bool)]
             # Reasignación de nombres de columnas
             .rename(
                 columns= {
@@ -37,7 +60,7 @@ class OdooAPI(_Contract_OdooAPI):
                     'name': COLUMN.NAME,
                     'x_pay_frequency': COLUMN.PAY_FREQUENCY,
                     'x_warehouse_id': COLUMN.WAREHOUSE,
-                    'job_id': COLUMN.JOB,
+                    'job_name': COLUMN.JOB,
                     'x_hire_date': COLUMN.HIRE_DATE,
                 },
             )
@@ -52,4 +75,160 @@ class OdooAPI(_Contract_OdooAPI):
                 COLUMN.JOB,
                 COLUMN.HIRE_DATE,
             ]]
+            .reset_index(drop= True)
+        )
+
+    def _sync_employees(
+        self,
+        snapshot: pd.DataFrame | None,
+    ) -> pd.DataFrame:
+
+        # Se incluyen los empleados archivados para detectar bajas
+        domain: list[tuple[str, str, Any]] = [('active', 'in', [True, False])]
+        # Con copia local sólo se obtienen los empleados modificados desde la última sincronización
+        if snapshot is not None:
+            domain.append( ('write_date', '>=', snapshot['write_date'].max()) )
+
+        # Obtención de los empleados desde Odoo. Con copia local la consulta tiene un tiempo
+        # límite corto para que el inicio no dependa de la latencia de Odoo
+        changes = self._search_read_employees(
+            domain,
+            ODOO.SYNC_TIMEOUT if snapshot is not None else CONFIG.NETWORK_TIMEOUT,
+        )
+
+        # Si no hubo cambios se usa la copia local sin volver a guardarla
+        if snapshot is not None and not len(changes):
+            return snapshot
+
+        # Separación de los campos de Odoo en columnas con tipos de dato uniformes
+        changes = self._normalize_employees(changes)
+
+        # Los empleados modificados reemplazan a su versión anterior en la copia local
+        employees = (
+            (
+                pd.concat([snapshot, changes])
+                .drop_duplicates('id', keep= 'last')
+                if snapshot is not None
+                else changes
+            )
+            .sort_values('id')
+            .reset_index(drop= True)
+        )
+
+        # El empleado más reciente se obtiene de nuevo en cada sincronización, por lo que la
+        # copia local sólo se guarda si algún empleado cambió
+        if snapshot is not None and employees.equals(snapshot):
+            return snapshot
+
+        # Se guarda la copia local actualizada
+        self._save_employees_snapshot(employees)
+
+        return employees
+
+    def _search_read_employees(
+        self,
+        domain: list[tuple[str, str, Any]],
+        timeout: float,
+    ) -> pd.DataFrame:
+
+        # Obtención de los empleados desde Odoo; la consulta falla si excede el tiempo límite provisto
+        employees = call_with_timeout(
+            self._api_manager.search_read,
+            timeout,
+            # Modelo de empleados
+            'hr.employee',
+            # Condiciones de búsqueda
+            domain,
+            # Campos
+            fields= [
+                'name',
+                'x_pay_frequency',
+                'x_warehouse_id',
+                'job_id',
+                'x_hire_date',
+                'active',
+                'write_date',
+            ],
+        )
+
+        return employees
+
+    def _normalize_employees(
+        self,
+        employees: pd.DataFrame,
+    ) -> pd.DataFrame:
+
+        # Separación de ID y nombre de los campos many2one
+        ( warehouse_ids, _ ) = split_many2one(employees['x_warehouse_id'])
+        ( job_ids, job_names ) = split_many2one(employees['job_id'])
+
+        # Función para convertir los campos vacíos, que llegan desde Odoo como False, en nulos
+        def to_string(values: pd.Series) -> pd.Series:
+            return values.where(values.ne(False), None).astype('string')
+
+        return (
+            employees
+            .assign(
+                id= employees['id'].astype('int64'),
+                name= to_string(employees['name']),
+                x_pay_frequency= to_string(employees['x_pay_frequency']),
+                x_warehouse_id= warehouse_ids,
+                job_id= job_ids,
+                job_name= job_names,
+                x_hire_date= to_string(employees['x_hire_date']),
+                active= employees['active'].astype(bool),
+                write_date= to_string(employees['write_date']),
+            )
+            [[
+                'id',
+                'name',
+                'x_pay_frequency',
+                'x_warehouse_id',
+                'job_id',
+                'job_name',
+                'x_hire_date',
+                'active',
+                'write_date',
+            ]]
         )
+
+    def _load_employees_snapshot(
+        self,
+    ) -> pd.DataFrame | None:
+
+        # Obtención de la ruta de la copia local
+        file_path = self._get_employees_snapshot_path()
+
+        # Si no existe copia local se obtendrán todos los empleados
+        if not file_path.exists():
+            return None
+
+        return pd.read_parquet(file_path)
+
+    def _save_employees_snapshot(
+        self,
+        employees: pd.DataFrame,
+    ) -> None:
+
+        # Obtención de la ruta de la copia local
+        file_path = self._get_employees_snapshot_path()
+
+        # Se guarda el archivo a través de un archivo temporal para no dejarlo incompleto
+        file_path.parent.mkdir(parents= True, exist_ok= True)
+        temporary_path = file_path.with_suffix('.tmp')
+        employees.to_parquet(temporary_path, index= False)
+        temporary_path.replace(file_path)
+
+    def _get_employees_snapshot_path(
+        self,
+    ) -> Path:
+
+        # Obtención de la ruta de la base de datos en uso
+        db_path = database_path()
+        # Construcción de la ruta de la copia local junto a la base de datos
+        file_path = db_path.parent.joinpath(
+            PARQUET_FILE.EMPLOYEES.NAME
+            .format(**{COMMON_ARGS.DATABASE_NAME: db_path.stem})
+        )
+
+        return file_path
@@ -20,8 +20,8 @@ class Services(_Contract_ServicesMain):
         self.database = _Database()
         # Inicialización del servicio de conexión con Hojas de Cálculo
         self.google_sheets = _GoogleSheets()
-        # Inicialización del servicio de conexión a la API de HikVision
-        self.attendance = _Attendance()
+        # Inicialización del servicio de conexión a la API de HikVision con los dispositivos registrados
+        self.attendance = _Attendance( self.database.load_devices() )
         # Inicialización del servicio de obtención y exportación de archivos en Excel
         self.excel = Excel()
 
@@ -1,8 +1,12 @@
 from ._config import (
     CONFIG,
+    DAEMON,
     DATA,
     DATABASE,
     INPUT,
+    ODOO,
     OUTPUT,
     REPORT,
+    SCHEDULER,
+    UPDATE,
 )
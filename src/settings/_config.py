@@ -1,5 +1,6 @@
 from datetime import (
     date,
+    time,
     timedelta,
 )
 from ._env import env
@@ -17,6 +18,18 @@ class CONFIG:
     TODAY = env.variable(ENV_VARIABLE.TODAY, date.fromisoformat, date.today)
     """`date` Día en curso."""
 
+    IN_MEMORY_DATABASE = env.variable(ENV_VARIABLE.IN_MEMORY_DATABASE, lambda value: value == '1', lambda: False)
+    """
+    `bool` Las lecturas de la base de datos se realizan desde una copia en memoria
+    creada una vez por sesión.
+    """
+
+    NETWORK_TIMEOUT = 60
+    """
+    `int` Segundos de espera de cada llamada a las APIs de los dispositivos, de
+    Odoo y de Hojas de Cálculo antes de que ésta falle.
+    """
+
     LUNCH_DURATION_LIMIT = timedelta(hours= 1, seconds= 59)
     """
     `timedelta` Límite de duración de tiempo de comida.
@@ -50,6 +63,12 @@ class INPUT:
         USERS_DATA = USERS_DATA_VALUES
     class VALUE:
         JUSTIFICATION = 'Incidencia'
+    class CORRECTIONS:
+        """
+        `CONST` Parámetros de carga de libros de correcciones.
+        """
+        MAX_WORKERS = 4
+        """`int` Libros sin caché leídos al mismo tiempo."""
 
 class OUTPUT:
     class FILE:
@@ -61,8 +80,16 @@ class DATA:
 
 class REPORT:
     """
-    `CONST` Nombres de reportes que se generan en Excel.
+    `CONST` Nombres de reportes que se generan en Excel y parámetros de su
+    exportación.
+    """
+    MAX_ROWS_PER_SHEET = 1_000_000
+    """
+    `int` Filas de datos máximas por hoja; las hojas más grandes se dividen en
+    partes numeradas. Excel admite hasta 1,048,576 filas por hoja.
     """
+    WRITE_CHUNK_SIZE = 10_000
+    """`int` Filas convertidas a la vez al escribir una hoja."""
     class VERIFICATION:
         """`CONST` Valores de reporte de verificaciones en Excel."""
         NAME = 'verification'
@@ -83,6 +110,85 @@ class REPORT:
             USERS = 'Usuarios'
             '`Literal` Hoja de usuarios.'
 
+class UPDATE:
+    """
+    `CONST` Parámetros de actualización de registros desde los dispositivos.
+    """
+    MAX_WORKERS = 8
+    """
+    `int` Consultas a los dispositivos, o a sus ventanas de descarga, realizadas
+    al mismo tiempo.
+    """
+    DEVICE_TIMEOUT = 120
+    """
+    `int` Segundos de espera por los registros de un dispositivo antes de omitirlo
+    en la actualización.
+    """
+    BACKFILL_THRESHOLD = timedelta(days= 2)
+    """
+    `timedelta` Periodo sin actualizar a partir del cual los registros de un
+    dispositivo se descargan por ventanas.
+    """
+    BACKFILL_WINDOW = timedelta(days= 1)
+    """`timedelta` Duración de cada ventana de descarga."""
+
+class ODOO:
+    """
+    `CONST` Parámetros de obtención de datos desde Odoo.
+    """
+    SYNC_TIMEOUT = 10
+    """
+    `int` Segundos de espera por los cambios de empleados antes de usar la copia
+    local.
+    """
+
+class SCHEDULER:
+    """
+    `CONST` Parámetros de la programación adaptativa de consultas a los
+    dispositivos.
+    """
+    DEFAULT_POLL_INTERVAL = 300
+    """`int` Segundos base entre consultas de los dispositivos registrados por omisión."""
+    DEFAULT_RATE_LIMIT = 1.0
+    """
+    `float` Segundos mínimos entre peticiones a la API de los dispositivos
+    registrados por omisión.
+    """
+    BOUNDARY_MARGIN = timedelta(minutes= 30)
+    """
+    `timedelta` Margen antes y después de cada inicio y fin de jornada en el que
+    los dispositivos se consultan con mayor frecuencia.
+    """
+    LUNCH_HOURS = ( time(13), time(16) )
+    """
+    `tuple[time, time]` Horario en el que ocurren los tiempos de comida, durante
+    el cual los dispositivos se consultan con mayor frecuencia.
+    """
+    BUSY_FACTOR = 0.5
+    """
+    `float` Fracción del intervalo base entre consultas durante los márgenes de
+    inicio y fin de jornada o tras consultas con registros nuevos.
+    """
+    MAX_IDLE_FACTOR = 4
+    """
+    `int` Múltiplo máximo del intervalo base entre consultas, que se duplica con
+    cada consulta consecutiva sin registros nuevos.
+    """
+
+class DAEMON:
+    """
+    `CONST` Parámetros del proceso continuo de actualización de registros.
+    """
+    JITTER = 0.1
+    """
+    `float` Fracción máxima del intervalo que se suma o resta al azar a cada espera.
+    """
+    MAX_BACKOFF = 3_600
+    """
+    `int` Segundos máximos de espera tras actualizaciones fallidas consecutivas,
+    cuya espera se duplica con cada falla.
+    """
+
 class DATABASE:
     """
     `CONST` Nombres en base de datos.
@@ -101,3 +207,86 @@ class DATABASE:
         """`Literal` Tabla de desfases de horarios."""
         LAST_UPDATE_DATES = 'last_update_dates'
         """`Literal` Tabla de última de hora de actualización en datos."""
+        DEVICES = 'devices'
+        """`Literal` Tabla de dispositivos de registro y sus parámetros de consulta."""
+
+    class VIEW:
+        """
+        `CONST` Nombres de vistas temporales en la base de datos.
+        """
+        ASSISTANCE_RECORDS_WITH_ARCHIVES = 'assistance_records_with_archives'
+        """
+        `Literal` Unión de la tabla de registros de asistencia con las de los
+        archivos históricos adjuntos.
+        """
+
+    class INDEX:
+        """
+        `CONST` Nombres de índices en la base de datos.
+        """
+        RECORDS_REGISTRY_TIME = 'ix_assistance_records_registry_time'
+        """`Literal` Índice de registros de asistencia por fecha y hora."""
+        RECORDS_USER_REGISTRY_TIME = 'ix_assistance_records_user_id_registry_time'
+        """`Literal` Índice de registros de asistencia por usuario y fecha y hora."""
+        LAST_UPDATE_DATES_NAME = 'ix_last_update_dates_name'
+        """`Literal` Índice de última hora de actualización por dispositivo."""
+
+    EPOCH_UNIT = 's'
+    """
+    `Literal` Unidad de tiempo de las fechas y horas de registro almacenadas como
+    enteros desde la época Unix (sin zona horaria).
+    """
+
+    RECORDS_CHUNK_SIZE: int | None = None
+    """
+    `int | None` Cantidad de filas por bloque en la carga de registros de
+    asistencia. Si es `None` los registros se cargan en una sola lectura.
+
+    Los bloques sólo acotan la memoria de la lectura y de los pasos intermedios
+    del procesamiento, ya que los resultados de todos ellos se concatenan.
+    """
+
+    CACHE_CLOSED_MONTHS = True
+    """
+    `bool` Los registros de meses cerrados se leen desde archivos Parquet en lugar
+    de la base de datos.
+    """
+
+    ARCHIVE_CLOSED_YEARS = True
+    """
+    `bool` Los registros de años cerrados se mueven a un archivo histórico por año
+    y la base de datos principal conserva únicamente el año en curso.
+    """
+
+    STATEMENT_CACHE_SIZE = 256
+    """`int` Sentencias compiladas conservadas por el driver y por la capa de queries."""
+
+    QUERY_CACHE_MAX_BYTES = 268_435_456
+    """
+    `int` Memoria máxima ocupada por resultados de consultas en caché (256 MiB).
+    """
+
+    INSERT_BATCH_SIZE = 5_000
+    """`int` Cantidad de filas por lote en inserciones masivas."""
+
+    class POOL:
+        """
+        `CONST` Parámetros del pool de conexiones del engine compartido.
+        """
+        SIZE = 5
+        """`int` Conexiones persistentes mantenidas en el pool."""
+        MAX_OVERFLOW = 5
+        """`int` Conexiones adicionales permitidas sobre el tamaño del pool."""
+
+    class PRAGMA:
+        """
+        `CONST` Pragmas de SQLite aplicados al abrir cada conexión nueva.
+        """
+        JOURNAL_MODE = 'WAL'
+        """`Literal` Modo de bitácora de escritura anticipada."""
+        SYNCHRONOUS = 'NORMAL'
+        """`Literal` Nivel de sincronización a disco (seguro en modo WAL)."""
+        MMAP_SIZE = 268_435_456
+        """`int` Bytes de la base de datos mapeados en memoria (256 MiB)."""
+        CACHE_SIZE = -65_536
+        """`int` Tamaño de caché de páginas; un valor negativo se expresa en KiB (64 MiB)."""
@@ -1,24 +1,295 @@
-from typing import Any
+import atexit
+import sqlite3
+from contextlib import (
+    contextmanager,
+    nullcontext,
+)
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from typing import (
+    Any,
+    Iterator,
+)
 import pandas as pd
 from pandas._typing import AstypeArg
 from sqlalchemy import (
+    Connection,
+    Engine,
+    TextClause,
+    bindparam,
     create_engine,
+    event,
     text,
 )
+from sqlalchemy.pool import (
+    QueuePool,
+    StaticPool,
+)
 from .utils import path_from_dropbox
-from .settings import CONFIG
+from .constants import COMMON_ARGS
+from .settings import (
+    CONFIG,
+    DATABASE,
+)
+from .templates.queries import QUERY
 
 # Se define la ruta para los datos en Dropbox
 _db_file = f'{CONFIG.SELECTED_DATABASE}.db'
 _db_file_path_str = path_from_dropbox(_db_file)
 
-# Se crea el objeto engine para trabajarlo con los metodos de pandas
-engine = create_engine(f'sqlite:///{_db_file_path_str}')
+# Pragmas a aplicar en cada conexión nueva
+_PRAGMAS = {
+    'journal_mode': DATABASE.PRAGMA.JOURNAL_MODE,
+    'synchronous': DATABASE.PRAGMA.SYNCHRONOUS,
+    'mmap_size': DATABASE.PRAGMA.MMAP_SIZE,
+    'cache_size': DATABASE.PRAGMA.CACHE_SIZE,
+}
+
+def _apply_pragmas(dbapi_connection: Any, _: Any) -> None:
+
+    # Se desactiva el manejo implícito de transacciones del driver para emitirlas explícitamente
+    dbapi_connection.isolation_level = None
+    # Se abre un cursor en la conexión nativa de SQLite
+    cursor = dbapi_connection.cursor()
+    # Se aplica cada pragma a la conexión
+    for ( pragma, value ) in _PRAGMAS.items():
+        cursor.execute(f'PRAGMA {pragma} = {value}')
+    # Se cierra el cursor
+    cursor.close()
+
+def _create_engine(db_file_path: str) -> Engine:
+
+    # Creación del engine con un pool de conexiones persistentes
+    new_engine = create_engine(
+        f'sqlite:///{db_file_path}',
+        poolclass= QueuePool,
+        pool_size= DATABASE.POOL.SIZE,
+        max_overflow= DATABASE.POOL.MAX_OVERFLOW,
+        connect_args= {
+            # Las conexiones del pool pueden ser reutilizadas desde distintos hilos
+            'check_same_thread': False,
+            # Sentencias preparadas que el driver conserva por conexión
+            'cached_statements': DATABASE.STATEMENT_CACHE_SIZE,
+        },
+    )
+    # Se aplican los pragmas cada vez que el pool abre una conexión nueva
+    event.listen(new_engine, 'connect', _apply_pragmas)
+    # Cada transacción inicia explícitamente para que las sentencias DDL también sean atómicas
+    event.listen(new_engine, 'begin', _begin_explicitly)
+
+    return new_engine
+
+def _create_replica_engine(replica_connection: sqlite3.Connection) -> Engine:
+
+    # Creación del engine sobre la única conexión de la copia en memoria
+    new_engine = create_engine(
+        'sqlite://',
+        poolclass= StaticPool,
+        creator= lambda: replica_connection,
+    )
+    # Cada transacción inicia explícitamente igual que en la base de datos en archivo
+    event.listen(new_engine, 'begin', _begin_explicitly)
+
+    return new_engine
+
+def _begin_explicitly(conn: Connection) -> None:
+
+    # Se emite la apertura de la transacción
+    conn.exec_driver_sql('BEGIN')
+
+# Se crea el objeto engine compartido para trabajarlo con los metodos de pandas
+engine = _create_engine(_db_file_path_str)
+
+def _create_watcher_connection(db_file_path: str) -> sqlite3.Connection:
+
+    # Conexión dedicada a detectar cambios confirmados por cualquier otra conexión
+    return sqlite3.connect(
+        db_file_path,
+        check_same_thread= False,
+        isolation_level= None,
+    )
+
+# La conexión de detección de cambios se abre hasta su primer uso
+_watcher_connection: sqlite3.Connection | None = None
+_watcher_lock = Lock()
+# Cantidad de veces que se cambió el archivo de base de datos en uso
+_database_generation = 0
+
+def _close_watcher_connection() -> None:
+
+    global _watcher_connection
+
+    # Se cierra la conexión de detección de cambios si es que fue abierta
+    with _watcher_lock:
+        if _watcher_connection is not None:
+            _watcher_connection.close()
+        _watcher_connection = None
+
+# Las conexiones del pool se cierran únicamente al terminar el proceso
+atexit.register(lambda: engine.dispose())
+atexit.register(_close_watcher_connection)
+
+# Copia en memoria de la base de datos para lecturas; se crea únicamente si se solicita
+_replica_engine: Engine | None = None
+_replica_lock = Lock()
+
+@contextmanager
+def using_database(db_file_path: str) -> Iterator[None]:
+
+    # La base de datos en uso no se cambia mientras alguna conexión esté en uso
+    if engine.pool.checkedout() or _replica_lock.locked():
+        raise RuntimeError('No se puede cambiar la base de datos en uso mientras una conexión está en uso.')
+
+    # Se conservan la base de datos en uso y si ésta tenía copia en memoria
+    previous_db_file_path = _db_file_path_str
+    had_replica = _replica_engine is not None
+
+    # Se usa el archivo provisto
+    _use_database(db_file_path)
+
+    try:
+        yield
+    finally:
+        # Se restaura la base de datos anterior junto con su copia en memoria
+        _use_database(previous_db_file_path)
+        if had_replica:
+            enable_memory_replica()
+
+def _use_database(db_file_path: str) -> None:
+
+    global _db_file_path_str, engine, _replica_engine, _database_generation
+
+    # Se liberan las conexiones de la base de datos anterior y su copia en memoria
+    engine.dispose()
+    _close_watcher_connection()
+    with _replica_lock:
+        if _replica_engine is not None:
+            _replica_engine.dispose()
+        _replica_engine = None
+
+    # Se crea el engine sobre el archivo provisto; la conexión de detección de cambios se
+    # abre hasta su primer uso
+    _db_file_path_str = db_file_path
+    engine = _create_engine(db_file_path)
+    with _watcher_lock:
+        _database_generation += 1
+
+def database_path() -> Path:
+
+    return Path(_db_file_path_str)
+
+@contextmanager
+def begin() -> Iterator[Connection]:
+
+    # Se toma una conexión del pool y se abre una transacción
+    with engine.connect() as conn, conn.begin():
+        yield conn
+
+def enable_memory_replica() -> None:
+
+    global _replica_engine
+
+    # Creación de la conexión a la base de datos en memoria
+    replica_connection = sqlite3.connect(
+        ':memory:',
+        check_same_thread= False,
+        isolation_level= None,
+    )
+
+    # Se copia la base de datos completa con la API de respaldo de SQLite
+    with engine.connect() as conn:
+        conn.connection.driver_connection.backup(replica_connection)
+
+    # Se reemplaza la copia anterior, si es que existe, esperando a que termine su uso
+    with _replica_lock:
+        previous_engine = _replica_engine
+        _replica_engine = _create_replica_engine(replica_connection)
+
+    # Se liberan la conexión y el engine de la copia anterior
+    if previous_engine is not None:
+        previous_engine.dispose()
+
+def memory_replica_enabled() -> bool:
+
+    return _replica_engine is not None
+
+@contextmanager
+def begin_read() -> Iterator[Connection]:
+
+    # Si no existe copia en memoria se lee desde el archivo
+    if _replica_engine is None:
+        with begin() as conn:
+            yield conn
+        return
+
+    # La copia en memoria es una sola conexión, por lo que su uso es exclusivo
+    with _replica_lock, _replica_engine.connect() as conn, conn.begin():
+        yield conn
+
+@contextmanager
+def begin_on_replica() -> Iterator[Connection]:
+
+    # Se abre una transacción en la copia en memoria
+    with _replica_lock, _get_replica_engine().connect() as conn, conn.begin():
+        yield conn
+
+@contextmanager
+def begin_with_archives(archives: dict[str, str], read: bool = False) -> Iterator[Connection]:
+
+    # Las lecturas usan la copia en memoria si es que existe
+    target_engine = _replica_engine if read and _replica_engine is not None else engine
+    # El uso de la copia en memoria es exclusivo
+    lock = _replica_lock if target_engine is not engine else nullcontext()
+
+    # Se toma una conexión sin abrir aún la transacción
+    with lock, target_engine.connect() as conn:
+        # SQLite no permite adjuntar bases de datos dentro de una transacción
+        dbapi_connection = conn.connection.driver_connection
+        # Se adjunta cada archivo histórico con su alias
+        for ( alias, archive_path ) in archives.items():
+            dbapi_connection.execute(f'ATTACH DATABASE ? AS {alias}', (archive_path,))
+
+        try:
+            # Se abre la transacción con los archivos históricos adjuntos
+            with conn.begin():
+                yield conn
+        finally:
+            # Los archivos se separan antes de devolver la conexión al pool
+            for alias in archives:
+                dbapi_connection.execute(f'DETACH DATABASE {alias}')
+
+def _get_replica_engine() -> Engine:
+
+    # Validación de que la copia en memoria fue creada
+    assert _replica_engine is not None, 'La copia en memoria de la base de datos no fue creada.'
+
+    return _replica_engine
+
+def vacuum() -> None:
+
+    # VACUUM no puede ejecutarse dentro de una transacción
+    with engine.connect() as conn:
+        conn.connection.driver_connection.execute('VACUUM')
+
+def data_version() -> int:
+
+    global _watcher_connection
+
+    with _watcher_lock:
+        # La conexión dedicada se abre en la primera consulta de la versión
+        if _watcher_connection is None:
+            _watcher_connection = _create_watcher_connection(_db_file_path_str)
+        # La conexión dedicada no escribe, por lo que su versión cambia con cada cambio confirmado
+        [ ( version, ) ] = _watcher_connection.execute('PRAGMA data_version').fetchall()
+
+    # La versión se distingue entre archivos de base de datos usados en la misma sesión
+    return ( _database_generation << 32 ) + version
 
 def save_on_database(data: pd.DataFrame, table_name: str) -> None:
 
     # Se abre la conexión a la base de datos
-    with engine.connect() as conn, conn.begin():
+    with begin() as conn:
         # Se guardan los datos del DataFrame en la tabla
         data.to_sql(
             table_name,
@@ -27,52 +298,62 @@ def save_on_database(data: pd.DataFrame, table_name: str) -> None:
             if_exists= 'replace',
         )
 
-    # Se cierra la conexión
-    engine.dispose()
+@lru_cache(maxsize= DATABASE.STATEMENT_CACHE_SIZE)
+def compile_statement(query: str, expanding: tuple[str, ...] = ()) -> TextClause:
+
+    # Compilación del query declarando los parámetros que reciben listas de valores
+    statement = (
+        text(query)
+        .bindparams(
+            *( bindparam(name, expanding= True) for name in expanding )
+        )
+    )
+
+    return statement
 
 def load_from_database(table_name: str, dtype: dict[str, AstypeArg] = {}) -> pd.DataFrame:
 
+    # Obtención de la sentencia compilada para leer la tabla
+    statement = compile_statement(
+        QUERY.GET_TABLE
+        .format(**{COMMON_ARGS.TABLE_NAME: table_name})
+    )
+
     # Se abre la conexión a la base de datos
-    with engine.connect() as conn, conn.begin():
+    with begin() as conn:
         # Se carga la tabla en un DataFrame
-        data = pd.read_sql_query(f'SELECT * FROM {table_name}', conn, dtype= dtype)
-
-    # Se cierra la conexión
-    engine.dispose()
+        data = pd.read_sql_query(statement, conn, dtype= dtype)
 
     return data
 
-def execute_query(query: str, /, commit: bool = False) -> Any:
+def execute_query(
+    query: str | TextClause,
+    params: dict[str, Any] | list[dict[str, Any]] | None = None,
+    /,
+    commit: bool = False,
+) -> Any:
 
-    # Se compila el código provisto
-    compiled_query = text(query)
+    # Se obtiene la sentencia compilada del código provisto
+    statement = compile_statement(query) if isinstance(query, str) else query
 
     # Se abre la conexión a la base de datos
-    with engine.connect() as conn, conn.begin():
+    with begin() as conn:
+
+        # Ejecución en la base de datos; una lista de parámetros se ejecuta por lotes
+        result = conn.execute(statement, params)
 
-        # Ejecución en la base de datos
-        result = conn.execute(compiled_query)
+        # Se leen las filas antes de devolver la conexión al pool
+        rows = result.fetchall() if result.returns_rows else None
 
         # Si se especificó commit, se realiza éste
         if commit:
             conn.commit()
 
-    return result
+    return rows
 
-def get_value(table_name: str, column: str, condition: str) -> Any:
-
-    # Construcción del query
-    query = (
-        f"""
-        SELECT
-            {column}
-        FROM {table_name}
-        WHERE {condition}
-        ;
-        """
-    )
+def get_value(query: str | TextClause, params: dict[str, Any] | None = None) -> Any:
 
-    # Obtención del valor
-    [ ( value, ) ] = execute_query(query)
+    # Obtención del valor con los parámetros ligados a la sentencia
+    [ ( value, ) ] = execute_query(query, params)
 
     return value
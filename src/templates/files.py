@@ -21,6 +21,58 @@ class EXCEL_FILE:
         `Literal` Nombre del archivo.
         """
 
+class PARQUET_FILE:
+    """
+    `CONST` Nombres de archivos de caché en formato Parquet.
+    """
+    class RECORDS_MONTH:
+        """
+        `CONST` Archivo de caché de registros de asistencia de un mes cerrado.
+        """
+        NAME = f'cache_{{{COMMON_ARGS.DATABASE_NAME}}}/registros_{{{COMMON_ARGS.YEAR}}}_{{{COMMON_ARGS.MONTH}:02d}}.parquet'
+        """
+        `Literal` Nombre del archivo.
+        """
+        PATTERN = f'cache_{{{COMMON_ARGS.DATABASE_NAME}}}/registros_*.parquet'
+        """
+        `Literal` Patrón de búsqueda de los archivos de todos los meses.
+        """
+    class EMPLOYEES:
+        """
+        `CONST` Archivo de copia local de empleados obtenidos desde Odoo, con los
+        campos *many2one* separados en ID y nombre.
+        """
+        NAME = f'cache_{{{COMMON_ARGS.DATABASE_NAME}}}/empleados.parquet'
+        """
+        `Literal` Nombre del archivo.
+        """
+    class CORRECTIONS:
+        """
+        `CONST` Archivo de caché de un libro de correcciones ya leído, identificado
+        por el nombre, la fecha de modificación y el tamaño del libro.
+        """
+        NAME = f'correcciones/{{{COMMON_ARGS.FILE_NAME}}}.{{{COMMON_ARGS.KEY}}}.parquet'
+        """
+        `Literal` Nombre del archivo dentro de la carpeta de caché local del equipo.
+        """
+
+class SQLITE_FILE:
+    """
+    `CONST` Nombres de archivos de bases de datos de SQLite.
+    """
+    class ARCHIVE:
+        """
+        `CONST` Archivo histórico de registros de asistencia de un año cerrado.
+        """
+        NAME = f'{{{COMMON_ARGS.DATABASE_NAME}}}_archivo_{{{COMMON_ARGS.YEAR}}}.db'
+        """
+        `Literal` Nombre del archivo.
+        """
+        SCHEMA = f'archive_{{{COMMON_ARGS.YEAR}}}'
+        """
+        `Literal` Alias del archivo al adjuntarse a una conexión.
+        """
+
 class SPREADSHEET:
     """
     `CONST` Nombres de archivos de Hojas de Cálculo de Google y sus hojas.
@@ -7,6 +7,14 @@ class MESSAGE:
     LATE_OPEN_FOUND = 'Se encontraron días con apertura tardía.'
     NO_VALIDATIONS_TO_SHOW = 'No hay validaciones para mostrar.'
     CORRECTIONS_FILE_NOT_FOUND = f'No se encontraron corrección del año y mes {{{COMMON_ARGS.YEAR}}}/{{{COMMON_ARGS.MONTH}}}.'
+    CORRECTIONS_FILES_NOT_FOUND = f'No se encontró ningún libro de correcciones entre {{{COMMON_ARGS.START_DATE}}} y {{{COMMON_ARGS.END_DATE}}}.'
     RECORDS_TO_FIX_WERE_FOUND = 'Se encontraron registros para corregir.'
     HINT_VALIDATIONS = f'Accede a la información a través del atributo [{{{COMMON_ARGS.VALIDATIONS_ATTRIBUTE}}}] o al Excel generado.'
     ALL_OK = 'Todo está correcto.'
+    UPDATE_FAILED = f'La actualización de registros falló; se reintentará en {{{COMMON_ARGS.SECONDS}}} segundos: {{{COMMON_ARGS.ERROR}}}'
+    NO_DEVICE_RESPONDED = f'Ningún dispositivo respondió; se reintentará en {{{COMMON_ARGS.SECONDS}}} segundos.'
+    DEVICE_TIMEOUT = f'El dispositivo {{{COMMON_ARGS.DEVICE_NAME}}} no respondió en {{{COMMON_ARGS.SECONDS}}} segundos; se omite en esta actualización.'
+    DEVICE_FAILED = f'No se pudieron obtener los registros del dispositivo {{{COMMON_ARGS.DEVICE_NAME}}}; se omite en esta actualización: {{{COMMON_ARGS.ERROR}}}'
+    DEVICE_WITHOUT_LAST_UPDATE_DATE = f'El dispositivo {{{COMMON_ARGS.DEVICE_NAME}}} no tiene fecha de actualización registrada o está inactivo; se omite en esta actualización.'
+    NETWORK_TIMEOUT = f'La operación de red no respondió en {{{COMMON_ARGS.SECONDS}}} segundos.'
+    EMPLOYEES_SYNC_FAILED = f'No se pudieron actualizar los empleados desde Odoo; se usa la copia local: {{{COMMON_ARGS.ERROR}}}'
@@ -0,0 +1,157 @@
+from ..constants import (
+    COLUMN,
+    COMMON_ARGS,
+)
+from ..mapping import (
+    ASSISTANCE_RECORDS_COLUMNS,
+    DATABASE_INDEXES,
+)
+from ..domain_data import DEVICE_SERIAL_NUMBER
+from ..settings import (
+    DATABASE,
+    SCHEDULER,
+)
+from .queries import QUERY
+
+# Sentencias de creación de los índices esperados
+_CREATE_INDEXES = [
+    QUERY.CREATE_INDEX.format(
+        **{
+            COMMON_ARGS.INDEX_NAME: index_name,
+            COMMON_ARGS.TABLE_NAME: table_name,
+            COMMON_ARGS.COLUMNS: ', '.join(columns),
+        }
+    )
+    for ( index_name, ( table_name, columns ) )
+    in DATABASE_INDEXES.items()
+]
+
+# Columnas de la tabla de registros de asistencia
+_RECORDS_COLUMNS = ', '.join(ASSISTANCE_RECORDS_COLUMNS)
+
+# Dispositivos registrados al crear la tabla de dispositivos
+_INITIAL_DEVICES = {
+    'csl': DEVICE_SERIAL_NUMBER.CSL,
+    'sjc': DEVICE_SERIAL_NUMBER.SJC,
+}
+
+def _record_id_sql(time_code: str) -> str:
+
+    # La ID se compone del dispositivo, el usuario y el código de fecha y hora AAAAMMDDHHMMSS
+    return f"{COLUMN.DEVICE} || '_' || CAST({COLUMN.USER_ID} AS INTEGER) || '_' || {time_code}"
+
+# Columnas de la tabla de registros de asistencia distintas a la ID
+_RECORDS_VALUE_COLUMNS = ', '.join( column for column in ASSISTANCE_RECORDS_COLUMNS if column != COLUMN.ID )
+
+# Nombre temporal de la tabla de registros durante su reconstrucción
+_RECORDS_NEW_TABLE = f'{DATABASE.TABLE.ASSISTANCE_RECORDS}_new'
+
+class MIGRATION:
+    """
+    `CONST` Migraciones del esquema de la base de datos.
+
+    Cada elemento de `STEPS` es la lista de sentencias que llevan el esquema a la
+    versión indicada por su posición (iniciando en 1). La versión aplicada se
+    guarda en `PRAGMA user_version`.
+    """
+
+    STEPS: list[list[str]] = [
+        # Versión 1: Índices para búsquedas por rango de fechas y por dispositivo
+        _CREATE_INDEXES,
+        # Versión 2: La ID de registro, que incluye al usuario, se vuelve llave primaria y
+        # se descartan duplicados del mismo usuario, dispositivo y segundo
+        [
+            f"""
+            CREATE TABLE {_RECORDS_NEW_TABLE} (
+                {COLUMN.ID} TEXT PRIMARY KEY,
+                {COLUMN.USER_ID} BIGINT,
+                {COLUMN.NAME} TEXT,
+                {COLUMN.REGISTRY_TIME} TIMESTAMP,
+                {COLUMN.REGISTRY_TYPE} TEXT,
+                {COLUMN.DEVICE} TEXT
+            );
+            """,
+            f"""
+            INSERT OR IGNORE INTO {_RECORDS_NEW_TABLE} ({_RECORDS_COLUMNS})
+                SELECT
+                    {_record_id_sql(f"strftime('%Y%m%d%H%M%S', {COLUMN.REGISTRY_TIME})")},
+                    {_RECORDS_VALUE_COLUMNS}
+                FROM {DATABASE.TABLE.ASSISTANCE_RECORDS}
+                ORDER BY {COLUMN.REGISTRY_TIME}
+            ;
+            """,
+            f'DROP TABLE {DATABASE.TABLE.ASSISTANCE_RECORDS};',
+            f'ALTER TABLE {_RECORDS_NEW_TABLE} RENAME TO {DATABASE.TABLE.ASSISTANCE_RECORDS};',
+            *_CREATE_INDEXES,
+        ],
+        # Versión 3: La fecha y hora de registro se almacena como entero desde la época Unix
+        [
+            f"""
+            CREATE TABLE {_RECORDS_NEW_TABLE} (
+                {COLUMN.ID} TEXT PRIMARY KEY,
+                {COLUMN.USER_ID} BIGINT,
+                {COLUMN.NAME} TEXT,
+                {COLUMN.REGISTRY_TIME} INTEGER,
+                {COLUMN.REGISTRY_TYPE} TEXT,
+                {COLUMN.DEVICE} TEXT
+            );
+            """,
+            f"""
+            INSERT INTO {_RECORDS_NEW_TABLE} ({_RECORDS_COLUMNS})
+                SELECT
+                    {COLUMN.ID},
+                    {COLUMN.USER_ID},
+                    {COLUMN.NAME},
+                    CAST(strftime('%s', {COLUMN.REGISTRY_TIME}) AS INTEGER),
+                    {COLUMN.REGISTRY_TYPE},
+                    {COLUMN.DEVICE}
+                FROM {DATABASE.TABLE.ASSISTANCE_RECORDS}
+                ORDER BY {COLUMN.REGISTRY_TIME}
+            ;
+            """,
+            f'DROP TABLE {DATABASE.TABLE.ASSISTANCE_RECORDS};',
+            f'ALTER TABLE {_RECORDS_NEW_TABLE} RENAME TO {DATABASE.TABLE.ASSISTANCE_RECORDS};',
+            *_CREATE_INDEXES,
+        ],
+        # Versión 4: Los dispositivos y sus parámetros de consulta se registran en la base de datos
+        [
+            QUERY.CREATE_DEVICES_TABLE
+            .format(**{COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.DEVICES}),
+            *(
+                QUERY.INSERT_IGNORING_EXISTING
+                .format(
+                    **{
+                        COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.DEVICES,
+                        COMMON_ARGS.COLUMNS: (
+                            f'{COLUMN.DEVICE}, {COLUMN.SERIAL_NUMBER}, '
+                            f'{COLUMN.POLL_INTERVAL}, {COLUMN.RATE_LIMIT}'
+                        ),
+                        COMMON_ARGS.VALUES: (
+                            f"'{device_name}', '{serial_number}', "
+                            f'{SCHEDULER.DEFAULT_POLL_INTERVAL}, {SCHEDULER.DEFAULT_RATE_LIMIT}'
+                        ),
+                    }
+                )
+                for ( device_name, serial_number ) in _INITIAL_DEVICES.items()
+            ),
+        ],
+        # Versión 5: Las IDs creadas sólo con dispositivo y fecha y hora se reconstruyen
+        # incluyendo al usuario
+        [
+            QUERY.CREATE_RECORDS_TABLE
+            .format(**{COMMON_ARGS.TABLE_NAME: _RECORDS_NEW_TABLE}),
+            f"""
+            INSERT INTO {_RECORDS_NEW_TABLE} ({_RECORDS_COLUMNS})
+                SELECT
+                    {_record_id_sql(f"strftime('%Y%m%d%H%M%S', {COLUMN.REGISTRY_TIME}, 'unixepoch')")},
+                    {_RECORDS_VALUE_COLUMNS}
+                FROM {DATABASE.TABLE.ASSISTANCE_RECORDS}
+                ORDER BY {COLUMN.REGISTRY_TIME}
+            ;
+            """,
+            f'DROP TABLE {DATABASE.TABLE.ASSISTANCE_RECORDS};',
+            f'ALTER TABLE {_RECORDS_NEW_TABLE} RENAME TO {DATABASE.TABLE.ASSISTANCE_RECORDS};',
+            *_CREATE_INDEXES,
+        ],
+    ]
+    """`list[list[str]]` Sentencias por versión de esquema."""
@@ -8,3 +8,10 @@ class SCHEMA:
     """`Literal` Esquema semanal."""
     BIWEEKLY = f'Quincena {{{COMMON_ARGS.N}}}'
     """`Literal` Esquema quincenal."""
+
+class SHEET:
+    """
+    `CONST` Plantillas de nombres de hojas de Excel.
+    """
+    PART = f'{{{COMMON_ARGS.SHEET_NAME}}} ({{{COMMON_ARGS.N}}})'
+    """`Literal` Parte de una hoja dividida por exceder el máximo de filas."""
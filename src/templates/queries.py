@@ -1,29 +1,248 @@
-from ..constants import COMMON_ARGS
+from ..constants import (
+    COLUMN,
+    COMMON_ARGS,
+)
 
 class QUERY:
     """
     `CONST` Plantillas de queries para SQL
     """
 
-    GET_RECORDS_IN_DATE_RANGE = (
+    GET_TABLE = (
         f"""
         SELECT
             *
         FROM {{{COMMON_ARGS.TABLE_NAME}}}
-        WHERE (
-            DATE({{{COMMON_ARGS.REGISTRY_TIME}}}) >= '{{{COMMON_ARGS.START_DATE}}}'
-            AND DATE({{{COMMON_ARGS.REGISTRY_TIME}}}) <= '{{{COMMON_ARGS.END_DATE}}}'
-        );
+        ;
         """
     )
-    """Obtención de registros en un rango de tiempo determinado."""
+    """Obtención de todos los datos de una tabla."""
+
+    GET_FILTERED_RECORDS = (
+        f"""
+        SELECT
+            *
+        FROM {{{COMMON_ARGS.TABLE_NAME}}}
+        WHERE {{{COMMON_ARGS.CONDITIONS}}}
+        ;
+        """
+    )
+    """
+    Obtención de registros que cumplen las condiciones provistas por un filtro de
+    registros.
+    """
+
+    COUNT_ROWS = (
+        f"""
+        SELECT
+            COUNT(*)
+        FROM {{{COMMON_ARGS.TABLE_NAME}}}
+        ;
+        """
+    )
+    """Obtención de la cantidad de filas de una tabla."""
+
+    GET_LAST_UPDATE_DATES = (
+        f"""
+        SELECT
+            name,
+            date
+        FROM {{{COMMON_ARGS.TABLE_NAME}}}
+        WHERE name IN (
+            SELECT {COLUMN.DEVICE}
+            FROM {{{COMMON_ARGS.SOURCE_TABLE_NAME}}}
+            WHERE {COLUMN.ACTIVE} = 1
+        )
+        ;
+        """
+    )
+    """
+    Obtención de la última hora de actualización de los dispositivos activos de la
+    tabla de dispositivos provista.
+    """
 
     UPDATE_LAST_UPDATE_IN_RECORDS = (
         f"""
         UPDATE {{{COMMON_ARGS.TABLE_NAME}}}
-            SET 'date' = '{{{COMMON_ARGS.DATE}}}'
-            WHERE name = '{{{COMMON_ARGS.DEVICE_NAME}}}'
+            SET date = :{COMMON_ARGS.DATE}
+            WHERE name = :{COMMON_ARGS.DEVICE_NAME}
         ;
         """
     )
-    """Actualización de última hora de actualización en registros."""
+    """
+    Actualización de última hora de actualización en registros. Los valores se
+    proveen como parámetros con nombre.
+    """
+
+    INSERT_IGNORING_EXISTING = (
+        f"""
+        INSERT OR IGNORE INTO {{{COMMON_ARGS.TABLE_NAME}}} ({{{COMMON_ARGS.COLUMNS}}})
+            VALUES ({{{COMMON_ARGS.VALUES}}})
+        ;
+        """
+    )
+    """
+    Inserción de filas descartando las que ya existen según su llave primaria.
+    Los valores se proveen como parámetros con nombre.
+    """
+
+    INSERT_IGNORING_EXISTING_FROM_TABLE = (
+        f"""
+        INSERT OR IGNORE INTO {{{COMMON_ARGS.TABLE_NAME}}} ({{{COMMON_ARGS.COLUMNS}}})
+            SELECT {{{COMMON_ARGS.COLUMNS}}}
+            FROM {{{COMMON_ARGS.SOURCE_TABLE_NAME}}}
+            WHERE {{{COMMON_ARGS.CONDITIONS}}}
+        ;
+        """
+    )
+    """
+    Copia de las filas de otra tabla que cumplen las condiciones provistas,
+    descartando las que ya existen según su llave primaria.
+    """
+
+    DELETE_FILTERED = (
+        f"""
+        DELETE FROM {{{COMMON_ARGS.TABLE_NAME}}}
+        WHERE {{{COMMON_ARGS.CONDITIONS}}}
+        ;
+        """
+    )
+    """Eliminación de las filas que cumplen las condiciones provistas."""
+
+    GET_RECORDS_YEARS = (
+        f"""
+        SELECT DISTINCT
+            CAST(strftime('%Y', {COLUMN.REGISTRY_TIME}, 'unixepoch') AS INTEGER)
+        FROM {{{COMMON_ARGS.TABLE_NAME}}}
+        WHERE {COLUMN.REGISTRY_TIME} < :{COMMON_ARGS.END_DATE}
+        ;
+        """
+    )
+    """
+    Obtención de los años con registros anteriores a la fecha provista como
+    parámetro.
+    """
+
+    CREATE_RECORDS_TABLE = (
+        f"""
+        CREATE TABLE IF NOT EXISTS {{{COMMON_ARGS.TABLE_NAME}}} (
+            {COLUMN.ID} TEXT PRIMARY KEY,
+            {COLUMN.USER_ID} BIGINT,
+            {COLUMN.NAME} TEXT,
+            {COLUMN.REGISTRY_TIME} INTEGER,
+            {COLUMN.REGISTRY_TYPE} TEXT,
+            {COLUMN.DEVICE} TEXT
+        );
+        """
+    )
+    """Creación de una tabla de registros de asistencia en caso de no existir."""
+
+    CREATE_LAST_UPDATE_DATES_TABLE = (
+        f"""
+        CREATE TABLE IF NOT EXISTS {{{COMMON_ARGS.TABLE_NAME}}} (
+            name TEXT,
+            date TEXT
+        );
+        """
+    )
+    """Creación de la tabla de última hora de actualización en caso de no existir."""
+
+    CREATE_DEVICES_TABLE = (
+        f"""
+        CREATE TABLE IF NOT EXISTS {{{COMMON_ARGS.TABLE_NAME}}} (
+            {COLUMN.DEVICE} TEXT PRIMARY KEY,
+            {COLUMN.SERIAL_NUMBER} TEXT NOT NULL,
+            {COLUMN.POLL_INTERVAL} INTEGER NOT NULL,
+            {COLUMN.RATE_LIMIT} REAL NOT NULL,
+            {COLUMN.ACTIVE} INTEGER NOT NULL DEFAULT 1
+        );
+        """
+    )
+    """Creación de la tabla de dispositivos en caso de no existir."""
+
+    GET_ACTIVE_DEVICES = (
+        f"""
+        SELECT
+            {COLUMN.DEVICE},
+            {COLUMN.SERIAL_NUMBER},
+            {COLUMN.POLL_INTERVAL},
+            {COLUMN.RATE_LIMIT}
+        FROM {{{COMMON_ARGS.TABLE_NAME}}}
+        WHERE {COLUMN.ACTIVE} = 1
+        ORDER BY {COLUMN.DEVICE}
+        ;
+        """
+    )
+    """Obtención de los dispositivos activos y sus parámetros de consulta."""
+
+    INSERT_MISSING_LAST_UPDATE_DATES = (
+        f"""
+        INSERT INTO {{{COMMON_ARGS.TABLE_NAME}}} (name, date)
+            SELECT
+                {COLUMN.DEVICE},
+                :{COMMON_ARGS.DATE}
+            FROM {{{COMMON_ARGS.SOURCE_TABLE_NAME}}}
+            WHERE
+                {COLUMN.ACTIVE} = 1
+                AND {COLUMN.DEVICE} NOT IN (
+                    SELECT name FROM {{{COMMON_ARGS.TABLE_NAME}}}
+                )
+        ;
+        """
+    )
+    """
+    Registro de la última hora de actualización provista como parámetro para los
+    dispositivos activos de la tabla de origen que aún no la tienen.
+    """
+
+    SELECT_COLUMNS = (
+        f"""
+        SELECT {{{COMMON_ARGS.COLUMNS}}}
+        FROM {{{COMMON_ARGS.TABLE_NAME}}}
+        """
+    )
+    """Selección de columnas de una tabla, para componerse en otras consultas."""
+
+    CREATE_TEMP_UNION_VIEW = (
+        f"""
+        CREATE TEMP VIEW {{{COMMON_ARGS.TABLE_NAME}}} AS
+            {{{COMMON_ARGS.SELECTS}}}
+        ;
+        """
+    )
+    """
+    Creación de una vista temporal en la conexión que une los resultados de las
+    consultas provistas.
+    """
+
+    DROP_TEMP_VIEW = f'DROP VIEW IF EXISTS temp.{{{COMMON_ARGS.TABLE_NAME}}};'
+    """Eliminación de una vista temporal en caso de existir."""
+
+    CREATE_INDEX = (
+        f"""
+        CREATE INDEX IF NOT EXISTS {{{COMMON_ARGS.INDEX_NAME}}}
+            ON {{{COMMON_ARGS.TABLE_NAME}}} ({{{COMMON_ARGS.COLUMNS}}})
+        ;
+        """
+    )
+    """Creación de un índice en caso de no existir."""
+
+    GET_INDEX_NAMES = (
+        """
+        SELECT
+            name
+        FROM sqlite_master
+        WHERE type = 'index'
+        ;
+        """
+    )
+    """Obtención de los nombres de índices existentes."""
+
+    GET_SCHEMA_VERSION = 'PRAGMA user_version;'
+    """Obtención de la versión del esquema de la base de datos."""
+
+    SET_SCHEMA_VERSION = f'PRAGMA user_version = {{{COMMON_ARGS.VERSION}}};'
+    """Asignación de la versión del esquema de la base de datos."""
+
+    OPTIMIZE = 'PRAGMA optimize;'
+    """Actualización de estadísticas del planificador de consultas."""
@@ -0,0 +1,81 @@
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    String,
+    TextClause,
+    bindparam,
+    text,
+)
+from ..constants import (
+    COLUMN,
+    COMMON_ARGS,
+)
+from ..mapping import ASSISTANCE_RECORDS_COLUMNS
+from ..settings import DATABASE
+from .queries import QUERY
+
+# Tipos de los parámetros de las columnas de la tabla de registros de asistencia
+_RECORDS_PARAM_TYPES = {
+    COLUMN.ID: String,
+    COLUMN.USER_ID: BigInteger,
+    COLUMN.NAME: String,
+    COLUMN.REGISTRY_TIME: Integer,
+    COLUMN.REGISTRY_TYPE: String,
+    COLUMN.DEVICE: String,
+}
+
+class STATEMENT:
+    """
+    `CONST` Sentencias SQL con parámetros con nombre, compiladas una sola vez y
+    reutilizadas en cada ejecución para aprovechar la caché de sentencias del
+    driver.
+    """
+
+    GET_LAST_UPDATE_DATES: TextClause = text(
+        QUERY.GET_LAST_UPDATE_DATES
+        .format(
+            **{
+                COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.LAST_UPDATE_DATES,
+                COMMON_ARGS.SOURCE_TABLE_NAME: DATABASE.TABLE.DEVICES,
+            }
+        )
+    )
+    """Obtención de la última hora de actualización de los dispositivos activos."""
+
+    UPDATE_LAST_UPDATE_DATE: TextClause = (
+        text(
+            QUERY.UPDATE_LAST_UPDATE_IN_RECORDS
+            .format(**{COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.LAST_UPDATE_DATES})
+        )
+        .bindparams(
+            bindparam(COMMON_ARGS.DATE, type_= String),
+            bindparam(COMMON_ARGS.DEVICE_NAME, type_= String),
+        )
+    )
+    """
+    Actualización de la última hora de actualización de un dispositivo. Admite
+    ejecución por lotes.
+    """
+
+    INSERT_RECORDS: TextClause = (
+        text(
+            QUERY.INSERT_IGNORING_EXISTING
+            .format(
+                **{
+                    COMMON_ARGS.TABLE_NAME: DATABASE.TABLE.ASSISTANCE_RECORDS,
+                    COMMON_ARGS.COLUMNS: ', '.join(ASSISTANCE_RECORDS_COLUMNS),
+                    COMMON_ARGS.VALUES: ', '.join( f':{column}' for column in ASSISTANCE_RECORDS_COLUMNS ),
+                }
+            )
+        )
+        .bindparams(
+            *(
+                bindparam(column, type_= _RECORDS_PARAM_TYPES[column])
+                for column in ASSISTANCE_RECORDS_COLUMNS
+            )
+        )
+    )
+    """
+    Inserción de registros de asistencia descartando los que ya existen. Admite
+    ejecución por lotes.
+    """
@@ -1 +1,2 @@
+from ._device_simulator import DeviceSimulator
 from ._pipeline_hub import PipelineHub
@@ -0,0 +1 @@
+from ._simulator import DeviceSimulator
@@ -0,0 +1,164 @@
+import random
+import time
+from datetime import (
+    datetime,
+    timedelta,
+)
+from threading import Lock
+import numpy as np
+import pandas as pd
+from attendance_registry._constants import COLUMN as ATTENDANCE_COLUMN
+from ...constants import REGISTRY_TYPE
+
+# Hora base de cada tipo de registro de la jornada
+_SHIFT = {
+    REGISTRY_TYPE.CHECK_IN: timedelta(hours= 8),
+    REGISTRY_TYPE.BREAK_OUT: timedelta(hours= 13),
+    REGISTRY_TYPE.BREAK_IN: timedelta(hours= 14),
+    REGISTRY_TYPE.CHECK_OUT: timedelta(hours= 18),
+}
+
+# Variación máxima en segundos de cada registro respecto a su hora base
+_MAX_DEVIATION = 600
+
+class DeviceSimulator:
+
+    def __init__(
+        self,
+        *,
+        devices: int = 2,
+        employees: int = 50,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        duplicate_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """
+        ### Simulador de dispositivos de asistencia
+        Sustituto local de la API de dispositivos que responde a
+        `get_daily_attendance` como `attendance_registry.Assistance`. Cada
+        empleado registra inicio de jornada, comida y fin de jornada de lunes a
+        sábado en el dispositivo que le corresponde; los registros de un mismo
+        periodo son siempre los mismos sin importar en cuántas consultas se pidan.
+
+        :param devices int: Cantidad de dispositivos.
+        :param employees int: Cantidad de empleados repartidos entre los dispositivos.
+        :param latency float: Segundos promedio de respuesta de cada consulta.
+        :param failure_rate float: Probabilidad de que una consulta falle.
+        :param duplicate_rate float: Fracción de registros del día anterior al
+        periodo consultado que se vuelven a entregar.
+        :param seed int: Semilla de los valores aleatorios.
+        """
+
+        # Se guardan los valores provistos
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.duplicate_rate = duplicate_rate
+        self.seed = seed
+
+        # Nombres de los dispositivos
+        self.devices = [ f'dev{device_i:02d}' for device_i in range(1, devices + 1) ]
+        # IDs de usuario de los empleados de cada dispositivo
+        self._users = {
+            device_name: np.arange(device_i + 1, employees + 1, devices)
+            for ( device_i, device_name ) in enumerate(self.devices)
+        }
+
+        # Momentos de entrega de las respuestas con registros
+        self.deliveries: list[float] = []
+        # Generador de latencias y fallas compartido entre hilos
+        self._random = random.Random(seed)
+        self._lock = Lock()
+
+    def get_daily_attendance(
+        self,
+        date_range: tuple[datetime, datetime],
+        device: str,
+    ) -> pd.DataFrame:
+
+        # Obtención de la latencia y si la consulta falla
+        with self._lock:
+            latency = self.latency * self._random.uniform(0.5, 1.5)
+            fails = self._random.random() < self.failure_rate
+
+        # Simulación del tiempo de respuesta
+        time.sleep(latency)
+
+        # Simulación de una falla del dispositivo
+        if fails:
+            raise ConnectionError(f'El dispositivo simulado {device} no respondió.')
+
+        # Obtención de los registros del periodo consultado
+        ( start_date, end_date ) = date_range
+        records = self._get_records(device, start_date, end_date)
+
+        # Se vuelven a entregar registros del día anterior como lo hacen los dispositivos reales
+        if self.duplicate_rate:
+            previous_records = self._get_records(device, start_date - timedelta(days= 1), start_date)
+            records = pd.concat(
+                [
+                    previous_records.sample(frac= self.duplicate_rate, random_state= self.seed),
+                    records,
+                ],
+                ignore_index= True,
+            )
+
+        # Se registra el momento de entrega de la respuesta
+        if len(records):
+            with self._lock:
+                self.deliveries.append( time.perf_counter() )
+
+        return records
+
+    def _get_records(
+        self,
+        device: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> pd.DataFrame:
+
+        # Obtención de los días laborales del periodo
+        days = pd.date_range(pd.Timestamp(start_date).normalize(), end_date, freq= 'D')
+        days = days[days.weekday != 6]
+        # Obtención de los empleados del dispositivo
+        users = self._users[device]
+
+        # Combinación de cada día, empleado y tipo de registro
+        ( day_values, user_values, type_values ) = (
+            grid.ravel()
+            for grid in np.meshgrid(
+                days.values,
+                users,
+                np.arange(len(_SHIFT)),
+                indexing= 'ij',
+            )
+        )
+
+        # Variación determinista de cada registro a partir de su día, empleado y tipo
+        day_numbers = day_values.astype('datetime64[D]').astype('int64')
+        deviation = (
+            ( user_values * 7_919 + day_numbers * 104_729 + type_values * 1_299_709 + self.seed )
+            % ( 2 * _MAX_DEVIATION + 1 )
+        ) - _MAX_DEVIATION
+
+        # Cálculo de la fecha y hora de cada registro
+        shift = np.array( list( _SHIFT.values() ), dtype= 'timedelta64[s]' )
+        registry_times = day_values + shift[type_values] + deviation.astype('timedelta64[s]')
+
+        # Construcción de los registros dentro del periodo consultado
+        records = pd.DataFrame(
+            {
+                ATTENDANCE_COLUMN.USER_ID: user_values,
+                ATTENDANCE_COLUMN.NAME: [ f'Empleado {user_id}' for user_id in user_values ],
+                ATTENDANCE_COLUMN.REGISTRY_TIME: registry_times,
+                ATTENDANCE_COLUMN.REGISTRY_TYPE: np.array( list(_SHIFT) )[type_values],
+                ATTENDANCE_COLUMN.DEVICE: device,
+            }
+        )
+        in_range = records[ATTENDANCE_COLUMN.REGISTRY_TIME].between(start_date, end_date)
+
+        return (
+            records[in_range]
+            .sort_values(ATTENDANCE_COLUMN.REGISTRY_TIME)
+            .reset_index(drop= True)
+        )
@@ -2,6 +2,7 @@ from typing import (
     Any,
     Generator,
     Generic,
+    Iterable,
     Optional,
     TypeVar,
     get_type_hints,
@@ -41,6 +42,7 @@ class PipelineHub:
         creates: Optional[set[str]] = None,
         selects: Optional[set[str]] = None,
         renames: Optional[dict[str, str]] = None,
+        assigns_dtypes: bool = False,
     ) -> PipeRegistryDecorator:
 
         def decorator(pipe_fn: DataFramePipe) -> DataFramePipe:
@@ -53,6 +55,7 @@ class PipelineHub:
                 creates= creates,
                 selects= selects,
                 renames= renames,
+                assigns_dtypes= assigns_dtypes,
             )
 
             return pipe_fn
@@ -72,6 +75,8 @@ class PipelineHub:
 
         # Inicialización de lista de metadatos
         execution_metadata = PipesExecutionMetadata()
+        # Inicialización de columnas modificadas desde la última asignación de tipos de dato
+        touched_columns: set[str] | None = None
 
         # Iteración por cada pipe
         for pipe_name in pipe_flow:
@@ -86,8 +91,14 @@ class PipelineHub:
             try:
                 if test:
                     self._test_real_columns(df, pipe, execution_metadata)
-                # Ejecución del pipe y obtención del resultado
-                df = pipe_fn(df)
+                # Si el pipe asigna tipos de dato...
+                if pipe.specs.assigns_dtypes:
+                    # Ejecución del pipe únicamente sobre las columnas modificadas
+                    df = pipe_fn(df, columns= touched_columns)
+                # Si el pipe no asigna tipos de dato...
+                else:
+                    # Ejecución del pipe y obtención del resultado
+                    df = pipe_fn(df)
 
             # Si la ejecución falla...
             except Exception as e:
@@ -100,6 +111,16 @@ class PipelineHub:
             output_df_metadata = execution_metadata.get_dataframe_metadata(df)
             # Registro de los metadatos de la ejecución del pipe
             in_out_metadata = execution_metadata.get_io_metadata(pipe_name, input_df_metadata, output_df_metadata)
+
+            # Si el pipe asigna tipos de dato...
+            if pipe.specs.assigns_dtypes:
+                # Se reinician las columnas modificadas
+                touched_columns = set()
+            # Si ya se asignaron tipos de dato en el flujo...
+            elif touched_columns is not None:
+                # Registro de las columnas creadas o modificadas por el pipe
+                touched_columns |= in_out_metadata.touched_columns
+
             # Si el modo debug está activado...
             if debug:
                 # Impresión de los metadatos de entrada/salida
@@ -107,6 +128,39 @@ class PipelineHub:
 
         return df
 
+    def run_pipe_flow_in_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        pipe_flow: list[str],
+        concat_flow: list[str] = [],
+        debug: bool = False,
+        test: bool = False
+    ) -> pd.DataFrame:
+
+        # Inicialización de resultados y posición global de las filas
+        results: list[pd.DataFrame] = []
+        offset = 0
+
+        # Iteración por cada bloque de datos
+        for chunk in chunks:
+            # Ejecución del flujo sobre el bloque
+            result = self.run_pipe_flow(chunk, pipe_flow, debug, test)
+            # Se desplaza el índice para conservar las posiciones globales de las filas
+            results.append( result.set_axis(result.index + offset) )
+            # Actualización de la posición global
+            offset += len(chunk)
+
+        # Se descartan los resultados vacíos conservando al menos uno para preservar las columnas
+        results = [ result for result in results if len(result) ] or results[:1]
+        # Concatenación de los resultados de todos los bloques
+        df = pd.concat(results)
+
+        # Ejecución del flujo sobre el resultado concatenado
+        if concat_flow:
+            df = self.run_pipe_flow(df, concat_flow, debug, test)
+
+        return df
+
     def _test_real_columns(
         self,
         df: pd.DataFrame,
@@ -149,6 +203,7 @@ class PipelineHub:
         creates: Optional[set[str]] = None,
         selects: Optional[set[str]] = None,
         renames: Optional[dict[str, str]] = None,
+        assigns_dtypes: bool = False,
     ) -> None:
 
         # Inicialización de conjuntos y diccionarios vacíos de ser necesario
@@ -158,7 +213,7 @@ class PipelineHub:
         renames = renames or {}
 
         # Construcción de objeto de metadatos de función pipe
-        pipeline_metadata = PipeMetadata(pipe_fn, name, requires, creates, selects, renames)
+        pipeline_metadata = PipeMetadata(pipe_fn, name, requires, creates, selects, renames, assigns_dtypes)
         # Registro de función en la clase
         self._pipelines[name] = pipeline_metadata
 
@@ -1,8 +1,9 @@
 from typing import Literal
 
-Devices = Literal['csl', 'sjc']
+Devices = str
 """
-Dispositivos en ubicaciones.
+Dispositivos en ubicaciones, registrados en la tabla de dispositivos de la base
+de datos.
 """
 
 NumericWeekday = Literal[0, 1, 2, 3, 4, 5, 6]
@@ -31,6 +32,18 @@ ViewOptions = Literal['report', 'verifications']
 Opciones de validación.
 """
 
+SyncMode = Literal['now', 'skip', 'background']
+"""
+Modo de actualización de registros desde los dispositivos al crear la instancia
+principal.
+
+Valores disponibles:
+- `'now'`: Se actualiza antes de cargar los datos.
+- `'skip'`: No se actualiza.
+- `'background'`: Se actualiza en segundo plano mientras se cargan los datos
+existentes.
+"""
+
 PipeValidationStage = Literal['require', 'rename', 'select']
 """
 Etapa de validación de pipe.
@@ -4,5 +4,6 @@ from ._base.literals import (
     PayFrequency,
     PermissionTypeOption,
     PipeValidationStage,
+    SyncMode,
     ViewOptions,
 )
@@ -1,7 +1,20 @@
+import threading
+from datetime import date
 from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    TypeVar,
+)
+import pandas as pd
+from .constants import COMMON_ARGS
+from .templates.messages import MESSAGE
+
+_T = TypeVar('_T')
 
 DROPBOX_PATH = 'Dropbox/La Casa Del Carpintero/Departamento de Programación/data_projects_git'
 PROJECT_NAME = 'checador'
+LOCAL_CACHE_PATH = '.cache'
 
 def path_from_dropbox(file_path: str) -> str:
 
@@ -16,3 +29,102 @@ def path_from_dropbox(file_path: str) -> str:
     )
 
     return file_path
+
+def path_from_local_cache(file_path: str) -> str:
+
+    # La carpeta de caché es propia del equipo, por lo que no se sincroniza entre equipos
+    file_path = (
+        Path
+        .home()
+        .joinpath(
+            f'{LOCAL_CACHE_PATH}/{PROJECT_NAME}'
+        )
+        .joinpath(file_path)
+        .__str__()
+    )
+
+    return file_path
+
+def call_with_timeout(function: Callable[..., _T], seconds: float, *args: Any, **kwargs: Any) -> _T:
+
+    # Inicialización del resultado o error de la llamada
+    outcome: dict[str, Any] = {}
+
+    def call() -> None:
+        try:
+            outcome['result'] = function(*args, **kwargs)
+        except BaseException as e:
+            outcome['error'] = e
+
+    # La llamada se ejecuta en un hilo de fondo para que, si deja de responder, no impida
+    # terminar el proceso
+    thread = threading.Thread(target= call, daemon= True)
+    thread.start()
+    thread.join(seconds)
+
+    # Si la llamada no terminó a tiempo se abandona y se indica el error
+    if thread.is_alive():
+        raise TimeoutError(
+            MESSAGE.NETWORK_TIMEOUT
+            .format(**{COMMON_ARGS.SECONDS: seconds})
+        )
+
+    # Se propaga el error de la llamada si es que ocurrió
+    if 'error' in outcome:
+        raise outcome['error']
+
+    return outcome['result']
+
+def to_epoch(value: pd.Series | date, unit: str) -> pd.Series | int:
+
+    # Se cuentan las unidades de tiempo transcurridas desde la época Unix
+    epoch_value = (
+        ( pd.to_datetime(value) - pd.Timestamp(0) )
+        // pd.Timedelta(1, unit= unit)
+    )
+
+    return epoch_value
+
+def build_record_ids(devices: pd.Series, user_ids: pd.Series, registry_times: pd.Series) -> pd.Series:
+
+    # Obtención de los componentes de la fecha y hora de registro
+    datetime_values = pd.to_datetime(registry_times).dt
+    # Composición del código numérico AAAAMMDDHHMMSS sin formatear texto por cada fila
+    time_code = datetime_values.year.astype('int64')
+    for component in (
+        datetime_values.month,
+        datetime_values.day,
+        datetime_values.hour,
+        datetime_values.minute,
+        datetime_values.second,
+    ):
+        time_code = time_code * 100 + component
+
+    # La ID se compone del dispositivo, el usuario y el código de fecha y hora, por lo que
+    # los registros de distintos usuarios en el mismo segundo no se confunden
+    record_ids = (
+        devices.astype(str)
+        + '_'
+        + pd.to_numeric(user_ids).astype('int64').astype(str)
+        + '_'
+        + time_code.astype(str)
+    )
+
+    return record_ids
+
+def split_many2one(values: pd.Series) -> tuple[pd.Series, pd.Series]:
+
+    # Los campos many2one vacíos llegan desde Odoo como False
+    is_set = values.ne(False) & values.notna()
+    # Separación de ID y nombre de todos los valores asignados en una sola construcción
+    parts = pd.DataFrame(
+        values[is_set].tolist(),
+        index= values.index[is_set],
+        columns= ['id', 'name'],
+    )
+
+    # Los valores vacíos quedan como nulos en ambas columnas
+    ids = parts['id'].reindex(values.index).astype('Int64')
+    names = parts['name'].reindex(values.index).astype('string')
+
+    return ( ids, names )